@@ -1,4 +1,5 @@
 import csv
+import heapq
 import io
 import json
 import os
@@ -8,21 +9,27 @@ import streamlit as st
 
 from src.cv.parser import parse_cv
 from src.cv.entities import build_profile, _load_skills_dict
-from src.matching.dedup import deduplicate
+from src.matching.enrichment import ENRICHERS, fetch_enriched
+from src.matching.text_model import load_text_model
 from src.matching.explainer import explain_match
-from src.matching.filters import apply_hard_filters
-from src.matching.scorer import score_jobs
+from src.matching.pipeline import MatchPipeline, run_pipeline
+from src.matching.rerank import ScoreMatrix
+from src.matching.scorer import WEIGHTS
+from src.models.job import Job
 from src.models.preferences import Preferences
 from src.models.profile import Profile
-from src.sources.normalizer import fetch_all_jobs, get_all_connectors
 from src.sources.remotive import RemotiveConnector
 from src.sources.arbeitnow import ArbeitnowConnector
+from src.sources.cached import RETENTION_DAYS, ReadThroughCache
 from src.sources.reed import ReedConnector
 from src.sources.adzuna import AdzunaConnector
 from src.sources.lever import LeverConnector
 from src.sources.greenhouse import GreenhouseConnector
+from src.storage.cache import JobCache
+from src.storage.dedup_index import NEW, DedupIndex
 from src.storage.privacy import PrivacyManager
 from src.utils.http_client import register_personal_fragments
+from src.utils.http_retry import get_retry_counts
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -98,6 +105,11 @@ button[data-baseweb="tab"] {
 .job-card h3 { margin: 0 0 0.3rem 0; font-size: 1.1rem; }
 .job-card .company { color: var(--purple); font-weight: 700; }
 .job-card .meta { color: var(--slate); font-size: 0.85rem; }
+.new-badge {
+    display: inline-block; background: var(--green); color: white;
+    font-size: 0.72rem; font-weight: 700; border-radius: 8px;
+    padding: 1px 8px; margin-left: 6px; vertical-align: middle;
+}
 .score-badge {
     display: inline-block; background: var(--gold); color: var(--deep-blue);
     font-weight: 700; border-radius: 50%;
@@ -180,6 +192,14 @@ _DEFAULTS = {
     "preferences": Preferences(),
     "jobs": [],
     "scored_results": [],
+    # Profile and preferences the current results were scored with.
+    "scored_with": None,
+    "explanations": {},
+    # (inputs, CSV text) of the last results export.
+    "results_csv": None,
+    # Sub-scores of every unique job from the last search, for re-ranking.
+    "score_matrix": None,
+    "job_status": {},
     "persist_mode": False,
     "all_cv_skills": [],
 }
@@ -189,6 +209,61 @@ for k, v in _DEFAULTS.items():
 
 privacy_mgr = PrivacyManager()
 
+JOB_CACHE_STALE_SECONDS = 24 * 3600
+# MinHash similarity at which listings from different sources are merged.
+NEAR_DUPLICATE_THRESHOLD = 0.8
+RESULTS_PAGE_SIZE = 50
+# Provisional matches shown while a search is still streaming in.
+PREVIEW_SIZE = 5
+# Postings not seen in any search for this long are dropped from the dedup index.
+DEDUP_INDEX_MAX_AGE = RETENTION_DAYS * 24 * 3600
+
+
+@st.cache_resource
+def _job_cache() -> ReadThroughCache:
+    return ReadThroughCache(JobCache(stale_ttl=JOB_CACHE_STALE_SECONDS))
+
+
+@st.cache_resource
+def _dedup_index() -> DedupIndex:
+    return DedupIndex()
+
+
+def _explanation(job: Job, sub_scores: dict[str, float]) -> dict[str, list[str]]:
+    """Explain a result on first render, memoized per job id for the current results."""
+    explanations = st.session_state.explanations
+    if job.id not in explanations:
+        if sub_scores and st.session_state.scored_with:
+            profile, prefs = st.session_state.scored_with
+            explanations[job.id] = explain_match(job, profile, prefs, sub_scores)
+        else:
+            explanations[job.id] = {"reasons": ["Upload CV for personalised scoring"], "gaps": []}
+    return explanations[job.id]
+
+
+def _results_csv(rank, key) -> str:
+    """CSV of every result, rebuilt only when ``key`` changes.
+
+    Reasons are included for results already explained on screen; explaining
+    every row would make the export as slow as rendering all of them.
+    """
+    cached = st.session_state.results_csv
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    explanations = st.session_state.explanations
+    csv_buffer = io.StringIO()
+    writer = csv.writer(csv_buffer)
+    writer.writerow(["Score", "Title", "Company", "Location", "Remote", "Source", "URL", "Reasons"])
+    for job, score, _ in rank():
+        writer.writerow([
+            f"{score:.2f}", job.title, job.company, job.location,
+            job.remote_type, job.source, job.url,
+            "; ".join(explanations.get(job.id, {}).get("reasons", [])),
+        ])
+    st.session_state.results_csv = (key, csv_buffer.getvalue())
+    return st.session_state.results_csv[1]
+
+
 if st.session_state.profile.is_empty and privacy_mgr.is_persisted():
     loaded = privacy_mgr.load_profile()
     if loaded:
@@ -644,7 +719,7 @@ with tab_search:
             elif s == "Arbeitnow":
                 connectors.append(ArbeitnowConnector())
             elif s == "Greenhouse":
-                connectors.append(GreenhouseConnector(slugs=gh_slugs))
+                connectors.append(GreenhouseConnector(slugs=gh_slugs, prefs=prefs_obj))
             elif s == "Lever":
                 connectors.append(LeverConnector(slugs=lv_slugs))
             elif s == "Reed":
@@ -666,31 +741,79 @@ with tab_search:
 
         with st.status("Searching for jobs...", expanded=True) as status:
             st.write("Fetching from public job APIs...")
+            profile_obj = st.session_state.profile
+            job_cache = _job_cache()
+            # Drop expired listings (and their vectors) before the text model reads the corpus.
+            job_cache.cache.clear_expired()
+            text_model = load_text_model(job_cache.cache)
+            # Pages are scored as they arrive; the ScoreMatrix below is seeded with those rows.
+            pipeline = MatchPipeline(
+                profile_obj, prefs_obj, near_duplicate_threshold=NEAR_DUPLICATE_THRESHOLD,
+                text_model=text_model, vector_cache=job_cache.cache, score=not profile_obj.is_empty,
+            )
+            preview = st.empty()
+            stats_before = job_cache.stats.as_dict()
+            retries_before = sum(get_retry_counts().values())
             try:
-                jobs = fetch_all_jobs(connectors)
-                st.write(f"Found {len(jobs)} raw listings. Deduplicating...")
-                jobs = deduplicate(jobs)
-                st.session_state.jobs = jobs
-                st.write(f"{len(jobs)} unique jobs after dedup.")
+                for update in run_pipeline(
+                    pipeline, job_cache.wrap_all(connectors), connector_timeout=30, total_timeout=120,
+                ):
+                    if update.error:
+                        st.write(f"⚠️ {update.source or 'Search'}: {update.error}")
+                    elif update.jobs:
+                        status.update(
+                            label=f"Searching... {pipeline.fetched} listings so far, "
+                                  f"{pipeline.matched} matches",
+                        )
+                        if update.scored:
+                            preview.markdown("**Best so far:**\n" + "\n".join(
+                                f"- {job.title} at {job.company} ({total * 100:.0f}%)"
+                                for job, total, _ in pipeline.results(top_k=PREVIEW_SIZE)
+                            ))
             except Exception as e:
                 st.error(f"Error fetching jobs: {e}")
-                jobs = []
-
-            if jobs and not st.session_state.profile.is_empty:
-                st.write("Filtering and ranking matches against your CV...")
-                profile_obj = st.session_state.profile
-                filtered = apply_hard_filters(jobs, prefs_obj)
-                st.write(f"{len(filtered)} jobs passed your filters (from {len(jobs)} total).")
-                scored = score_jobs(filtered, profile_obj, prefs_obj)
-                results = []
-                for job, score, sub_scores in scored:
-                    explanation = explain_match(job, profile_obj, prefs_obj, sub_scores)
-                    results.append((job, score, sub_scores, explanation))
-                st.session_state.scored_results = results
-                status.update(label=f"Done! {len(results)} matches found.", state="complete")
+            preview.empty()
+            jobs = pipeline.jobs()
+            st.session_state.jobs = jobs
+            dedup_index = _dedup_index()
+            merged = dedup_index.merge(jobs)
+            dedup_index.prune(DEDUP_INDEX_MAX_AGE)
+            st.session_state.job_status = merged.status
+            stats = {k: v - stats_before[k] for k, v in job_cache.stats.as_dict().items()}
+            st.write(
+                f"Cache: {stats['hits']} fresh, {stats['stale_hits']} stale (refreshing in background), "
+                f"{stats['misses']} fetched live."
+            )
+            retried = sum(get_retry_counts().values()) - retries_before
+            if retried:
+                st.write(f"Retried {retried} rate-limited or failed requests.")
+            st.write(
+                f"Found {pipeline.fetched} raw listings, {len(jobs)} unique after dedup "
+                f"({len(merged.new)} new since last run)."
+            )
+
+            if jobs and not profile_obj.is_empty:
+                st.write("Ranking matches against your CV...")
+                matrix = ScoreMatrix(jobs, text_model=text_model, vector_cache=job_cache.cache)
+                matrix.seed(pipeline.results(), profile_obj, prefs_obj)
+                matrix.update(profile_obj, prefs_obj)
+                top = matrix.ranked(top_k=20)
+                if any(row[0].source in ENRICHERS for row in top):
+                    st.write("Fetching full descriptions for the top matches...")
+                    matrix.replace(fetch_enriched(top, top_k=20))
+                matched = len(matrix.passing())
+                st.write(f"{matched} jobs passed your filters (from {len(jobs)} total).")
+                # The Results tab ranks from the matrix.
+                st.session_state.score_matrix = matrix
+                st.session_state.scored_results = []
+                st.session_state.scored_with = (profile_obj, prefs_obj)
+                st.session_state.explanations = {}
+                status.update(label=f"Done! {matched} matches found.", state="complete")
             elif jobs:
-                results = [(j, 0.0, {}, {"reasons": ["Upload CV for personalised scoring"], "gaps": []}) for j in jobs]
+                results = [(j, 0.0, {}) for j in jobs]
+                st.session_state.score_matrix = None
                 st.session_state.scored_results = results
+                st.session_state.explanations = {}
                 status.update(label=f"Found {len(results)} jobs (upload CV for ranking).", state="complete")
             else:
                 status.update(label="No jobs found. Try different sources or broaden preferences.", state="error")
@@ -698,59 +821,91 @@ with tab_search:
 # ===== TAB 4: Results =====
 with tab_results:
     results = st.session_state.scored_results
+    matrix = st.session_state.score_matrix
+
+    if matrix is not None and not st.session_state.profile.is_empty:
+        # Re-rank with the current CV and preferences; only affected columns are recomputed.
+        if matrix.update(st.session_state.profile, st.session_state.preferences):
+            st.session_state.scored_with = (st.session_state.profile, st.session_state.preferences)
+            st.session_state.explanations = {}
+        with st.expander("Ranking weights"):
+            weight_cols = st.columns(len(WEIGHTS))
+            weights = {
+                name: col.slider(name.replace("_", " ").capitalize(), 0.0, 1.0, default, 0.05,
+                                 key=f"weight_{name}")
+                for col, (name, default) in zip(weight_cols, WEIGHTS.items())
+            }
+        # Only the shown page is ranked unless a filter or sort needs every row.
+        passing = matrix.passing()
+        csv_key = (id(matrix), id(st.session_state.scored_with), tuple(weights.values()))
+
+        def rank(top_k: int | None = None):
+            return matrix.ranked(weights, top_k=top_k)
+
+        if not passing:
+            st.info("No jobs from the last search pass your current filters.")
+    else:
+        passing = [r[0] for r in results]
+        csv_key = (id(results),)
+
+        def rank(top_k: int | None = None):
+            return results if top_k is None else results[:top_k]
 
-    if not results:
-        st.info("No results yet. Use the **Search Jobs** tab to fetch listings.")
+    if not passing:
+        if matrix is None:
+            st.info("No results yet. Use the **Search Jobs** tab to fetch listings.")
     else:
+        job_status = st.session_state.job_status
         f1, f2, f3, f4 = st.columns([2, 2, 2, 1])
         with f1:
-            all_sources = sorted({r[0].source.split(":")[0] for r in results})
+            all_sources = sorted({job.source.split(":")[0] for job in passing})
             source_filter = st.multiselect("Source", all_sources, default=all_sources)
         with f2:
             remote_filter = st.multiselect("Work type", ["Remote", "Hybrid", "On-site"])
         with f3:
             sort_option = st.selectbox("Sort", ["Best match", "Lowest match", "Newest"])
-        with f4:
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
-            writer.writerow(["Score", "Title", "Company", "Location", "Remote",
-                             "Source", "URL", "Reasons"])
-            for job, score, _, explanation in results:
-                writer.writerow([
-                    f"{score:.2f}", job.title, job.company, job.location,
-                    job.remote_type, job.source, job.url,
-                    "; ".join(explanation.get("reasons", [])),
-                ])
-            st.download_button("CSV", csv_buffer.getvalue(), "jobs.csv", "text/csv",
-                               use_container_width=True)
-
-        filtered_results = results
-        if source_filter:
-            filtered_results = [r for r in filtered_results
-                                if r[0].source.split(":")[0] in source_filter]
-        if remote_filter:
-            rt_map = {"Remote": "remote", "Hybrid": "hybrid", "On-site": "onsite"}
-            wanted = {rt_map[r] for r in remote_filter if r in rt_map}
-            filtered_results = [r for r in filtered_results
-                                if r[0].remote_type in wanted]
-        if sort_option == "Lowest match":
-            filtered_results.sort(key=lambda x: x[1])
-        elif sort_option == "Newest":
-            from datetime import datetime, timezone
-            filtered_results.sort(
-                key=lambda x: x[0].published_at or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True,
-            )
+            only_new = st.checkbox("Only new since last run")
+
+        narrowed = set(source_filter) != set(all_sources) or remote_filter or only_new
+        if sort_option == "Best match" and not narrowed:
+            shown = rank(RESULTS_PAGE_SIZE)
+            shown_of = len(passing)
+        else:
+            filtered_results = rank()
+            if source_filter:
+                filtered_results = [r for r in filtered_results
+                                    if r[0].source.split(":")[0] in source_filter]
+            if remote_filter:
+                rt_map = {"Remote": "remote", "Hybrid": "hybrid", "On-site": "onsite"}
+                wanted = {rt_map[r] for r in remote_filter if r in rt_map}
+                filtered_results = [r for r in filtered_results
+                                    if r[0].remote_type in wanted]
+            if only_new:
+                filtered_results = [r for r in filtered_results if job_status.get(r[0].id) == NEW]
+            # Results are ranked best first; other orders only need the shown page.
+            if sort_option == "Lowest match":
+                shown = heapq.nsmallest(RESULTS_PAGE_SIZE, filtered_results, key=lambda x: x[1])
+            elif sort_option == "Newest":
+                from datetime import datetime, timezone
+                shown = heapq.nlargest(
+                    RESULTS_PAGE_SIZE, filtered_results,
+                    key=lambda x: x[0].published_at or datetime.min.replace(tzinfo=timezone.utc),
+                )
+            else:
+                shown = filtered_results[:RESULTS_PAGE_SIZE]
+            shown_of = len(filtered_results)
 
-        st.caption(f"Showing {len(filtered_results)} of {len(results)}")
+        st.caption(f"Showing {shown_of} of {len(passing)}")
 
-        for job, score, sub_scores, explanation in filtered_results[:50]:
+        for job, score, sub_scores in shown:
             import html as html_mod
+            explanation = _explanation(job, sub_scores)
             score_pct = int(score * 100)
             reasons = explanation.get("reasons", [])
             gaps = explanation.get("gaps", [])
 
             safe_title = html_mod.escape(job.title)
+            new_badge = '<span class="new-badge">NEW</span>' if job_status.get(job.id) == NEW else ""
             safe_company = html_mod.escape(job.company)
             safe_location = html_mod.escape(job.location or "Not specified")
             safe_tags = " ".join(
@@ -766,7 +921,7 @@ with tab_results:
             card_html = f"""<div class="job-card">
   <div style="display:flex;justify-content:space-between;align-items:flex-start;">
     <div style="flex:1;">
-      <h3>{safe_title}</h3>
+      <h3>{safe_title}{new_badge}</h3>
       <span class="company">{safe_company}</span>
       <div class="meta">
         {safe_location}
@@ -791,6 +946,13 @@ with tab_results:
                 with st.expander("Description"):
                     st.text(job.description[:1500] if job.description else "No description.")
 
+        with f4:
+            # Filled in after the cards so reasons explained on this page are exported too.
+            st.download_button(
+                "CSV", _results_csv(rank, (*csv_key, len(st.session_state.explanations))),
+                "jobs.csv", "text/csv", use_container_width=True,
+            )
+
 # ---------------------------------------------------------------------------
 # Footer
 # ---------------------------------------------------------------------------
@@ -0,0 +1,178 @@
+"""Parse throughput of each connector on synthetic payloads, with HTTP stubbed out.
+
+Times the step that turns a decoded API response into Job objects (date
+parsing, clean_html, Job construction) and measures its memory with
+tracemalloc in a separate pass, so tracing does not skew the timings. Text
+memos are cleared before every pass, so the numbers are for first-time ingest:
+
+    python -m benchmarks.bench_parse
+    python -m benchmarks.bench_parse --sizes 1000,10000,100000 --sources reed,lever --json parse.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from src.sources import adzuna, arbeitnow, greenhouse, lever, reed, remotive
+from src.utils.text import clear_memos
+
+DEFAULT_SIZES = (1_000, 10_000)
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_WORDS = (
+    "python data pipeline machine learning team customers product platform cloud aws "
+    "sql analytics scale ownership design review mentor deliver reliable services api "
+    "kubernetes docker growth impact collaborate remote hybrid benefits equity"
+).split()
+_TITLES = ["Data Scientist", "Senior Backend Engineer", "Product Manager", "ML Engineer", "Analyst"]
+_CITIES = ["London, UK", "Berlin", "Remote", "New York, US", "Amsterdam"]
+
+
+def _html(rng: random.Random, paragraphs: int = 6) -> str:
+    parts = []
+    for _ in range(paragraphs):
+        words = " ".join(rng.choice(_WORDS) for _ in range(40))
+        parts.append(f"<p>{words} &amp; more&nbsp;&ndash; <strong>{rng.choice(_WORDS)}</strong></p>")
+    parts.append("<ul>" + "".join(f"<li>{rng.choice(_WORDS)}</li>" for _ in range(6)) + "</ul>")
+    return "\n".join(parts)
+
+
+def _iso(rng: random.Random) -> str:
+    return (_EPOCH - timedelta(minutes=rng.randrange(60 * 24 * 60))).isoformat().replace("+00:00", "Z")
+
+
+def _remotive(rng: random.Random, n: int) -> dict:
+    return {"jobs": [{
+        "id": i, "title": rng.choice(_TITLES), "company_name": f"Co {i % 500}",
+        "description": _html(rng), "url": f"https://remotive.com/{i}",
+        "candidate_required_location": rng.choice(_CITIES), "tags": rng.sample(_WORDS, 4),
+        "salary": "$80,000 - $120,000", "publication_date": _iso(rng)[:-1],
+    } for i in range(n)]}
+
+
+def _arbeitnow(rng: random.Random, n: int) -> dict:
+    return {"data": [{
+        "slug": f"job-{i}", "title": rng.choice(_TITLES), "company_name": f"Co {i % 500}",
+        "description": _html(rng), "url": f"https://arbeitnow.com/{i}", "location": rng.choice(_CITIES),
+        "remote": bool(i % 2), "tags": rng.sample(_WORDS, 4),
+        "created_at": int(_EPOCH.timestamp()) - rng.randrange(5_000_000),
+    } for i in range(n)]}
+
+
+def _greenhouse(rng: random.Random, n: int) -> dict:
+    return {"jobs": [{
+        "id": i, "title": rng.choice(_TITLES), "content": _html(rng).replace("<", "&lt;").replace(">", "&gt;"),
+        "absolute_url": f"https://boards.greenhouse.io/acme/jobs/{i}", "updated_at": _iso(rng),
+        "offices": [{"name": rng.choice(_CITIES)}], "departments": [{"name": "Engineering"}],
+    } for i in range(n)]}
+
+
+def _lever(rng: random.Random, n: int) -> list:
+    return [{
+        "id": f"posting-{i}", "text": rng.choice(_TITLES), "description": _html(rng, 4),
+        "lists": [{"text": "Requirements", "content": _html(rng, 1)}],
+        "hostedUrl": f"https://jobs.lever.co/acme/{i}",
+        "createdAt": int(_EPOCH.timestamp() * 1000) - rng.randrange(5_000_000_000),
+        "categories": {"location": rng.choice(_CITIES), "commitment": "Full-time", "team": "Data"},
+    } for i in range(n)]
+
+
+def _reed(rng: random.Random, n: int) -> dict:
+    return {"totalResults": n, "results": [{
+        "jobId": 40_000_000 + i, "jobTitle": rng.choice(_TITLES), "employerName": f"Co {i % 500}",
+        "jobDescription": _html(rng, 2), "jobUrl": f"https://www.reed.co.uk/jobs/{i}",
+        "locationName": rng.choice(_CITIES), "minimumSalary": 50_000, "maximumSalary": 70_000,
+        "currency": "GBP", "date": _iso(rng),
+    } for i in range(n)]}
+
+
+def _adzuna(rng: random.Random, n: int) -> dict:
+    return {"count": n, "results": [{
+        "id": str(3_000_000_000 + i), "title": rng.choice(_TITLES), "description": _html(rng, 2),
+        "created": _iso(rng), "redirect_url": f"https://www.adzuna.co.uk/land/ad/{i}",
+        "location": {"display_name": rng.choice(_CITIES)}, "company": {"display_name": f"Co {i % 500}"},
+        "category": {"tag": "it-jobs"}, "salary_min": 50_000, "salary_max": 70_000,
+        "contract_type": "permanent", "contract_time": "full_time",
+    } for i in range(n)]}
+
+
+# Source name -> (synthetic payload factory, the connector's parse step).
+SOURCES: dict[str, tuple[Callable[[random.Random, int], object], Callable[[object], list]]] = {
+    "remotive": (_remotive, lambda data: [remotive._parse_item(item) for item in data["jobs"]]),
+    "arbeitnow": (_arbeitnow, lambda data: [arbeitnow._parse_item(item) for item in data["data"]]),
+    "greenhouse": (_greenhouse, lambda data: greenhouse._parse_board("acme", data)),
+    "lever": (_lever, lambda data: lever._parse_postings("acme", data)),
+    "reed": (_reed, reed._parse_page),
+    "adzuna": (_adzuna, lambda data: adzuna._parse_page(data, "gb")),
+}
+
+
+def bench_source(name: str, size: int, repeat: int = 3, seed: int = 0) -> dict:
+    make_payload, parse = SOURCES[name]
+    payload = make_payload(random.Random(seed), size)
+
+    best = float("inf")
+    for _ in range(repeat):
+        clear_memos()
+        gc.collect()
+        start = time.perf_counter()
+        jobs = parse(payload)
+        best = min(best, time.perf_counter() - start)
+        assert len(jobs) == size
+        del jobs
+
+    clear_memos()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        jobs = parse(payload)
+        retained, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    del jobs
+
+    return {
+        "source": name,
+        "items": size,
+        "seconds": best,
+        "items_per_sec": size / best if best else float("inf"),
+        "peak_bytes": peak,
+        "retained_bytes_per_item": retained / size,
+        "blocks_per_item": blocks / size,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", dest="json_path", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    results = []
+    print(f"{'source':<11}{'items':>9}{'items/s':>12}{'peak MiB':>10}{'KiB/item':>10}{'blocks/item':>13}")
+    for name in sources:
+        for size in sizes:
+            r = bench_source(name, size, repeat=args.repeat)
+            results.append(r)
+            print(
+                f"{name:<11}{size:>9}{r['items_per_sec']:>12,.0f}{r['peak_bytes'] / 2**20:>10.1f}"
+                f"{r['retained_bytes_per_item'] / 1024:>10.2f}{r['blocks_per_item']:>13.1f}"
+            )
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
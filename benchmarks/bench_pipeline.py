@@ -0,0 +1,146 @@
+"""Time fetch -> dedup -> filter -> score against recorded HTTP responses.
+
+Record once with network access, then replay anywhere:
+
+    python -m benchmarks.bench_pipeline record benchmarks/fixtures/http.json
+    python -m benchmarks.bench_pipeline replay benchmarks/fixtures/http.json --repeat 5
+
+Reed and Adzuna are included when their API keys are set while recording;
+replay supplies placeholder keys because credentials are not archived.
+Validator, parse and text memos are cleared before every replay run, so each
+run measures a cold ingest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+from src.matching.dedup import deduplicate
+from src.matching.filters import apply_hard_filters
+from src.matching.scorer import score_jobs
+from src.matching.skills import skill_matcher
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.sources import greenhouse, lever, reed
+from src.sources.adzuna import AdzunaConnector
+from src.sources.arbeitnow import ArbeitnowConnector
+from src.sources.greenhouse import GreenhouseConnector
+from src.sources.lever import LeverConnector
+from src.sources.normalizer import fetch_all_jobs
+from src.sources.reed import ReedConnector
+from src.sources.remotive import RemotiveConnector
+from src.utils.http_cache import get_validator_cache
+from src.utils.http_fixtures import HttpArchive, RecordingTransport, replay_registry
+from src.utils.http_pool import ClientRegistry, set_client_registry
+from src.utils.text import clear_memos
+
+SAMPLE_CV = (
+    "Senior data scientist with 7 years of experience in Python, SQL, machine learning, "
+    "pandas, scikit-learn, Spark and AWS. Built recommendation systems and forecasting "
+    "pipelines, led a team of analysts and deployed models with Docker and Airflow."
+)
+SAMPLE_PROFILE = Profile(
+    raw_text=SAMPLE_CV,
+    skills=["python", "sql", "machine learning", "pandas", "scikit-learn", "spark", "aws", "docker", "airflow"],
+)
+SAMPLE_PREFS = Preferences(target_titles=["Data Scientist"], country="UK", remote_types=["remote", "hybrid"])
+_PLACEHOLDER_KEYS = {"REED_API_KEY": "replay", "ADZUNA_APP_ID": "replay", "ADZUNA_APP_KEY": "replay"}
+
+
+def build_connectors(prefs: Preferences) -> list:
+    keywords = " ".join(prefs.target_titles)
+    connectors = [
+        RemotiveConnector(search=keywords),
+        ArbeitnowConnector(),
+        GreenhouseConnector(prefs=prefs),
+        LeverConnector(),
+    ]
+    if ReedConnector.is_available():
+        connectors.append(ReedConnector(keywords=keywords))
+    if AdzunaConnector.is_available():
+        connectors.append(AdzunaConnector(keywords=keywords, country=prefs.country or "UK"))
+    return connectors
+
+
+def run_once(profile: Profile, prefs: Preferences) -> dict[str, float]:
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    jobs = fetch_all_jobs(build_connectors(prefs))
+    timings["fetch"] = time.perf_counter() - start
+
+    mark = time.perf_counter()
+    jobs = deduplicate(jobs)
+    timings["dedup"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    filtered = apply_hard_filters(jobs, prefs)
+    timings["filter"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    score_jobs(filtered, profile, prefs)
+    timings["score"] = time.perf_counter() - mark
+
+    timings["total"] = time.perf_counter() - start
+    timings["jobs"] = len(jobs)
+    return timings
+
+
+def record(path: str) -> None:
+    archive = HttpArchive(path)
+    previous = set_client_registry(ClientRegistry(transport=RecordingTransport(archive)))
+    try:
+        timings = run_once(SAMPLE_PROFILE, SAMPLE_PREFS)
+    finally:
+        set_client_registry(previous)
+    archive.save()
+    print(f"Recorded {len(archive)} responses ({timings['jobs']:.0f} jobs) to {path}")
+
+
+def _clear_memos() -> None:
+    get_validator_cache().clear()
+    greenhouse._PARSED_BOARDS.clear()
+    greenhouse._PARSED_DETAILS.clear()
+    lever._PARSED_BOARDS.clear()
+    with reed._DETAILS_LOCK:
+        reed._DETAILS.clear()
+    clear_memos()
+    skill_matcher.cache_clear()
+
+
+def replay(path: str, repeat: int) -> None:
+    for name, value in _PLACEHOLDER_KEYS.items():
+        os.environ.setdefault(name, value)
+    archive = HttpArchive.load(path)
+    previous = set_client_registry(replay_registry(archive))
+    runs = []
+    try:
+        for _ in range(repeat):
+            _clear_memos()
+            runs.append(run_once(SAMPLE_PROFILE, SAMPLE_PREFS))
+    finally:
+        set_client_registry(previous)
+
+    print(f"{len(archive)} recorded responses, {archive.misses} unmatched requests, "
+          f"{runs[0]['jobs']:.0f} jobs per run, {repeat} runs")
+    for stage in ("fetch", "dedup", "filter", "score", "total"):
+        values = [r[stage] * 1000 for r in runs]
+        print(f"  {stage:<7} median {statistics.median(values):9.1f} ms   min {min(values):9.1f} ms")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("archive")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    if args.mode == "record":
+        record(args.archive)
+    else:
+        replay(args.archive, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Score many profiles against one shared job corpus.
+
+The corpus is vectorized once; text similarity for every profile/job pair is
+one sparse product of the CV matrix with the job matrix, and skill overlap is
+the product of a profile-by-skill and a job-by-skill incidence matrix.
+Preference fit, recency and hard filters are computed once per distinct
+preference set.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.matching.columnar import JobTable, top_indices
+from src.matching.filters import apply_hard_filters
+from src.matching.scorer import WEIGHTS
+from src.matching.skills import SkillMatcher, skill_matcher
+from src.matching.text_model import TextModel, job_text
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.utils.text import normalize_for_matching
+
+if TYPE_CHECKING:
+    from src.storage.cache import JobCache
+
+DEFAULT_TOP_K = 50
+# Profiles scored together; bounds the dense (profiles x jobs) blocks.
+PROFILE_BLOCK = 64
+
+ScoredJob = tuple[Job, float, dict[str, float]]
+
+
+def score_batch(
+    seekers: list[tuple[Profile, Preferences]],
+    jobs: list[Job],
+    top_k: int = DEFAULT_TOP_K,
+    text_model: TextModel | None = None,
+    vector_cache: JobCache | None = None,
+    apply_filters: bool = True,
+) -> list[list[ScoredJob]]:
+    """Best ``top_k`` jobs for each ``(profile, preferences)``, in input order.
+
+    Rows match what score_jobs returns for the jobs passing each seeker's hard
+    filters (or all jobs with ``apply_filters=False``). Without a
+    ``text_model`` one is fitted on ``jobs`` for this call, so unlike
+    score_jobs the CVs are not part of the TF-IDF fit.
+    """
+    if not seekers:
+        return []
+    if text_model is None:
+        text_model = TextModel.fit([job_text(j) for j in jobs]) if jobs else None
+    job_vectors = text_model.job_matrix(jobs, vector_cache) if text_model is not None else None
+
+    skill_sets = [skill_matcher(frozenset(profile.skills_lower())).skills for profile, _ in seekers]
+    all_skills = sorted(frozenset().union(*skill_sets))
+    job_skills = _incidence([SkillMatcher(all_skills).job_hits(j) for j in jobs], all_skills)
+
+    table = JobTable(jobs, skill_matcher(frozenset()))
+    recency = table.recency()
+    preference_fit = _Memo(lambda prefs: table.preference_fit(prefs))
+    passing = _Memo(lambda prefs: _filter_mask(jobs, prefs) if apply_filters else np.ones(len(jobs), dtype=bool))
+
+    results: list[list[ScoredJob]] = [[] for _ in seekers]
+    scored = [i for i, (profile, _) in enumerate(seekers) if not profile.is_empty]
+    for i, (profile, prefs) in enumerate(seekers):
+        if profile.is_empty:
+            rows = np.flatnonzero(passing(prefs))[:top_k]
+            results[i] = [(jobs[j], 0.0, {}) for j in rows.tolist()]
+
+    for start in range(0, len(scored), PROFILE_BLOCK):
+        block = scored[start:start + PROFILE_BLOCK]
+        text = _text_similarities([seekers[i][0] for i in block], text_model, job_vectors, len(jobs))
+        overlap = _skill_overlap([skill_sets[i] for i in block], all_skills, job_skills)
+        for row, i in enumerate(block):
+            prefs = seekers[i][1]
+            scores = {
+                "text_similarity": text[row],
+                "skill_overlap": overlap[row],
+                "preference_fit": preference_fit(prefs),
+                "recency": recency,
+            }
+            results[i] = _top_rows(jobs, scores, passing(prefs), top_k)
+    return results
+
+
+class _Memo:
+    """Caches a per-preferences computation by the preferences' contents."""
+
+    def __init__(self, fn):
+        self._fn = fn
+        self._results: dict[str, np.ndarray] = {}
+
+    def __call__(self, prefs: Preferences) -> np.ndarray:
+        key = json.dumps(prefs.to_dict(), sort_keys=True, default=str)
+        if key not in self._results:
+            self._results[key] = self._fn(prefs)
+        return self._results[key]
+
+
+def _filter_mask(jobs: list[Job], prefs: Preferences) -> np.ndarray:
+    passed = {id(job) for job in apply_hard_filters(jobs, prefs)}
+    return np.fromiter((id(job) in passed for job in jobs), dtype=bool, count=len(jobs))
+
+
+def _incidence(hits: list[frozenset[str]], skills: list[str]):
+    """Binary (len(hits), len(skills)) CSR matrix; row r marks the skills in hits[r]."""
+    from scipy.sparse import csr_matrix
+
+    column = {s: c for c, s in enumerate(skills)}
+    indptr = np.zeros(len(hits) + 1, dtype=np.int64)
+    np.cumsum([len(h) for h in hits], out=indptr[1:])
+    indices = np.fromiter((column[s] for h in hits for s in h), dtype=np.int32, count=int(indptr[-1]))
+    return csr_matrix((np.ones(len(indices), dtype=np.float32), indices, indptr), shape=(len(hits), len(skills)))
+
+
+def _text_similarities(profiles: list[Profile], text_model: TextModel | None, job_vectors, n_jobs: int) -> np.ndarray:
+    if text_model is None or not n_jobs:
+        return np.zeros((len(profiles), n_jobs))
+    cv_texts = [normalize_for_matching(p.raw_text) for p in profiles]
+    cv_vectors = text_model.transform(cv_texts).astype(np.float32)
+    sims = (cv_vectors @ job_vectors.T).toarray().astype(np.float64)
+    sims[[not t.strip() for t in cv_texts]] = 0.0
+    return sims
+
+
+def _skill_overlap(skill_sets: list[frozenset[str]], all_skills: list[str], job_skills) -> np.ndarray:
+    counts = np.array([len(s) for s in skill_sets], dtype=np.float64)
+    hits = (_incidence(skill_sets, all_skills) @ job_skills.T).toarray()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        overlap = np.minimum(hits / counts[:, None], 1.0)
+    overlap[counts == 0] = 0.0
+    return overlap
+
+
+def _top_rows(jobs: list[Job], scores: dict[str, np.ndarray], mask: np.ndarray, top_k: int) -> list[ScoredJob]:
+    rows = np.flatnonzero(mask)
+    columns = {name: np.broadcast_to(values, (len(jobs),))[rows] for name, values in scores.items()}
+    total = 0
+    for name, weight in WEIGHTS.items():
+        total = total + weight * columns[name]
+    order = top_indices(np.asarray(total, dtype=np.float64).reshape(-1), top_k)
+    if not len(order):
+        return []
+    names = list(columns)
+    values = [columns[name][order].tolist() for name in names]
+    return [
+        (jobs[j], t, dict(zip(names, v)))
+        for j, t, *v in zip(rows[order].tolist(), np.asarray(total)[order].tolist(), *values)
+    ]
@@ -0,0 +1,162 @@
+"""Column arrays of a job list, for scoring many jobs with NumPy.
+
+Produces the same sub-scores as the per-job functions in scorer.py. Strings
+that repeat across jobs (location, remote type) are stored as codes into a list
+of distinct values, so a preference is evaluated once per value rather than
+once per job.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+
+import numpy as np
+
+from src.matching.scorer import (
+    RECENCY_BUCKETS,
+    RECENCY_OLD,
+    RECENCY_UNKNOWN,
+    WEIGHTS,
+    _location_fit,
+    _remote_fit,
+)
+from src.matching.skills import SkillMatcher
+from src.models.job import Job
+from src.models.preferences import Preferences
+
+_DAY = 86400.0
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class JobTable:
+    """Scoring columns of ``jobs``; skill hits are bitsets over ``skill_names``, built on first use."""
+
+    def __init__(self, jobs: list[Job], skills: SkillMatcher):
+        self.jobs = jobs
+        self.skills = skills
+        self.skill_names = sorted(skills.skills)
+        self.published = np.array([_timestamp(j.published_at) for j in jobs], dtype=np.float64)
+        self.remote_codes, self.remote_types = _factorize([j.remote_type for j in jobs])
+        self.location_codes, self.locations = _factorize([j.location.lower() for j in jobs])
+        self._titles = [j.title.lower() for j in jobs]
+        self._industry_texts: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    @cached_property
+    def skill_bits(self) -> np.ndarray:
+        position = {s: i for i, s in enumerate(self.skill_names)}
+        bits = np.zeros((len(self.jobs), max(len(position), 1)), dtype=bool)
+        for row, job in enumerate(self.jobs):
+            for skill in self.skills.job_hits(job):
+                bits[row, position[skill]] = True
+        return np.packbits(bits, axis=1)
+
+    def skill_overlap(self) -> np.ndarray:
+        if not self.skill_names:
+            return np.zeros(len(self.jobs))
+        hits = _POPCOUNT[self.skill_bits].sum(axis=1, dtype=np.int64)
+        return np.minimum(hits / len(self.skill_names), 1.0)
+
+    def recency(self, now: float | None = None) -> np.ndarray:
+        age = (time.time() if now is None else now) - self.published
+        conditions = [age < days * _DAY for days, _ in RECENCY_BUCKETS]
+        scores = np.select(conditions, [score for _, score in RECENCY_BUCKETS], RECENCY_OLD)
+        return np.where(np.isnan(self.published), RECENCY_UNKNOWN, scores)
+
+    def preference_fit(self, prefs: Preferences) -> np.ndarray:
+        score = np.zeros(len(self.jobs))
+        checks = 0
+        if prefs.target_titles:
+            checks += 1
+            score += _contains_any(self._titles, prefs.target_titles)
+        if prefs.remote_types:
+            checks += 1
+            score += np.array([_remote_fit(r, prefs) for r in self.remote_types])[self.remote_codes]
+        if prefs.locations:
+            checks += 1
+            score += np.array([_location_fit(loc, prefs) for loc in self.locations])[self.location_codes]
+        if prefs.industries:
+            checks += 1
+            if self._industry_texts is None:
+                self._industry_texts = [
+                    (j.title + " " + j.description + " " + " ".join(j.tags)).lower() for j in self.jobs
+                ]
+            score += _contains_any(self._industry_texts, prefs.industries)
+        return score / max(checks, 1)
+
+    def sub_scores(self, text_sims, prefs: Preferences, now: float | None = None) -> dict[str, np.ndarray]:
+        return {
+            "text_similarity": np.asarray(text_sims, dtype=np.float64),
+            "skill_overlap": self.skill_overlap(),
+            "preference_fit": self.preference_fit(prefs),
+            "recency": self.recency(now),
+        }
+
+    @staticmethod
+    def total(scores: dict[str, np.ndarray]) -> np.ndarray:
+        total = 0
+        for key, weight in WEIGHTS.items():
+            total = total + weight * scores[key]
+        return total
+
+    def rows(
+        self, scores: dict[str, np.ndarray], total: np.ndarray, ranked: bool = False, top_k: int | None = None
+    ) -> list[tuple[Job, float, dict[str, float]]]:
+        """Per-job ``(job, total, sub_scores)`` tuples, best first if ``ranked``.
+
+        ``top_k`` keeps only the best rows (implies ``ranked``).
+        """
+        keys = list(scores)
+        jobs = self.jobs
+        if ranked or top_k is not None:
+            order = top_indices(total, len(total) if top_k is None else top_k)
+            total = total[order]
+            scores = {k: v[order] for k, v in scores.items()}
+            jobs = [jobs[i] for i in order.tolist()]
+        columns = [scores[k].tolist() for k in keys]
+        return [
+            (job, t, dict(zip(keys, values)))
+            for job, t, *values in zip(jobs, total.tolist(), *columns)
+        ]
+
+
+def top_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest ``values``, best first.
+
+    Same order as a stable descending sort truncated to ``k`` (ties keep index
+    order), but only the selected entries are sorted.
+    """
+    k = max(0, min(k, len(values)))
+    if k == len(values):
+        return np.argsort(-values, kind="stable")
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    threshold = values[np.argpartition(-values, k - 1)[:k]].min()
+    above = np.flatnonzero(values > threshold)
+    ties = np.flatnonzero(values == threshold)[:k - len(above)]
+    selected = np.concatenate([above, ties])
+    return selected[np.argsort(-values[selected], kind="stable")]
+
+
+def _factorize(values: list[str]) -> tuple[np.ndarray, list[str]]:
+    index: dict[str, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+    return codes, list(index)
+
+
+def _contains_any(texts: list[str], needles: list[str]) -> np.ndarray:
+    pattern = re.compile("|".join(re.escape(n.lower()) for n in needles))
+    return np.fromiter((pattern.search(t) is not None for t in texts), dtype=np.float64, count=len(texts))
+
+
+def _timestamp(value: datetime | None) -> float:
+    if value is None:
+        return float("nan")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
@@ -1,9 +1,42 @@
 from __future__ import annotations
 
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
 from src.models.job import Job
+from src.utils.canonical import canonical_company, canonical_title
+
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.8
+NUM_PERM = 128
+SHINGLE_WORDS = 3
+# Reed and Adzuna only return the start of a description, so near-duplicates
+# are compared on the opening words rather than the full text.
+DESCRIPTION_WORDS = 60
+# Estimated similarity is not enough on its own: two roles at one company often
+# share a boilerplate description, so their titles must also mostly agree.
+TITLE_MIN_SIMILARITY = 0.6
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+# Jobs per block when computing signatures, to bound the (shingles x perms) array.
+_SIGNATURE_BLOCK = 256
+# Multipliers combining the token hashes of a shingle; any odd 64-bit constants.
+_SHINGLE_MIX = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F))
+
 
+def deduplicate(jobs: list[Job], near_duplicate_threshold: float | None = None) -> list[Job]:
+    """Collapse jobs with the same company and title.
+
+    With ``near_duplicate_threshold`` jobs whose estimated shingle similarity
+    reaches the threshold are collapsed too (see NearDuplicateIndex).
+    """
+    if near_duplicate_threshold is not None:
+        dedup = StreamingDeduplicator(near_duplicate_threshold)
+        dedup.add(jobs)
+        return dedup.jobs()
 
-def deduplicate(jobs: list[Job]) -> list[Job]:
     seen: dict[str, Job] = {}
     for job in jobs:
         key = job.dedup_key
@@ -16,6 +49,161 @@ def deduplicate(jobs: list[Job]) -> list[Job]:
     return list(seen.values())
 
 
+class StreamingDeduplicator:
+    """Incremental form of deduplicate for jobs that arrive in batches."""
+
+    def __init__(self, near_duplicate_threshold: float | None = None) -> None:
+        self._seen: dict[str, Job] = {}
+        # dedup_key -> key of the group the job was merged into
+        self._groups: dict[str, str] = {}
+        self._index = NearDuplicateIndex(near_duplicate_threshold) if near_duplicate_threshold is not None else None
+
+    def add(self, jobs: list[Job]) -> list[Job]:
+        """Return the jobs that are new or replace an earlier duplicate."""
+        unseen = [j for j in jobs if j.dedup_key not in self._groups]
+        if self._index is not None and unseen:
+            for job, key in zip(unseen, self._index.add(unseen)):
+                self._groups.setdefault(job.dedup_key, key)
+
+        accepted: dict[str, Job] = {}
+        for job in jobs:
+            key = self._groups.setdefault(job.dedup_key, job.dedup_key)
+            existing = self._seen.get(key)
+            if existing is None or _prefer_new(job, existing):
+                self._seen[key] = job
+                accepted[key] = job
+        return list(accepted.values())
+
+    def group_key(self, job: Job) -> str:
+        """Key shared by ``job`` and every duplicate it was merged with."""
+        return self._groups.get(job.dedup_key, job.dedup_key)
+
+    def jobs(self) -> list[Job]:
+        return list(self._seen.values())
+
+
+class NearDuplicateIndex:
+    """MinHash signatures with LSH banding for near-duplicate job lookup.
+
+    Each job is shingled into word 3-grams of its canonical title and company
+    and the start of its description. Jobs sharing any LSH band are candidates; a candidate
+    is a near-duplicate when the fraction of equal MinHash values reaches
+    ``threshold`` and the titles pass TITLE_MIN_SIMILARITY.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD, num_perm: int = NUM_PERM, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _lsh_params(threshold, num_perm)
+        # Multiply-shift hashing: h(x) = (a * x + b) mod 2^64 >> 32, with odd a.
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self._buckets: list[dict[bytes, list[int]]] = [{} for _ in range(self.bands)]
+        self._signatures: list[np.ndarray] = []
+        self._titles: list[frozenset[str]] = []
+        self._keys: list[str] = []
+
+    def signatures(self, jobs: list[Job]) -> np.ndarray:
+        """MinHash signatures of ``jobs`` as an (n, num_perm) array."""
+        blocks = []
+        for start in range(0, len(jobs), _SIGNATURE_BLOCK):
+            shingle_sets = [_shingle_hashes(job) for job in jobs[start:start + _SIGNATURE_BLOCK]]
+            hashes = np.concatenate(shingle_sets)
+            offsets = np.cumsum([0] + [len(s) for s in shingle_sets[:-1]])
+            permuted = (self._a[:, None] * hashes + self._b[:, None]) >> np.uint64(32)
+            blocks.append(np.minimum.reduceat(permuted, offsets, axis=1).T)
+        return np.concatenate(blocks) if blocks else np.empty((0, self.num_perm), dtype=np.uint64)
+
+    def add(self, jobs: list[Job]) -> list[str]:
+        """Index ``jobs`` and return each one's group key.
+
+        A job joins the group of its first near-duplicate already in the index
+        (or earlier in ``jobs``); otherwise its dedup_key starts a new group.
+        """
+        if not jobs:
+            return []
+        keys = []
+        for job, signature in zip(jobs, self.signatures(jobs)):
+            title = _title_tokens(job.title)
+            key = self._match(signature, title) or job.dedup_key
+            self._insert(signature, title, key)
+            keys.append(key)
+        return keys
+
+    def _match(self, signature: np.ndarray, title: frozenset[str]) -> str | None:
+        candidates: set[int] = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+        for i in sorted(candidates):
+            if (
+                np.count_nonzero(self._signatures[i] == signature) >= self.threshold * self.num_perm
+                and _jaccard(title, self._titles[i]) >= TITLE_MIN_SIMILARITY
+            ):
+                return self._keys[i]
+        return None
+
+    def _insert(self, signature: np.ndarray, title: frozenset[str], key: str) -> None:
+        i = len(self._keys)
+        self._signatures.append(signature)
+        self._titles.append(title)
+        self._keys.append(key)
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket.setdefault(band, []).append(i)
+
+    def _bands(self, signature: np.ndarray) -> list[bytes]:
+        return [signature[b * self.rows:(b + 1) * self.rows].tobytes() for b in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def _lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Bands and rows whose S-curve turns just below ``threshold``.
+
+    A pair with similarity s shares a band with probability 1 - (1 - s^r)^b,
+    which rises sharply around (1/b)^(1/r). Erring low keeps recall high; the
+    exact check in NearDuplicateIndex._match removes the extra candidates.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+def _shingle_hashes(job: Job) -> np.ndarray:
+    company = canonical_company(job.company)
+    words = (
+        canonical_title(job.title).split()
+        + ([company] if company else [])
+        + _TOKEN.findall(job.description.lower())[:DESCRIPTION_WORDS]
+    )
+    tokens = np.fromiter((_token_hash(w) for w in words), dtype=np.uint64, count=len(words))
+    if len(tokens) < SHINGLE_WORDS:
+        return np.array([tokens.sum()], dtype=np.uint64)
+    n = len(tokens) - SHINGLE_WORDS + 1
+    return tokens[:n] * _SHINGLE_MIX[0] + tokens[1:n + 1] * _SHINGLE_MIX[1] + tokens[2:n + 2]
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(token: str) -> int:
+    return zlib.crc32(token.encode())
+
+
+def _title_tokens(title: str) -> frozenset[str]:
+    return frozenset(canonical_title(title).split())
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
 def _prefer_new(candidate: Job, existing: Job) -> bool:
     if candidate.description and not existing.description:
         return True
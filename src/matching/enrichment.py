@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from src.matching.scorer import rescore_jobs
+from src.matching.text_model import TextModel
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.storage.cache import JobCache
+
+DEFAULT_TOP_K = 20
+
+ScoredJob = tuple[Job, float, dict[str, float]]
+
+
+def _reed_details(jobs: list[Job]) -> dict[str, Job]:
+    from src.sources.reed import ReedConnector
+
+    return ReedConnector().fetch_details(jobs)
+
+
+# Sources whose search results carry truncated descriptions, mapped to a
+# function returning full-description copies keyed by job id.
+ENRICHERS: dict[str, Callable[[list[Job]], dict[str, Job]]] = {
+    "reed": _reed_details,
+}
+
+
+def enrich_top_results(
+    scored: list[ScoredJob],
+    profile: Profile,
+    prefs: Preferences,
+    top_k: int = DEFAULT_TOP_K,
+    text_model: TextModel | None = None,
+    vector_cache: JobCache | None = None,
+) -> list[ScoredJob]:
+    """Fetch full details for the top ``top_k`` results and rescore just those rows."""
+    updated = fetch_enriched(scored, top_k)
+    return rescore_jobs(scored, updated, profile, prefs, text_model, vector_cache)
+
+
+def fetch_enriched(scored: list[ScoredJob], top_k: int = DEFAULT_TOP_K) -> dict[str, Job]:
+    """Full-description copies of the enrichable jobs among the top ``top_k``, keyed by id."""
+    wanted: dict[str, list[Job]] = {}
+    for job, _, _ in scored[:top_k]:
+        if job.source in ENRICHERS:
+            wanted.setdefault(job.source, []).append(job)
+
+    updated: dict[str, Job] = {}
+    for source, jobs in wanted.items():
+        try:
+            updated.update(ENRICHERS[source](jobs))
+        except Exception:
+            continue
+    return updated
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from src.matching.skills import skill_matcher
 from src.models.job import Job
 from src.models.profile import Profile
 from src.models.preferences import Preferences
@@ -14,12 +15,9 @@ def explain_match(
     reasons: list[str] = []
     gaps: list[str] = []
 
-    job_text_lower = (job.title + " " + job.description).lower()
-
-    # Skill matches
-    profile_skills = profile.skills_lower()
+    # Skill matches (the same hits the scorer counted)
     job_tags = {t.lower() for t in job.tags}
-    matched_skills = profile_skills & job_tags
+    matched_skills = skill_matcher(frozenset(profile.skills_lower())).job_hits(job)
     if matched_skills:
         display = sorted(matched_skills)[:8]
         reasons.append(f"Your skills match: {', '.join(display)}")
@@ -32,7 +30,7 @@ def explain_match(
         if met:
             reasons.append(f"Has your required skills: {', '.join(sorted(met)[:5])}")
         if missing:
-            found_in_desc = {s for s in missing if s in job_text_lower}
+            found_in_desc = missing & skill_matcher(frozenset(required_lower)).job_hits(job)
             still_missing = missing - found_in_desc
             if found_in_desc:
                 reasons.append(f"Description mentions: {', '.join(sorted(found_in_desc)[:5])}")
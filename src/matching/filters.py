@@ -3,6 +3,15 @@ from __future__ import annotations
 from src.models.job import Job
 from src.models.preferences import Preferences
 
+# Preference fields that apply_hard_filters reads.
+_HARD_FILTER_FIELDS = ("locations", "country", "remote_types", "seniority_levels", "min_salary", "also_remote_in")
+
+
+def hard_filter_params(prefs: Preferences) -> dict:
+    """The hard-filter preferences that are actually set."""
+    data = prefs.to_dict()
+    return {k: data[k] for k in _HARD_FILTER_FIELDS if data[k]}
+
 
 def apply_hard_filters(jobs: list[Job], prefs: Preferences) -> list[Job]:
     filtered = []
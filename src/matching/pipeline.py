@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import heapq
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from src.matching.dedup import StreamingDeduplicator
+from src.matching.filters import apply_hard_filters
+from src.matching.scorer import score_jobs
+from src.matching.text_model import TextModel
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.sources.base import BaseConnector
+from src.storage.cache import JobCache
+
+DEFAULT_MAX_WORKERS = 6
+DEFAULT_QUEUE_SIZE = 12
+# How often the consumer wakes up to check per-connector deadlines.
+_POLL_INTERVAL = 0.1
+
+ScoredJob = tuple[Job, float, dict[str, float]]
+
+
+@dataclass
+class PipelineUpdate:
+    source: str
+    jobs: list[Job] = field(default_factory=list)
+    scored: list[ScoredJob] = field(default_factory=list)
+    error: str = ""
+    done: bool = False
+
+
+class MatchPipeline:
+    """Dedup, filter and score jobs incrementally as pages arrive.
+
+    Without a ``text_model`` text similarity is fitted per batch, so scores from
+    ``push`` are provisional and ``finalize`` rescores every surviving job
+    against one shared TF-IDF fit. With one, scores are final as they arrive,
+    and job rows already in ``vector_cache`` are not re-vectorized.
+
+    With ``score=False`` pages are only deduplicated and filtered: ``matched``
+    still counts the jobs passing the filters, for callers that rank the final
+    job list themselves (e.g. with a ScoreMatrix).
+    """
+
+    def __init__(
+        self,
+        profile: Profile,
+        prefs: Preferences,
+        near_duplicate_threshold: float | None = None,
+        text_model: TextModel | None = None,
+        vector_cache: JobCache | None = None,
+        score: bool = True,
+    ):
+        self.profile = profile
+        self.prefs = prefs
+        self.text_model = text_model
+        self.vector_cache = vector_cache
+        self.score = score
+        self.fetched = 0
+        self._dedup = StreamingDeduplicator(near_duplicate_threshold)
+        self._rows: dict[str, ScoredJob] = {}
+
+    def push(self, jobs: list[Job]) -> list[ScoredJob]:
+        self.fetched += len(jobs)
+        fresh = self._dedup.add(jobs)
+        for job in fresh:
+            self._rows.pop(self._dedup.group_key(job), None)
+        passed = apply_hard_filters(fresh, self.prefs)
+        if not self.score:
+            for job in passed:
+                self._rows[self._dedup.group_key(job)] = (job, 0.0, {})
+            return []
+        scored = score_jobs(passed, self.profile, self.prefs, self.text_model, self.vector_cache)
+        for row in scored:
+            self._rows[self._dedup.group_key(row[0])] = row
+        return scored
+
+    def jobs(self) -> list[Job]:
+        """Every unique job seen so far, whether or not it passed the filters."""
+        return self._dedup.jobs()
+
+    @property
+    def matched(self) -> int:
+        """Number of jobs that passed the filters so far."""
+        return len(self._rows)
+
+    def results(self, top_k: int | None = None) -> list[ScoredJob]:
+        if top_k is not None:
+            return heapq.nlargest(top_k, self._rows.values(), key=lambda x: x[1])
+        return sorted(self._rows.values(), key=lambda x: x[1], reverse=True)
+
+    def finalize(self) -> list[ScoredJob]:
+        if self.text_model is not None:
+            return self.results()
+        scored = score_jobs([row[0] for row in self._rows.values()], self.profile, self.prefs)
+        self._rows = {self._dedup.group_key(row[0]): row for row in scored}
+        return scored
+
+
+def stream_pages(
+    connectors: list[BaseConnector],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    total_timeout: float | None = None,
+    connector_timeout: float | None = None,
+) -> Iterator[PipelineUpdate]:
+    """Yield pages from all connectors in arrival order.
+
+    Producer threads block once ``queue_size`` pages are waiting, so the number
+    of raw pages held in memory stays bounded no matter how large the sources are.
+
+    ``connector_timeout`` is counted from the moment a connector starts running.
+    A connector still running when it runs out is abandoned: its later pages are
+    dropped, an error update and its done update are yielded, and a new worker
+    takes over the remaining connectors. The old thread runs the connector to
+    the end in the background, so a cached connector still stores its result
+    for the next search.
+    """
+    pages: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    todo: queue.SimpleQueue = queue.SimpleQueue()
+    for i, connector in enumerate(connectors):
+        todo.put((i, connector))
+    started: dict[int, float] = {}
+    abandoned: set[int] = set()
+
+    def put(i: int, item: PipelineUpdate) -> bool:
+        while not stop.is_set() and i not in abandoned:
+            try:
+                pages.put((i, item), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker() -> None:
+        while not stop.is_set():
+            try:
+                i, connector = todo.get_nowait()
+            except queue.Empty:
+                return
+            started[i] = time.monotonic()
+            try:
+                for page in connector.iter_jobs():
+                    if not put(i, PipelineUpdate(source=connector.name, jobs=page)) and i not in abandoned:
+                        break
+            except Exception as e:
+                put(i, PipelineUpdate(source=connector.name, error=str(e) or e.__class__.__name__))
+            put(i, PipelineUpdate(source=connector.name, done=True))
+
+    def spawn() -> None:
+        threading.Thread(target=worker, daemon=True).start()
+
+    for _ in range(max(1, min(max_workers, len(connectors)))):
+        spawn()
+
+    deadline = time.monotonic() + total_timeout if total_timeout is not None else None
+    remaining = len(connectors)
+    finished: set[int] = set()
+    try:
+        while remaining:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                yield PipelineUpdate(source="", error=f"timed out (global budget {total_timeout:.0f}s exhausted)")
+                return
+            if connector_timeout is not None:
+                for i, start in list(started.items()):
+                    if i in finished or i in abandoned or now - start < connector_timeout:
+                        continue
+                    abandoned.add(i)
+                    remaining -= 1
+                    if not todo.empty():
+                        spawn()
+                    name = connectors[i].name
+                    yield PipelineUpdate(source=name, error=f"timed out after {connector_timeout:.0f}s")
+                    yield PipelineUpdate(source=name, done=True)
+                if not remaining:
+                    return
+            timeout = None if deadline is None else deadline - now
+            if connector_timeout is not None:
+                timeout = _POLL_INTERVAL if timeout is None else min(timeout, _POLL_INTERVAL)
+            try:
+                i, update = pages.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            if i in abandoned:
+                continue
+            if update.done:
+                finished.add(i)
+                remaining -= 1
+            yield update
+    finally:
+        stop.set()
+
+
+def run_pipeline(
+    pipeline: MatchPipeline,
+    connectors: list[BaseConnector],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    total_timeout: float | None = None,
+    connector_timeout: float | None = None,
+) -> Iterator[PipelineUpdate]:
+    """Fetch, dedup, filter and score as pages arrive.
+
+    Each yielded update carries the rows scored from one page while ``pipeline``
+    holds the running ranking. Call ``pipeline.finalize()`` once the stream ends.
+    """
+    for update in stream_pages(
+        connectors, max_workers=max_workers, total_timeout=total_timeout, connector_timeout=connector_timeout,
+    ):
+        if update.jobs:
+            update.scored = pipeline.push(update.jobs)
+        yield update
@@ -0,0 +1,179 @@
+"""Sub-scores of a search's jobs kept as matrix columns for re-ranking.
+
+Each column is tagged with a fingerprint of the inputs it was computed from,
+so a preference change recomputes preference_fit (and the hard-filter mask), a
+CV change recomputes text_similarity and skill_overlap, and new weights are a
+single matrix-vector product. A matrix can be seeded with rows scored while
+the search streamed in, so they are not scored again.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.matching.columnar import JobTable, top_indices
+from src.matching.filters import _HARD_FILTER_FIELDS, apply_hard_filters
+from src.matching.scorer import WEIGHTS, _compute_text_similarities
+from src.matching.skills import skill_matcher
+from src.matching.text_model import job_text
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.utils.text import normalize_for_matching
+
+if TYPE_CHECKING:
+    from src.matching.text_model import TextModel
+    from src.storage.cache import JobCache
+
+COLUMNS = tuple(WEIGHTS)
+# Recency is recomputed at most this often (its buckets are whole days).
+RECENCY_RESOLUTION = 3600
+# Preference fields that _preference_fit_score reads.
+_PREFERENCE_FIT_FIELDS = ("target_titles", "remote_types", "locations", "industries")
+_FILTERS = "filters"
+
+ScoredJob = tuple[Job, float, dict[str, float]]
+
+
+class ScoreMatrix:
+    """Sub-scores of ``jobs`` as an (n, len(COLUMNS)) matrix, plus a hard-filter mask."""
+
+    def __init__(
+        self,
+        jobs: list[Job],
+        text_model: TextModel | None = None,
+        vector_cache: JobCache | None = None,
+    ):
+        self.jobs = list(jobs)
+        self.text_model = text_model
+        self.vector_cache = vector_cache
+        self.values = np.zeros((len(self.jobs), len(COLUMNS)))
+        self.mask = np.ones(len(self.jobs), dtype=bool)
+        # Rows whose columns hold scores for the current inputs.
+        self._scored = np.ones(len(self.jobs), dtype=bool)
+        self.profile: Profile | None = None
+        self.prefs: Preferences | None = None
+        self._now = 0.0
+        self._inputs: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def _fingerprints(self, profile: Profile, prefs: Preferences, now: float) -> dict[str, str]:
+        data = prefs.to_dict()
+        version = self.text_model.version if self.text_model is not None else ""
+        return {
+            _FILTERS: _fingerprint({k: data[k] for k in _HARD_FILTER_FIELDS}),
+            "text_similarity": _fingerprint([profile.raw_text, version]),
+            "skill_overlap": _fingerprint(sorted(profile.skills_lower())),
+            "preference_fit": _fingerprint({k: data[k] for k in _PREFERENCE_FIT_FIELDS}),
+            "recency": _fingerprint(now // RECENCY_RESOLUTION),
+        }
+
+    def seed(self, rows: list[ScoredJob], profile: Profile, prefs: Preferences, now: float | None = None) -> None:
+        """Take sub-scores already computed for ``profile`` and ``prefs`` (e.g. by MatchPipeline).
+
+        Jobs without a row are taken to fail the hard filters and are scored only
+        if a later update lets them through. Text scores are kept only when they
+        came from the matrix's ``text_model``.
+        """
+        now = time.time() if now is None else now
+        self.profile, self.prefs, self._now = profile, prefs, now
+        position = {job.id: i for i, job in enumerate(self.jobs)}
+        self.mask[:] = False
+        self._scored[:] = False
+        for job, _, sub_scores in rows:
+            i = position.get(job.id)
+            if i is None or not sub_scores:
+                continue
+            self.values[i] = [sub_scores[name] for name in COLUMNS]
+            self.mask[i] = self._scored[i] = True
+        self._inputs = self._fingerprints(profile, prefs, now)
+        if self.text_model is None:
+            # Rows were scored against per-page TF-IDF fits; refit over all jobs.
+            del self._inputs["text_similarity"]
+
+    def update(self, profile: Profile, prefs: Preferences, now: float | None = None) -> set[str]:
+        """Recompute the columns whose inputs changed and return their names."""
+        now = time.time() if now is None else now
+        self.profile, self.prefs, self._now = profile, prefs, now
+        fingerprints = self._fingerprints(profile, prefs, now)
+        stale = {name for name, fp in fingerprints.items() if self._inputs.get(name) != fp}
+        if stale:
+            if _FILTERS in stale:
+                self._compute({_FILTERS}, np.arange(len(self.jobs)))
+            self._compute(stale - {_FILTERS}, np.flatnonzero(self._scored))
+            unscored = np.flatnonzero(self.mask & ~self._scored)
+            self._compute(set(COLUMNS), unscored)
+            self._scored[unscored] = True
+            self._inputs = fingerprints
+        return stale
+
+    def replace(self, updated: dict[str, Job]) -> None:
+        """Swap in the jobs in ``updated`` (keyed by id) and recompute just their rows."""
+        rows = np.array([i for i, job in enumerate(self.jobs) if job.id in updated], dtype=np.intp)
+        if not len(rows):
+            return
+        for i in rows.tolist():
+            self.jobs[i] = updated[self.jobs[i].id]
+        if self._inputs:
+            self._compute(set(self._inputs), rows)
+            self._scored[rows] = True
+
+    def _compute(self, names: set[str], rows: np.ndarray) -> None:
+        if not len(rows) or not names:
+            return
+        profile, prefs = self.profile, self.prefs
+        jobs = [self.jobs[i] for i in rows.tolist()]
+        if _FILTERS in names:
+            passed = {job.id for job in apply_hard_filters(jobs, prefs)}
+            self.mask[rows] = [job.id in passed for job in jobs]
+        if names.isdisjoint(COLUMNS):
+            return
+        table = JobTable(jobs, skill_matcher(frozenset(profile.skills_lower())))
+        for name in names & set(COLUMNS):
+            if name == "text_similarity":
+                column = self._text_similarities(jobs, partial=len(jobs) < len(self.jobs))
+            elif name == "skill_overlap":
+                column = table.skill_overlap()
+            elif name == "preference_fit":
+                column = table.preference_fit(prefs)
+            else:
+                column = table.recency(self._now)
+            self.values[rows, COLUMNS.index(name)] = column
+
+    def _text_similarities(self, jobs: list[Job], partial: bool) -> list[float]:
+        cv_text = normalize_for_matching(self.profile.raw_text)
+        if self.text_model is not None:
+            return self.text_model.job_similarities(cv_text, jobs, self.vector_cache)
+        # Without a saved model, keep fitting on the whole job list so
+        # recomputed rows stay comparable with the rest.
+        fit_texts = [job_text(j) for j in self.jobs] if partial else None
+        return _compute_text_similarities(cv_text, [job_text(j) for j in jobs], fit_texts=fit_texts)
+
+    def passing(self) -> list[Job]:
+        """Jobs passing the hard filters, in input order."""
+        return [self.jobs[i] for i in np.flatnonzero(self.mask).tolist()]
+
+    def totals(self, weights: dict[str, float] | None = None) -> np.ndarray:
+        weights = WEIGHTS if weights is None else weights
+        return self.values @ np.array([weights[name] for name in COLUMNS])
+
+    def ranked(self, weights: dict[str, float] | None = None, top_k: int | None = None) -> list[ScoredJob]:
+        """Jobs passing the hard filters as ``(job, total, sub_scores)``, best first."""
+        rows = np.flatnonzero(self.mask)
+        totals = self.totals(weights)[rows]
+        order = top_indices(totals, len(rows) if top_k is None else top_k)
+        rows = rows[order]
+        return [
+            (self.jobs[i], total, dict(zip(COLUMNS, values)))
+            for i, total, values in zip(rows.tolist(), totals[order].tolist(), self.values[rows].tolist())
+        ]
+
+
+def _fingerprint(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
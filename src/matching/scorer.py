@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import heapq
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
+from src.matching.skills import SkillMatcher, skill_matcher
+from src.matching.text_model import job_text
 from src.models.job import Job
-from src.models.profile import Profile
 from src.models.preferences import Preferences
+from src.models.profile import Profile
 from src.utils.text import normalize_for_matching
 
+if TYPE_CHECKING:
+    from src.matching.text_model import TextModel
+    from src.storage.cache import JobCache
+
 WEIGHTS = {
     "text_similarity": 0.35,
     "skill_overlap": 0.30,
@@ -14,69 +22,140 @@ WEIGHTS = {
     "recency": 0.15,
 }
 
+# (age in days below which, recency score) from newest to oldest.
+RECENCY_BUCKETS = ((1, 1.0), (3, 0.9), (7, 0.7), (14, 0.5), (30, 0.3))
+RECENCY_OLD = 0.1
+RECENCY_UNKNOWN = 0.3
+# Job locations that count as a partial match for any preferred location.
+ANYWHERE_LOCATIONS = ("worldwide", "anywhere", "global", "")
+# From this many jobs score_jobs uses the columnar path by default.
+COLUMNAR_MIN_JOBS = 256
+
 
 def score_jobs(
     jobs: list[Job],
     profile: Profile,
     prefs: Preferences,
+    text_model: TextModel | None = None,
+    vector_cache: JobCache | None = None,
+    columnar: bool | None = None,
+    top_k: int | None = None,
 ) -> list[tuple[Job, float, dict[str, float]]]:
+    """Score and rank ``jobs`` against the profile.
+
+    With a ``text_model`` its saved vocabulary and idf are used, and job rows
+    stored in ``vector_cache`` are reused; otherwise TF-IDF is fitted on the CV
+    and ``jobs`` themselves. ``columnar`` computes the sub-scores with NumPy
+    over a JobTable (by default from COLUMNAR_MIN_JOBS jobs); results are the
+    same either way. With ``top_k`` only the best ``top_k`` rows are returned,
+    selected without sorting the rest.
+    """
     if not jobs or profile.is_empty:
-        return [(j, 0.0, {}) for j in jobs]
+        return [(j, 0.0, {}) for j in jobs[:top_k]]
 
     cv_text = normalize_for_matching(profile.raw_text)
-    job_texts = [normalize_for_matching(j.title + " " + j.description) for j in jobs]
-
-    text_sims = _compute_text_similarities(cv_text, job_texts)
-    profile_skills = profile.skills_lower()
-
-    results: list[tuple[Job, float, dict[str, float]]] = []
+    if text_model is not None:
+        text_sims = text_model.job_similarities(cv_text, jobs, vector_cache)
+    else:
+        text_sims = _compute_text_similarities(cv_text, [job_text(j) for j in jobs])
+    skills = skill_matcher(frozenset(profile.skills_lower()))
+
+    if columnar is None:
+        columnar = len(jobs) >= COLUMNAR_MIN_JOBS
+    if columnar:
+        from src.matching.columnar import JobTable
+
+        table = JobTable(jobs, skills)
+        scores = table.sub_scores(text_sims, prefs)
+        return table.rows(scores, table.total(scores), ranked=True, top_k=top_k)
+
+    results = [_score_job(job, text_sims[i], skills, prefs) for i, job in enumerate(jobs)]
+    if top_k is not None:
+        return heapq.nlargest(top_k, results, key=lambda x: x[1])
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results
 
-    for i, job in enumerate(jobs):
-        scores: dict[str, float] = {}
 
-        scores["text_similarity"] = text_sims[i]
-        scores["skill_overlap"] = _skill_overlap_score(job, profile_skills)
-        scores["preference_fit"] = _preference_fit_score(job, prefs)
-        scores["recency"] = _recency_score(job)
+def rescore_jobs(
+    scored: list[tuple[Job, float, dict[str, float]]],
+    updated: dict[str, Job],
+    profile: Profile,
+    prefs: Preferences,
+    text_model: TextModel | None = None,
+    vector_cache: JobCache | None = None,
+) -> list[tuple[Job, float, dict[str, float]]]:
+    """Swap in the jobs in ``updated`` (keyed by id) and rescore only those rows.
 
-        total = sum(WEIGHTS[k] * scores[k] for k in WEIGHTS)
-        results.append((job, total, scores))
+    Without a ``text_model`` TF-IDF is fitted on the same corpus as the original
+    ranking, so the text scores of untouched rows stay comparable with the
+    rescored ones.
+    """
+    positions = [i for i, row in enumerate(scored) if row[0].id in updated]
+    if not positions or profile.is_empty:
+        return scored
 
+    cv_text = normalize_for_matching(profile.raw_text)
+    new_jobs = [updated[scored[i][0].id] for i in positions]
+    if text_model is not None:
+        text_sims = text_model.job_similarities(cv_text, new_jobs, vector_cache)
+    else:
+        corpus = [job_text(row[0]) for row in scored]
+        text_sims = _compute_text_similarities(cv_text, [job_text(j) for j in new_jobs], fit_texts=corpus)
+    skills = skill_matcher(frozenset(profile.skills_lower()))
+
+    results = list(scored)
+    for i, job, sim in zip(positions, new_jobs, text_sims):
+        results[i] = _score_job(job, sim, skills, prefs)
     results.sort(key=lambda x: x[1], reverse=True)
     return results
 
 
-def _compute_text_similarities(cv_text: str, job_texts: list[str]) -> list[float]:
+def _score_job(
+    job: Job, text_sim: float, skills: SkillMatcher, prefs: Preferences
+) -> tuple[Job, float, dict[str, float]]:
+    scores: dict[str, float] = {}
+
+    scores["text_similarity"] = text_sim
+    scores["skill_overlap"] = _skill_overlap_score(job, skills)
+    scores["preference_fit"] = _preference_fit_score(job, prefs)
+    scores["recency"] = _recency_score(job)
+
+    total = sum(WEIGHTS[k] * scores[k] for k in WEIGHTS)
+    return job, total, scores
+
+
+def _compute_text_similarities(
+    cv_text: str, job_texts: list[str], fit_texts: list[str] | None = None
+) -> list[float]:
+    """Cosine similarity of each job text to the CV.
+
+    The vectorizer is fitted on the CV plus ``fit_texts`` (the job texts
+    themselves by default).
+    """
     if not cv_text.strip() or not job_texts:
         return [0.0] * len(job_texts)
 
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
 
-    corpus = [cv_text] + job_texts
     try:
         vectorizer = TfidfVectorizer(max_features=5000, stop_words="english")
-        tfidf_matrix = vectorizer.fit_transform(corpus)
-        sims = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
+        if fit_texts is None:
+            tfidf_matrix = vectorizer.fit_transform([cv_text] + job_texts)
+            cv_vec, job_vecs = tfidf_matrix[0:1], tfidf_matrix[1:]
+        else:
+            cv_vec = vectorizer.fit_transform([cv_text] + fit_texts)[0:1]
+            job_vecs = vectorizer.transform(job_texts)
+        sims = cosine_similarity(cv_vec, job_vecs).flatten()
         return [float(s) for s in sims]
     except ValueError:
         return [0.0] * len(job_texts)
 
 
-def _skill_overlap_score(job: Job, profile_skills: set[str]) -> float:
-    if not profile_skills:
+def _skill_overlap_score(job: Job, skills: SkillMatcher) -> float:
+    if not len(skills):
         return 0.0
-    job_tags = {t.lower() for t in job.tags}
-    job_desc_lower = job.description.lower()
-
-    matches = 0
-    for skill in profile_skills:
-        if skill in job_tags or skill in job_desc_lower:
-            matches += 1
-
-    if not profile_skills:
-        return 0.0
-    return min(matches / len(profile_skills), 1.0)
+    return min(len(skills.job_hits(job)) / len(skills), 1.0)
 
 
 def _preference_fit_score(job: Job, prefs: Preferences) -> float:
@@ -91,18 +170,11 @@ def _preference_fit_score(job: Job, prefs: Preferences) -> float:
 
     if prefs.remote_types:
         checks += 1
-        if job.remote_type in prefs.remote_types:
-            score += 1.0
-        elif job.remote_type == "remote" and "hybrid" in prefs.remote_types:
-            score += 0.5
+        score += _remote_fit(job.remote_type, prefs)
 
     if prefs.locations:
         checks += 1
-        job_loc = job.location.lower()
-        if any(loc.lower() in job_loc for loc in prefs.locations):
-            score += 1.0
-        elif job_loc in ("worldwide", "anywhere", "global", ""):
-            score += 0.7
+        score += _location_fit(job.location.lower(), prefs)
 
     if prefs.industries:
         checks += 1
@@ -113,9 +185,25 @@ def _preference_fit_score(job: Job, prefs: Preferences) -> float:
     return score / max(checks, 1)
 
 
+def _remote_fit(remote_type: str, prefs: Preferences) -> float:
+    if remote_type in prefs.remote_types:
+        return 1.0
+    if remote_type == "remote" and "hybrid" in prefs.remote_types:
+        return 0.5
+    return 0.0
+
+
+def _location_fit(job_loc: str, prefs: Preferences) -> float:
+    if any(loc.lower() in job_loc for loc in prefs.locations):
+        return 1.0
+    if job_loc in ANYWHERE_LOCATIONS:
+        return 0.7
+    return 0.0
+
+
 def _recency_score(job: Job) -> float:
     if not job.published_at:
-        return 0.3
+        return RECENCY_UNKNOWN
 
     now = datetime.now(timezone.utc)
     pub = job.published_at
@@ -123,14 +211,7 @@ def _recency_score(job: Job) -> float:
         pub = pub.replace(tzinfo=timezone.utc)
 
     age = now - pub
-    if age < timedelta(days=1):
-        return 1.0
-    if age < timedelta(days=3):
-        return 0.9
-    if age < timedelta(days=7):
-        return 0.7
-    if age < timedelta(days=14):
-        return 0.5
-    if age < timedelta(days=30):
-        return 0.3
-    return 0.1
+    for days, score in RECENCY_BUCKETS:
+        if age < timedelta(days=days):
+            return score
+    return RECENCY_OLD
@@ -0,0 +1,100 @@
+"""Find which of a profile's skills a job mentions, in one pass over its text.
+
+Text is split into words, single punctuation characters (``+`` and ``#``
+stay part of a word, so ``c++`` and ``c#`` are whole tokens) and one space
+token per run of whitespace. Skills are token sequences in a trie, so ``go``
+matches "Go" but not "good", and ``node.js``, ``ci/cd`` and ``machine
+learning`` match only with that punctuation and spacing between their words:
+"node. js" or "team. Net" do not match ``node.js`` or ``.net``.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
+
+from src.models.job import Job
+
+HITS_MEMO_SIZE = 4096
+
+# Applied to text whose whitespace runs are already single spaces.
+_TOKEN = re.compile(r"[a-z0-9]+[+#]*|[^a-z0-9]")
+# Marks the trie node at which a skill ends.
+_END = ""
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(" ".join(text.lower().split()))
+
+
+class SkillMatcher:
+    """Token trie over a fixed set of skills, with memoized hits per job."""
+
+    def __init__(self, skills: Iterable[str]):
+        self.skills = frozenset(s.strip().lower() for s in skills if s.strip())
+        # One-token skills are found by set intersection; only longer ones walk the trie.
+        self._single: dict[str, str] = {}
+        self._trie: dict = {}
+        for skill in self.skills:
+            tokens = tokenize(skill)
+            if len(tokens) == 1:
+                self._single[tokens[0]] = skill
+                continue
+            node = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_END] = skill
+        self._starts = frozenset(self._single) | frozenset(self._trie)
+        self._hits: OrderedDict[tuple[str, str, str], frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find(self, text: str) -> frozenset[str]:
+        """Every skill occurring in ``text`` as whole tokens."""
+        if not self._starts:
+            return frozenset()
+        tokens = tokenize(text)
+        present = self._starts.intersection(tokens)
+        found = {self._single[t] for t in present if t in self._single}
+        trie = self._trie
+        if trie.keys().isdisjoint(present):
+            return frozenset(found)
+        for start in [i for i, token in enumerate(tokens) if token in trie]:
+            node = trie[tokens[start]]
+            i = start + 1
+            while node is not None:
+                skill = node.get(_END)
+                if skill is not None:
+                    found.add(skill)
+                if i == len(tokens):
+                    break
+                node = node.get(tokens[i])
+                i += 1
+        return frozenset(found)
+
+    def job_hits(self, job: Job) -> frozenset[str]:
+        """Skills in the job's tags, title or description."""
+        key = (job.id, job.title, job.description)
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is not None:
+                self._hits.move_to_end(key)
+                return hits
+        tags = {t.lower() for t in job.tags}
+        hits = (self.skills & tags) | self.find(job.title + " " + job.description)
+        with self._lock:
+            self._hits[key] = hits
+            while len(self._hits) > HITS_MEMO_SIZE:
+                self._hits.popitem(last=False)
+        return hits
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+
+@lru_cache(maxsize=32)
+def skill_matcher(skills: frozenset[str]) -> SkillMatcher:
+    """Shared matcher per skill set, so scoring and explanation reuse its hits."""
+    return SkillMatcher(skills)
@@ -0,0 +1,200 @@
+"""TF-IDF model fitted on the cached job corpus and kept on disk.
+
+Scoring with a saved model only transforms the CV and the job texts, so a
+search no longer refits vocabulary and idf, and a job's text score does not
+depend on which other jobs the search happened to return. The model is fitted
+on public job listings only; the CV is never part of the corpus.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.models.job import Job
+from src.storage.cache import DEFAULT_DB_PATH, JobCache
+from src.utils.text import normalize_for_matching
+
+DEFAULT_MODEL_PATH = DEFAULT_DB_PATH.parent / "text_model.npz"
+MAX_FEATURES = 5000
+REFIT_SECONDS = 7 * 24 * 3600
+# Below this many cached listings the idf is too noisy to be worth saving.
+MIN_CORPUS_SIZE = 200
+
+
+def job_text(job: Job) -> str:
+    return normalize_for_matching(job.title + " " + job.description)
+
+
+def _vectorizer(**kwargs):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(max_features=MAX_FEATURES, stop_words="english", **kwargs)
+
+
+class TextModel:
+    """A fitted TF-IDF vocabulary and idf, with a version derived from both."""
+
+    def __init__(self, terms: list[str], idf: np.ndarray, fitted_at: float, n_docs: int):
+        self.terms = list(terms)
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.fitted_at = fitted_at
+        self.n_docs = n_docs
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update("\n".join(self.terms).encode("utf-8"))
+        digest.update(self.idf.tobytes())
+        self.version = digest.hexdigest()
+        self._vectorizer = _vectorizer(vocabulary={t: i for i, t in enumerate(self.terms)})
+        self._vectorizer.idf_ = self.idf
+
+    @classmethod
+    def fit(cls, texts: list[str]) -> TextModel | None:
+        """Fit on ``texts``; None if they yield no vocabulary."""
+        vectorizer = _vectorizer()
+        try:
+            vectorizer.fit(texts)
+        except ValueError:
+            return None
+        return cls(list(vectorizer.get_feature_names_out()), vectorizer.idf_, time.time(), len(texts))
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fitted_at
+
+    def transform(self, texts: list[str]):
+        """L2-normalised TF-IDF rows as a CSR matrix."""
+        return self._vectorizer.transform(texts)
+
+    def similarities(self, cv_text: str, job_texts: list[str]) -> list[float]:
+        """Cosine similarity of each job text to the CV."""
+        if not cv_text.strip() or not job_texts:
+            return [0.0] * len(job_texts)
+        cv_vec = self.transform([cv_text])
+        sims = (self.transform(job_texts) @ cv_vec.T).toarray().ravel()
+        return [float(s) for s in sims]
+
+    def job_similarities(self, cv_text: str, jobs: list[Job], cache: JobCache | None = None) -> list[float]:
+        """Like ``similarities``, for jobs whose rows may be stored in ``cache``."""
+        if not cv_text.strip() or not jobs:
+            return [0.0] * len(jobs)
+        cv_vec = self.transform([cv_text]).astype(np.float32)
+        sims = (self.job_matrix(jobs, cache) @ cv_vec.T).toarray().ravel()
+        return [float(s) for s in sims]
+
+    def job_matrix(self, jobs: list[Job], cache: JobCache | None = None):
+        """TF-IDF rows of ``jobs`` as a float32 CSR matrix.
+
+        Rows stored in ``cache`` for the same content and model version are
+        reused as is; a stored text from an older model version is only
+        re-transformed. New rows are written back.
+        """
+        from scipy.sparse import csr_matrix
+
+        hashes = {job.id: job.content_hash for job in jobs}
+        stored = cache.get_vectors(hashes) if cache is not None else {}
+        rows: list[tuple[np.ndarray, np.ndarray] | None] = [None] * len(jobs)
+        todo: list[int] = []
+        texts: list[str] = []
+        for i, job in enumerate(jobs):
+            entry = stored.get(job.id)
+            if entry is not None and entry[1] == self.version:
+                rows[i] = (np.frombuffer(entry[2], dtype=np.int32), np.frombuffer(entry[3], dtype=np.float32))
+            else:
+                todo.append(i)
+                texts.append(entry[0] if entry is not None else job_text(job))
+
+        if todo:
+            fresh = self.transform(texts).astype(np.float32)
+            new_vectors = {}
+            for k, i in enumerate(todo):
+                start, end = fresh.indptr[k], fresh.indptr[k + 1]
+                indices = fresh.indices[start:end].astype(np.int32)
+                values = fresh.data[start:end]
+                rows[i] = (indices, values)
+                job = jobs[i]
+                new_vectors[job.id] = (
+                    hashes[job.id], (texts[k], self.version, indices.tobytes(), values.tobytes()),
+                )
+            if cache is not None:
+                cache.store_vectors(new_vectors)
+
+        indptr = np.zeros(len(jobs) + 1, dtype=np.int64)
+        np.cumsum([len(r[0]) for r in rows], out=indptr[1:])
+        indices = np.concatenate([r[0] for r in rows]) if rows else np.empty(0, dtype=np.int32)
+        values = np.concatenate([r[1] for r in rows]) if rows else np.empty(0, dtype=np.float32)
+        return csr_matrix((values, indices, indptr), shape=(len(jobs), len(self.terms)))
+
+    def save(self, path: Path | str = DEFAULT_MODEL_PATH) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                terms=np.array(self.terms, dtype=str),
+                idf=self.idf,
+                meta=np.array([self.fitted_at, self.n_docs], dtype=np.float64),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path | str = DEFAULT_MODEL_PATH) -> TextModel | None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                fitted_at, n_docs = data["meta"]
+                return cls(data["terms"].tolist(), data["idf"], float(fitted_at), int(n_docs))
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+_loaded: dict[Path, tuple[int, TextModel]] = {}
+_loaded_lock = threading.Lock()
+
+
+def _load(path: Path) -> TextModel | None:
+    """Load ``path``, reusing the previous result while the file is unchanged."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    with _loaded_lock:
+        hit = _loaded.get(path)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+    model = TextModel.load(path)
+    if model is not None:
+        with _loaded_lock:
+            _loaded[path] = (mtime, model)
+    return model
+
+
+def load_text_model(
+    cache: JobCache,
+    path: Path | str = DEFAULT_MODEL_PATH,
+    max_age: float = REFIT_SECONDS,
+    min_docs: int = MIN_CORPUS_SIZE,
+) -> TextModel | None:
+    """The saved model, refitted on ``cache``'s listings once it is ``max_age`` old.
+
+    Returns None until the cache holds ``min_docs`` listings; callers then fit
+    per search as before. A stale model is kept if refitting is not possible.
+    """
+    path = Path(path)
+    model = _load(path)
+    if model is not None and model.age < max_age:
+        return model
+    texts = [job_text(job) for job in cache.iter_jobs()]
+    if len(texts) < min_docs:
+        return model
+    fitted = TextModel.fit(texts)
+    if fitted is None:
+        return model
+    fitted.save(path)
+    with _loaded_lock:
+        _loaded[path] = (path.stat().st_mtime_ns, fitted)
+    return fitted
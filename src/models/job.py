@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from src.utils.canonical import canonical_key
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -25,6 +28,11 @@ class Job:
     tags: list[str] = field(default_factory=list)
     published_at: datetime | None = None
     fetched_at: datetime = field(default_factory=_utcnow)
+    # Canonical company::title::remote_type, computed once at construction (see src/utils/canonical.py).
+    canonical_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.canonical_key = canonical_key(self.company, self.title, self.remote_type)
 
     @property
     def display_salary(self) -> str:
@@ -38,6 +46,13 @@ class Job:
 
     @property
     def dedup_key(self) -> str:
-        title_norm = self.title.lower().strip()
-        company_norm = self.company.lower().strip()
-        return f"{company_norm}::{title_norm}"
+        return self.canonical_key
+
+    @property
+    def content_hash(self) -> str:
+        """Digest of the posting's user-visible content; changes when the listing is edited."""
+        parts = (
+            self.title, self.company, self.description, self.location, self.remote_type,
+            str(self.salary_min), str(self.salary_max), self.salary_currency, ",".join(self.tags),
+        )
+        return hashlib.blake2b("\x1f".join(parts).encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
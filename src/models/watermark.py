@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from src.models.job import Job
+
+
+def ensure_utc(dt: datetime) -> datetime:
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def numeric_id(job_id: str) -> int | None:
+    """Trailing numeric part of a job id (``reed-12345`` -> 12345), if any."""
+    tail = job_id.rsplit("-", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+@dataclass
+class Watermark:
+    """High-water mark of what a source has already returned.
+
+    Timestamps are often only day or second precise, so the ids seen at exactly
+    ``published_at`` are kept too: a new posting sharing that timestamp is not
+    mistaken for a known one.
+    """
+
+    published_at: datetime | None = None
+    max_id: int | None = None
+    boundary_ids: frozenset[str] = field(default_factory=frozenset)
+
+    def is_known(self, job: Job) -> bool:
+        if self.published_at is not None and job.published_at is not None:
+            published, mark = ensure_utc(job.published_at), ensure_utc(self.published_at)
+            return published < mark or (published == mark and job.id in self.boundary_ids)
+        if self.max_id is not None:
+            n = numeric_id(job.id)
+            if n is not None:
+                return n <= self.max_id
+        return False
+
+    def page_is_known(self, page: list[Job]) -> bool:
+        return bool(page) and all(self.is_known(j) for j in page)
+
+    def advance(self, jobs: list[Job]) -> Watermark:
+        published = self.published_at
+        boundary = set(self.boundary_ids)
+        max_id = self.max_id
+        for job in jobs:
+            if job.published_at is not None:
+                if published is None or ensure_utc(job.published_at) > ensure_utc(published):
+                    published = job.published_at
+                    boundary = {job.id}
+                elif ensure_utc(job.published_at) == ensure_utc(published):
+                    boundary.add(job.id)
+            n = numeric_id(job.id)
+            if n is not None and (max_id is None or n > max_id):
+                max_id = n
+        return Watermark(published_at=published, max_id=max_id, boundary_ids=frozenset(boundary))
+
+    def to_dict(self) -> dict:
+        return {
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "max_id": self.max_id,
+            "boundary_ids": sorted(self.boundary_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Watermark:
+        published = None
+        if data.get("published_at"):
+            try:
+                published = datetime.fromisoformat(data["published_at"])
+            except (ValueError, TypeError):
+                pass
+        return cls(
+            published_at=published,
+            max_id=data.get("max_id"),
+            boundary_ids=frozenset(data.get("boundary_ids") or ()),
+        )
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import os
-from datetime import datetime
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timezone
 
 from src.models.job import Job
-from src.sources.base import BaseConnector
-from src.utils.http_client import SafeHttpClient
+from src.models.watermark import ensure_utc
+from src.sources.base import BaseConnector, aiter_concurrently, iter_concurrently
+from src.utils.http_client import AsyncSafeHttpClient, SafeHttpClient
+from src.utils.http_retry import RateLimit
 from src.utils.text import clean_html
 
 BASE_URL = "https://api.adzuna.com/v1/api/jobs"
+PAGE_SIZE = 50
+DEFAULT_MAX_PAGES = 3
 
 COUNTRY_CODE_MAP = {
     "UK": "gb", "US": "us", "AU": "au", "BR": "br", "CA": "ca",
@@ -30,103 +35,190 @@ class AdzunaConnector(BaseConnector):
     """Adzuna -- covers UK, US, EU, AU and more. Free API (register at developer.adzuna.com)."""
 
     name = "adzuna"
-
-    def __init__(self, keywords: str = "", location: str = "", country: str = "UK"):
+    supports_watermark = True
+    # Adzuna's free tier allows 25 requests per minute.
+    rate_limit = RateLimit(rate=25 / 60, burst=8)
+
+    def __init__(
+        self,
+        keywords: str = "",
+        location: str = "",
+        country: str = "UK",
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ):
         self.keywords = keywords
         self.location = location
         self.country = country.upper()
+        self.max_pages = max_pages
 
     @staticmethod
     def is_available() -> bool:
         return _get_credentials() is not None
 
-    def fetch_jobs(self) -> list[Job]:
+    @property
+    def newest_first(self) -> bool:
+        # Incremental fetches ask Adzuna to sort by date (see _params).
+        return self.since is not None and self.since.published_at is not None
+
+    def iter_jobs(self) -> Iterator[list[Job]]:
         creds = _get_credentials()
         if not creds:
-            return []
+            return
 
-        app_id, app_key = creds
         adzuna_country = COUNTRY_CODE_MAP.get(self.country, "gb")
 
-        jobs: list[Job] = []
-        max_pages = 3
-
-        with SafeHttpClient() as client:
-            for page in range(1, max_pages + 1):
-                url = f"{BASE_URL}/{adzuna_country}/search/{page}"
-                params: dict = {
-                    "app_id": app_id,
-                    "app_key": app_key,
-                    "results_per_page": 50,
-                    "content-type": "application/json",
-                }
-                if self.keywords:
-                    params["what"] = self.keywords
-                if self.location:
-                    params["where"] = self.location
-
-                resp = client.get(url, params=params)
+        with SafeHttpClient(shared=True, **self.http_options()) as client:
+            def fetch_page(page: int) -> dict:
+                resp = client.get(self._url(adzuna_country, page), params=self._params(creds))
                 resp.raise_for_status()
-                data = resp.json()
-
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                for item in results:
-                    published = None
-                    if item.get("created"):
-                        try:
-                            published = datetime.fromisoformat(
-                                str(item["created"]).replace("Z", "+00:00")
-                            )
-                        except (ValueError, TypeError):
-                            pass
-
-                    location_info = item.get("location", {})
-                    display_location = location_info.get("display_name", "") if isinstance(location_info, dict) else ""
-
-                    company_info = item.get("company", {})
-                    company_name = company_info.get("display_name", "") if isinstance(company_info, dict) else ""
-
-                    category_info = item.get("category", {})
-                    category_tag = category_info.get("tag", "") if isinstance(category_info, dict) else ""
-
-                    salary_min = item.get("salary_min")
-                    salary_max = item.get("salary_max")
-
-                    contract_type = item.get("contract_type", "")
-                    contract_time = item.get("contract_time", "")
-
-                    redirect_url = item.get("redirect_url", "")
-
-                    tags = []
-                    if category_tag:
-                        tags.append(category_tag.replace("-", " "))
-                    if contract_type:
-                        tags.append(contract_type)
-                    if contract_time:
-                        tags.append(contract_time.replace("_", " "))
-
-                    jobs.append(
-                        Job(
-                            id=f"adzuna-{item.get('id', '')}",
-                            title=item.get("title", ""),
-                            company=company_name,
-                            description=clean_html(item.get("description", "")),
-                            url=redirect_url,
-                            source=f"adzuna:{adzuna_country}",
-                            location=display_location,
-                            remote_type="",
-                            salary_min=float(salary_min) if salary_min else None,
-                            salary_max=float(salary_max) if salary_max else None,
-                            salary_currency="GBP" if adzuna_country == "gb" else "USD",
-                            tags=tags,
-                            published_at=published,
-                        )
-                    )
-
-                if len(results) < 50:
-                    break
-
-        return jobs
+                return resp.json()
+
+            first = fetch_page(1)
+            results = first.get("results", [])
+            if not results:
+                return
+
+            if self.since is not None:
+                data, page = first, 1
+                while True:
+                    jobs, reached_known = self._unseen(_parse_page(data, adzuna_country))
+                    if jobs:
+                        yield jobs
+                    if reached_known or page + 1 not in self._remaining_pages(data, page):
+                        return
+                    page += 1
+                    data = fetch_page(page)
+
+            yield [_parse_item(item, adzuna_country) for item in results]
+
+            yield from iter_concurrently(
+                lambda page: _parse_page(fetch_page(page), adzuna_country),
+                self._remaining_pages(first),
+                max_workers=self.max_pages,
+            )
+
+    async def aiter_jobs(self) -> AsyncIterator[list[Job]]:
+        creds = _get_credentials()
+        if not creds:
+            return
+
+        adzuna_country = COUNTRY_CODE_MAP.get(self.country, "gb")
+
+        async with AsyncSafeHttpClient(shared=True, **self.http_options()) as client:
+            async def fetch_page(page: int) -> dict:
+                resp = await client.get(self._url(adzuna_country, page), params=self._params(creds))
+                resp.raise_for_status()
+                return resp.json()
+
+            async def fetch_parsed(page: int) -> list[Job]:
+                return _parse_page(await fetch_page(page), adzuna_country)
+
+            first = await fetch_page(1)
+            results = first.get("results", [])
+            if not results:
+                return
+
+            if self.since is not None:
+                data, page = first, 1
+                while True:
+                    jobs, reached_known = self._unseen(_parse_page(data, adzuna_country))
+                    if jobs:
+                        yield jobs
+                    if reached_known or page + 1 not in self._remaining_pages(data, page):
+                        return
+                    page += 1
+                    data = await fetch_page(page)
+
+            yield [_parse_item(item, adzuna_country) for item in results]
+
+            async for page in aiter_concurrently(fetch_parsed, self._remaining_pages(first)):
+                yield page
+
+    def _remaining_pages(self, data: dict, current: int = 1) -> range:
+        """Pages after ``current``, sized from the total count the response reports."""
+        total = data.get("count")
+        if isinstance(total, int):
+            last = min(self.max_pages, -(-total // PAGE_SIZE))
+        elif len(data.get("results", [])) >= PAGE_SIZE:
+            last = self.max_pages
+        else:
+            last = 1
+        return range(current + 1, last + 1)
+
+    @staticmethod
+    def _url(adzuna_country: str, page: int) -> str:
+        return f"{BASE_URL}/{adzuna_country}/search/{page}"
+
+    def _params(self, creds: tuple[str, str]) -> dict:
+        app_id, app_key = creds
+        params: dict = {
+            "app_id": app_id,
+            "app_key": app_key,
+            "results_per_page": PAGE_SIZE,
+            "content-type": "application/json",
+        }
+        if self.keywords:
+            params["what"] = self.keywords
+        if self.location:
+            params["where"] = self.location
+        if self.since is not None and self.since.published_at is not None:
+            age = datetime.now(timezone.utc) - ensure_utc(self.since.published_at)
+            params["sort_by"] = "date"
+            params["max_days_old"] = max(1, age.days + 1)
+        return params
+
+
+def _parse_page(data: dict, adzuna_country: str) -> list[Job]:
+    return [_parse_item(item, adzuna_country) for item in data.get("results", [])]
+
+
+def _parse_item(item: dict, adzuna_country: str) -> Job:
+    published = None
+    if item.get("created"):
+        try:
+            published = datetime.fromisoformat(
+                str(item["created"]).replace("Z", "+00:00")
+            )
+        except (ValueError, TypeError):
+            pass
+
+    location_info = item.get("location", {})
+    display_location = location_info.get("display_name", "") if isinstance(location_info, dict) else ""
+
+    company_info = item.get("company", {})
+    company_name = company_info.get("display_name", "") if isinstance(company_info, dict) else ""
+
+    category_info = item.get("category", {})
+    category_tag = category_info.get("tag", "") if isinstance(category_info, dict) else ""
+
+    salary_min = item.get("salary_min")
+    salary_max = item.get("salary_max")
+
+    contract_type = item.get("contract_type", "")
+    contract_time = item.get("contract_time", "")
+
+    redirect_url = item.get("redirect_url", "")
+
+    tags = []
+    if category_tag:
+        tags.append(category_tag.replace("-", " "))
+    if contract_type:
+        tags.append(contract_type)
+    if contract_time:
+        tags.append(contract_time.replace("_", " "))
+
+    return Job(
+        id=f"adzuna-{item.get('id', '')}",
+        title=item.get("title", ""),
+        company=company_name,
+        description=clean_html(item.get("description", "")),
+        url=redirect_url,
+        source=f"adzuna:{adzuna_country}",
+        location=display_location,
+        remote_type="",
+        salary_min=float(salary_min) if salary_min else None,
+        salary_max=float(salary_max) if salary_max else None,
+        salary_currency="GBP" if adzuna_country == "gb" else "USD",
+        tags=tags,
+        published_at=published,
+    )
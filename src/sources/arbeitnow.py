@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 from src.models.job import Job
@@ -12,13 +13,14 @@ API_URL = "https://www.arbeitnow.com/api/job-board-api"
 
 class ArbeitnowConnector(BaseConnector):
     name = "arbeitnow"
+    supports_watermark = True
+    newest_first = True
 
-    def fetch_jobs(self) -> list[Job]:
-        all_jobs: list[Job] = []
+    def iter_jobs(self) -> Iterator[list[Job]]:
         page = 1
         max_pages = 3
 
-        with SafeHttpClient() as client:
+        with SafeHttpClient(shared=True, **self.http_options()) as client:
             while page <= max_pages:
                 resp = client.get(API_URL, params={"page": page})
                 resp.raise_for_status()
@@ -28,39 +30,40 @@ class ArbeitnowConnector(BaseConnector):
                 if not items:
                     break
 
-                for item in items:
-                    published = None
-                    if item.get("created_at"):
-                        try:
-                            ts = item["created_at"]
-                            if isinstance(ts, (int, float)):
-                                published = datetime.fromtimestamp(ts, tz=timezone.utc)
-                            else:
-                                published = datetime.fromisoformat(str(ts))
-                        except (ValueError, TypeError, OSError):
-                            pass
+                jobs, reached_known = self._unseen([_parse_item(item) for item in items])
+                if jobs:
+                    yield jobs
 
-                    tags = [t.strip().lower() for t in item.get("tags", []) if t]
-                    remote_flag = item.get("remote", False)
-                    remote_type = "remote" if remote_flag else ""
-
-                    all_jobs.append(
-                        Job(
-                            id=f"arbeitnow-{item.get('slug', item.get('url', ''))}",
-                            title=item.get("title", ""),
-                            company=item.get("company_name", ""),
-                            description=clean_html(item.get("description", "")),
-                            url=item.get("url", ""),
-                            source="arbeitnow",
-                            location=item.get("location", ""),
-                            remote_type=remote_type,
-                            tags=tags,
-                            published_at=published,
-                        )
-                    )
-
-                if not data.get("links", {}).get("next"):
+                if reached_known or not data.get("links", {}).get("next"):
                     break
                 page += 1
 
-        return all_jobs
+
+def _parse_item(item: dict) -> Job:
+    published = None
+    if item.get("created_at"):
+        try:
+            ts = item["created_at"]
+            if isinstance(ts, (int, float)):
+                published = datetime.fromtimestamp(ts, tz=timezone.utc)
+            else:
+                published = datetime.fromisoformat(str(ts))
+        except (ValueError, TypeError, OSError):
+            pass
+
+    tags = [t.strip().lower() for t in item.get("tags", []) if t]
+    remote_flag = item.get("remote", False)
+    remote_type = "remote" if remote_flag else ""
+
+    return Job(
+        id=f"arbeitnow-{item.get('slug', item.get('url', ''))}",
+        title=item.get("title", ""),
+        company=item.get("company_name", ""),
+        description=clean_html(item.get("description", "")),
+        url=item.get("url", ""),
+        source="arbeitnow",
+        location=item.get("location", ""),
+        remote_type=remote_type,
+        tags=tags,
+        published_at=published,
+    )
@@ -1,19 +1,124 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TypeVar
 
 from src.models.job import Job
+from src.models.watermark import Watermark
+from src.utils.http_retry import RateLimit, RetryPolicy
+
+T = TypeVar("T")
+
+# Attributes that tune how a connector fetches (transport settings, incremental
+# state) rather than identify the query, so they stay out of the cache key.
+_NON_KEY_ATTRS = frozenset({"retry_policy", "rate_limit", "max_concurrency", "since", "failed_pages"})
 
 
 class BaseConnector(ABC):
     """Abstract base for all job source connectors."""
 
     name: str = "unknown"
+    retry_policy: RetryPolicy = RetryPolicy()
+    rate_limit: RateLimit | None = None
+    # Incremental fetch: connectors that set supports_watermark skip postings at or
+    # below ``since`` and stop paginating once they reach them.
+    supports_watermark: bool = False
+    newest_first: bool = False
+    since: Watermark | None = None
+    # Pages (boards) the last fetch skipped after an error; connectors that
+    # swallow per-page errors count them so partial results are not cached as complete.
+    failed_pages: int = 0
 
     @abstractmethod
-    def fetch_jobs(self) -> list[Job]:
-        """Fetch jobs from the source. Must use SafeHttpClient for all requests."""
+    def iter_jobs(self) -> Iterator[list[Job]]:
+        """Yield jobs one page (or board) at a time. Must use SafeHttpClient for all requests."""
         ...
 
+    def fetch_jobs(self) -> list[Job]:
+        """Fetch every page from the source."""
+        return [job for page in self.iter_jobs() for job in page]
+
+    async def aiter_jobs(self) -> AsyncIterator[list[Job]]:
+        """Async variant of iter_jobs. Must use AsyncSafeHttpClient for all requests.
+
+        Connectors without a native async path fall back to pulling pages from
+        iter_jobs in a worker thread.
+        """
+        pages = self.iter_jobs()
+        while True:
+            page = await asyncio.to_thread(next, pages, None)
+            if page is None:
+                break
+            yield page
+
+    async def afetch_jobs(self) -> list[Job]:
+        return [job async for page in self.aiter_jobs() for job in page]
+
+    def with_watermark(self, watermark: Watermark | None) -> BaseConnector:
+        clone = copy.copy(self)
+        clone.since = watermark
+        return clone
+
+    def _unseen(self, page: list[Job]) -> tuple[list[Job], bool]:
+        """Drop postings already covered by ``since``; the flag says pagination can stop."""
+        if self.since is None:
+            return page, False
+        fresh = [j for j in page if not self.since.is_known(j)]
+        if self.newest_first:
+            return fresh, len(fresh) < len(page)
+        return fresh, not fresh and bool(page)
+
+    def http_options(self) -> dict:
+        """Retry and pacing settings passed to SafeHttpClient / AsyncSafeHttpClient."""
+        return {"retry": self.retry_policy, "rate_limit": self.rate_limit}
+
+    def cache_params(self) -> dict:
+        """Parameters that determine what this connector returns.
+
+        Defaults to the public attributes set in ``__init__``.
+        """
+        return {
+            k: v for k, v in vars(self).items()
+            if not k.startswith("_") and k not in _NON_KEY_ATTRS
+        }
+
+    def cache_key(self) -> str:
+        return f"{self.name}:{json.dumps(self.cache_params(), sort_keys=True, default=str)}"
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} source={self.name!r}>"
+
+
+def iter_concurrently(
+    fetch: Callable[[T], list[Job]], keys: Iterable[T], max_workers: int
+) -> Iterator[list[Job]]:
+    """Run ``fetch`` for every key on a thread pool and yield results as they complete."""
+    keys = list(keys)
+    if not keys:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as pool:
+        futures = [pool.submit(fetch, key) for key in keys]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+async def aiter_concurrently(
+    fetch: Callable[[T], Awaitable[list[Job]]], keys: Iterable[T]
+) -> AsyncIterator[list[Job]]:
+    """Await ``fetch`` for every key concurrently and yield results as they complete."""
+    tasks = [asyncio.ensure_future(fetch(key)) for key in keys]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from src.models.job import Job
+from src.models.watermark import Watermark, ensure_utc
+from src.sources.base import BaseConnector
+from src.storage.cache import JobCache
+
+_REFRESH_WORKERS = 2
+# Incrementally refreshed corpora drop postings older than this.
+RETENTION_DAYS = 30
+# Results missing some pages (boards that errored) are fresh only this long.
+PARTIAL_TTL_SECONDS = 300
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    incremental_refreshes: int = 0
+    refreshed_jobs: int = 0
+    refresh_errors: int = 0
+    partial_fetches: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+class ReadThroughCache:
+    """Serves connector results from JobCache, fetching only on a miss.
+
+    Fresh entries are returned as-is. Stale entries are returned immediately
+    while the connector is re-run in the background (stale-while-revalidate).
+    Connectors that support watermarks are refreshed incrementally: only
+    postings newer than the stored watermark are fetched and merged in. Edits
+    to postings already cached are not picked up until the entry expires and
+    is fetched in full.
+    """
+
+    def __init__(self, cache: JobCache, refresh_workers: int = _REFRESH_WORKERS):
+        self.cache = cache
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="job-cache-refresh")
+
+    def wrap(self, connector: BaseConnector) -> CachedConnector:
+        return CachedConnector(connector, self)
+
+    def wrap_all(self, connectors: list[BaseConnector]) -> list[BaseConnector]:
+        return [self.wrap(c) for c in connectors]
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + n)
+
+    def _schedule_refresh(self, connector: BaseConnector, key: str, cached: list[Job]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, connector, key, cached)
+
+    def _store(
+        self, connector: BaseConnector, key: str, jobs: list[Job], cached: list[Job] | None = None
+    ) -> None:
+        """Store a full fetch; empty results are never stored, partial ones only briefly."""
+        if not jobs:
+            return
+        if connector.failed_pages:
+            self._count("partial_fetches")
+            self.cache.store_query(key, _merge(cached or [], jobs), max_age=PARTIAL_TTL_SECONDS)
+            return
+        self.cache.store_query(key, jobs)
+        if connector.supports_watermark:
+            self.cache.store_watermark(key, Watermark().advance(jobs))
+
+    def _refresh(self, connector: BaseConnector, key: str, cached: list[Job]) -> None:
+        try:
+            watermark = self.cache.get_watermark(key) if connector.supports_watermark else None
+            if watermark is None:
+                jobs = connector.fetch_jobs()
+                self._store(connector, key, jobs, cached)
+                self._count("refreshed_jobs", len(jobs))
+            else:
+                incremental = connector.with_watermark(watermark)
+                fresh = incremental.fetch_jobs()
+                if incremental.failed_pages:
+                    # Keep the old watermark so the missed pages are fetched next time.
+                    self._count("partial_fetches")
+                    self.cache.store_query(key, _merge(cached, fresh), changed=fresh, max_age=PARTIAL_TTL_SECONDS)
+                else:
+                    self.cache.store_query(key, _merge(cached, fresh), changed=fresh)
+                    self.cache.store_watermark(key, watermark.advance(fresh))
+                self._count("incremental_refreshes")
+                self._count("refreshed_jobs", len(fresh))
+            self._count("refreshes")
+        except Exception:
+            self._count("refresh_errors")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+class CachedConnector(BaseConnector):
+    """A connector wrapped by a ReadThroughCache."""
+
+    def __init__(self, inner: BaseConnector, cache: ReadThroughCache):
+        self.inner = inner
+        self.name = inner.name
+        self._cache = cache
+
+    def cache_key(self) -> str:
+        return self.inner.cache_key()
+
+    def iter_jobs(self) -> Iterator[list[Job]]:
+        key = self.cache_key()
+        entry = self._cache.cache.get_query(key)
+        if entry is not None:
+            jobs, age = entry
+            if age <= self._cache.cache.ttl:
+                self._cache._count("hits")
+            else:
+                self._cache._count("stale_hits")
+                self._cache._schedule_refresh(self.inner, key, jobs)
+            if jobs:
+                yield jobs
+            return
+
+        self._cache._count("misses")
+        fetched: list[Job] = []
+        for page in self.inner.iter_jobs():
+            fetched.extend(page)
+            yield page
+        self._cache._store(self.inner, key, fetched)
+
+
+def _merge(cached: list[Job], fresh: list[Job]) -> list[Job]:
+    """Overlay newly fetched postings on the cached corpus, dropping expired ones."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)
+    merged = {j.id: j for j in cached if j.published_at is None or ensure_utc(j.published_at) >= cutoff}
+    for job in fresh:
+        merged[job.id] = job
+    return list(merged.values())
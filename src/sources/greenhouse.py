@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import html
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+from src.matching.filters import apply_hard_filters, hard_filter_params
 from src.models.job import Job
-from src.sources.base import BaseConnector
-from src.utils.http_client import SafeHttpClient
+from src.models.preferences import Preferences
+from src.sources.base import BaseConnector, aiter_concurrently, iter_concurrently
+from src.utils.http_cache import ParsedResponseMemo
+from src.utils.http_client import AsyncSafeHttpClient, SafeHttpClient
+from src.utils.http_retry import RateLimit
 from src.utils.text import clean_html
 
 BOARD_API = "https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
+JOB_API = BOARD_API + "/{job_id}"
+MAX_CONCURRENT_BOARDS = 50
+MAX_CONCURRENT_DETAILS = 8
+# Detail requests per fetch, across all boards. A board whose filter survivors
+# do not fit in what is left gets one content=true board fetch instead.
+MAX_DETAIL_FETCHES = 40
+
+# Boards are revalidated with conditional GETs; unchanged boards skip parsing too.
+_PARSED_BOARDS = ParsedResponseMemo()
+_PARSED_DETAILS = ParsedResponseMemo()
 
 
 def load_company_slugs() -> list[str]:
@@ -23,68 +40,211 @@ def load_company_slugs() -> list[str]:
 
 
 class GreenhouseConnector(BaseConnector):
-    name = "greenhouse"
+    """Greenhouse job boards.
 
-    def __init__(self, slugs: list[str] | None = None):
-        self.slugs = slugs or load_company_slugs()
+    With ``prefs`` that set hard filters, boards are fetched in two phases: the
+    listing without descriptions is filtered first, then descriptions are
+    fetched only for the surviving jobs, which are filtered again with the
+    fuller detail (offices) before being returned. Detail requests share one
+    budget per fetch, so a board costs at most two requests once it is spent.
+    """
 
-    def fetch_jobs(self) -> list[Job]:
-        all_jobs: list[Job] = []
-
-        with SafeHttpClient() as client:
+    name = "greenhouse"
+    rate_limit = RateLimit(rate=20, burst=32)
+
+    def __init__(
+        self,
+        slugs: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_BOARDS,
+        prefs: Preferences | None = None,
+    ):
+        self.slugs = slugs or load_company_slugs()
+        self.max_concurrency = max_concurrency
+        self.prefs = prefs
+        self._detail_budget = MAX_DETAIL_FETCHES
+
+    @property
+    def two_phase(self) -> bool:
+        return self.prefs is not None and bool(hard_filter_params(self.prefs))
+
+    def cache_params(self) -> dict:
+        params = super().cache_params()
+        del params["prefs"]
+        if self.two_phase:
+            params["filters"] = hard_filter_params(self.prefs)
+        return params
+
+    def _reserve_details(self, n: int) -> bool:
+        """Take ``n`` detail requests from this fetch's budget, if that many are left."""
+        if n > self._detail_budget:
+            return False
+        self._detail_budget -= n
+        return True
+
+    def iter_jobs(self) -> Iterator[list[Job]]:
+        self.failed_pages = 0
+        self._detail_budget = MAX_DETAIL_FETCHES
+        with SafeHttpClient(shared=True, revalidate=True, **self.http_options()) as client:
             for slug in self.slugs:
                 try:
-                    url = BOARD_API.format(slug=slug)
-                    resp = client.get(url, params={"content": "true"})
-                    if resp.status_code == 404:
-                        continue
-                    resp.raise_for_status()
-                    data = resp.json()
+                    board = self._fetch_board(client, slug)
                 except Exception:
+                    self.failed_pages += 1
                     continue
 
-                for item in data.get("jobs", []):
-                    published = None
-                    if item.get("updated_at"):
-                        try:
-                            published = datetime.fromisoformat(
-                                item["updated_at"].replace("Z", "+00:00")
-                            )
-                        except (ValueError, TypeError):
-                            pass
-
-                    location_parts = []
-                    for office in item.get("offices", []):
-                        loc = office.get("name", "")
-                        if loc:
-                            location_parts.append(loc)
-                    location = ", ".join(location_parts) if location_parts else ""
-
-                    dept_parts = []
-                    for dept in item.get("departments", []):
-                        d = dept.get("name", "")
-                        if d:
-                            dept_parts.append(d.lower())
-
-                    description = ""
-                    content = item.get("content", "")
-                    if content:
-                        description = clean_html(content)
-
-                    apply_url = item.get("absolute_url", "")
-
-                    all_jobs.append(
-                        Job(
-                            id=f"greenhouse-{slug}-{item['id']}",
-                            title=item.get("title", ""),
-                            company=slug.replace("-", " ").title(),
-                            description=description,
-                            url=apply_url,
-                            source=f"greenhouse:{slug}",
-                            location=location,
-                            tags=dept_parts,
-                            published_at=published,
-                        )
-                    )
-
-        return all_jobs
+                if board:
+                    yield board
+
+    def _fetch_board(self, client: SafeHttpClient, slug: str) -> list[Job]:
+        if not self.two_phase:
+            return _get_board(client, slug, content=True)
+        listing = apply_hard_filters(_get_board(client, slug, content=False), self.prefs)
+        if not self._reserve_details(len(listing)):
+            return apply_hard_filters(_get_board(client, slug, content=True), self.prefs)
+        pages = iter_concurrently(
+            lambda job: [_get_detail(client, slug, job)], listing, MAX_CONCURRENT_DETAILS
+        )
+        return apply_hard_filters([job for page in pages for job in page], self.prefs)
+
+    async def aiter_jobs(self) -> AsyncIterator[list[Job]]:
+        self.failed_pages = 0
+        self._detail_budget = MAX_DETAIL_FETCHES
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        detail_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETAILS)
+        async with AsyncSafeHttpClient(shared=True, revalidate=True, **self.http_options()) as client:
+            async for board in aiter_concurrently(
+                lambda slug: self._afetch_board(client, semaphore, detail_semaphore, slug), self.slugs
+            ):
+                if board:
+                    yield board
+
+    async def _afetch_board(
+        self,
+        client: AsyncSafeHttpClient,
+        semaphore: asyncio.Semaphore,
+        detail_semaphore: asyncio.Semaphore,
+        slug: str,
+    ) -> list[Job]:
+        try:
+            async with semaphore:
+                if not self.two_phase:
+                    return await _aget_board(client, slug, content=True)
+                listing = apply_hard_filters(await _aget_board(client, slug, content=False), self.prefs)
+                if not self._reserve_details(len(listing)):
+                    return apply_hard_filters(await _aget_board(client, slug, content=True), self.prefs)
+            details = await asyncio.gather(*(_aget_detail(client, detail_semaphore, slug, job) for job in listing))
+            return apply_hard_filters(list(details), self.prefs)
+        except Exception:
+            self.failed_pages += 1
+            return []
+
+
+def _board_params(content: bool) -> dict | None:
+    return {"content": "true"} if content else None
+
+
+def _get_board(client: SafeHttpClient, slug: str, content: bool) -> list[Job]:
+    resp = client.get(BOARD_API.format(slug=slug), params=_board_params(content))
+    if resp.status_code == 404:
+        return []
+    resp.raise_for_status()
+    return _parse_response(slug, resp)
+
+
+async def _aget_board(client: AsyncSafeHttpClient, slug: str, content: bool) -> list[Job]:
+    resp = await client.get(BOARD_API.format(slug=slug), params=_board_params(content))
+    if resp.status_code == 404:
+        return []
+    resp.raise_for_status()
+    return _parse_response(slug, resp)
+
+
+def _get_detail(client: SafeHttpClient, slug: str, job: Job) -> Job:
+    """The listing job with its description filled in; unchanged if the lookup fails."""
+    try:
+        resp = client.get(JOB_API.format(slug=slug, job_id=_item_id(job)))
+        resp.raise_for_status()
+        return _parse_detail(slug, resp)
+    except Exception:
+        return job
+
+
+async def _aget_detail(
+    client: AsyncSafeHttpClient, semaphore: asyncio.Semaphore, slug: str, job: Job
+) -> Job:
+    async with semaphore:
+        try:
+            resp = await client.get(JOB_API.format(slug=slug, job_id=_item_id(job)))
+            resp.raise_for_status()
+            return _parse_detail(slug, resp)
+        except Exception:
+            return job
+
+
+def _item_id(job: Job) -> str:
+    return job.id.rsplit("-", 1)[-1]
+
+
+def _parse_response(slug: str, resp) -> list[Job]:
+    board = _PARSED_BOARDS.get(resp)
+    if board is None:
+        board = _parse_board(slug, resp.json())
+        _PARSED_BOARDS.put(resp, board)
+    return board
+
+
+def _parse_detail(slug: str, resp) -> Job:
+    job = _PARSED_DETAILS.get(resp)
+    if job is None:
+        job = _parse_item(slug, resp.json())
+        _PARSED_DETAILS.put(resp, job)
+    return job
+
+
+def _parse_board(slug: str, data: dict) -> list[Job]:
+    return [_parse_item(slug, item) for item in data.get("jobs", [])]
+
+
+def _parse_item(slug: str, item: dict) -> Job:
+    published = None
+    if item.get("updated_at"):
+        try:
+            published = datetime.fromisoformat(
+                item["updated_at"].replace("Z", "+00:00")
+            )
+        except (ValueError, TypeError):
+            pass
+
+    location_parts = []
+    for office in item.get("offices", []):
+        loc = office.get("name", "")
+        if loc:
+            location_parts.append(loc)
+    # Board listings without content=true carry only location.name, no offices.
+    location = ", ".join(location_parts) if location_parts else (item.get("location") or {}).get("name", "")
+
+    dept_parts = []
+    for dept in item.get("departments", []):
+        d = dept.get("name", "")
+        if d:
+            dept_parts.append(d.lower())
+
+    description = ""
+    content = item.get("content", "")
+    if content:
+        # Greenhouse returns the posting HTML entity-escaped.
+        description = clean_html(html.unescape(content))
+
+    apply_url = item.get("absolute_url", "")
+
+    return Job(
+        id=f"greenhouse-{slug}-{item['id']}",
+        title=item.get("title", ""),
+        company=slug.replace("-", " ").title(),
+        description=description,
+        url=apply_url,
+        source=f"greenhouse:{slug}",
+        location=location,
+        tags=dept_parts,
+        published_at=published,
+    )
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
 from src.models.job import Job
-from src.sources.base import BaseConnector
-from src.utils.http_client import SafeHttpClient
+from src.sources.base import BaseConnector, aiter_concurrently
+from src.utils.http_cache import ParsedResponseMemo
+from src.utils.http_client import AsyncSafeHttpClient, SafeHttpClient
+from src.utils.http_retry import RateLimit
 from src.utils.text import clean_html
 
 POSTINGS_API = "https://api.lever.co/v0/postings/{site}"
+MAX_CONCURRENT_BOARDS = 50
+
+# Boards are revalidated with conditional GETs; unchanged boards skip parsing too.
+_PARSED_BOARDS = ParsedResponseMemo()
 
 
 def load_company_slugs() -> list[str]:
@@ -26,14 +34,15 @@ class LeverConnector(BaseConnector):
     """Lever -- free, no auth. Many tech companies use Lever for their career boards."""
 
     name = "lever"
+    rate_limit = RateLimit(rate=20, burst=32)
 
-    def __init__(self, slugs: list[str] | None = None):
+    def __init__(self, slugs: list[str] | None = None, max_concurrency: int = MAX_CONCURRENT_BOARDS):
         self.slugs = slugs or load_company_slugs()
+        self.max_concurrency = max_concurrency
 
-    def fetch_jobs(self) -> list[Job]:
-        all_jobs: list[Job] = []
-
-        with SafeHttpClient() as client:
+    def iter_jobs(self) -> Iterator[list[Job]]:
+        self.failed_pages = 0
+        with SafeHttpClient(shared=True, revalidate=True, **self.http_options()) as client:
             for slug in self.slugs:
                 try:
                     url = POSTINGS_API.format(site=slug)
@@ -41,62 +50,99 @@ class LeverConnector(BaseConnector):
                     if resp.status_code == 404:
                         continue
                     resp.raise_for_status()
-                    postings = resp.json()
+                    board = _parse_response(slug, resp)
                 except Exception:
+                    self.failed_pages += 1
                     continue
 
-                if not isinstance(postings, list):
-                    continue
-
-                for item in postings:
-                    published = None
-                    if item.get("createdAt"):
-                        try:
-                            ts = item["createdAt"]
-                            if isinstance(ts, (int, float)):
-                                published = datetime.fromtimestamp(ts / 1000, tz=__import__("datetime").timezone.utc)
-                            else:
-                                published = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-                        except (ValueError, TypeError, OSError):
-                            pass
-
-                    categories = item.get("categories", {}) or {}
-                    location = categories.get("location", "") or ""
-                    commitment = categories.get("commitment", "") or ""
-                    team = categories.get("team", "") or ""
-                    department = categories.get("department", "") or ""
-
-                    tags = [t.lower() for t in [commitment, team, department] if t]
-
-                    description_plain = item.get("descriptionPlain", "")
-                    if not description_plain:
-                        description_plain = clean_html(item.get("description", "") or "")
-
-                    lists_section = ""
-                    for lst in item.get("lists", []):
-                        header = lst.get("text", "")
-                        content = lst.get("content", "")
-                        if content:
-                            lists_section += f"\n{header}\n{clean_html(content)}"
-
-                    full_description = description_plain
-                    if lists_section:
-                        full_description += lists_section
-
-                    apply_url = item.get("hostedUrl", "") or item.get("applyUrl", "")
-
-                    all_jobs.append(
-                        Job(
-                            id=f"lever-{slug}-{item.get('id', '')}",
-                            title=item.get("text", ""),
-                            company=slug.replace("-", " ").title(),
-                            description=full_description.strip(),
-                            url=apply_url,
-                            source=f"lever:{slug}",
-                            location=location,
-                            tags=tags,
-                            published_at=published,
-                        )
-                    )
-
-        return all_jobs
+                if board:
+                    yield board
+
+    async def aiter_jobs(self) -> AsyncIterator[list[Job]]:
+        self.failed_pages = 0
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with AsyncSafeHttpClient(shared=True, revalidate=True, **self.http_options()) as client:
+            async for board in aiter_concurrently(
+                lambda slug: self._afetch_board(client, semaphore, slug), self.slugs
+            ):
+                if board:
+                    yield board
+
+    async def _afetch_board(
+        self, client: AsyncSafeHttpClient, semaphore: asyncio.Semaphore, slug: str
+    ) -> list[Job]:
+        async with semaphore:
+            try:
+                url = POSTINGS_API.format(site=slug)
+                resp = await client.get(url, params={"mode": "json"})
+                if resp.status_code == 404:
+                    return []
+                resp.raise_for_status()
+                return _parse_response(slug, resp)
+            except Exception:
+                self.failed_pages += 1
+                return []
+
+
+def _parse_response(slug: str, resp) -> list[Job]:
+    board = _PARSED_BOARDS.get(resp)
+    if board is None:
+        board = _parse_postings(slug, resp.json())
+        _PARSED_BOARDS.put(resp, board)
+    return board
+
+
+def _parse_postings(slug: str, postings) -> list[Job]:
+    if not isinstance(postings, list):
+        return []
+    return [_parse_item(slug, item) for item in postings]
+
+
+def _parse_item(slug: str, item: dict) -> Job:
+    published = None
+    if item.get("createdAt"):
+        try:
+            ts = item["createdAt"]
+            if isinstance(ts, (int, float)):
+                published = datetime.fromtimestamp(ts / 1000, tz=__import__("datetime").timezone.utc)
+            else:
+                published = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+        except (ValueError, TypeError, OSError):
+            pass
+
+    categories = item.get("categories", {}) or {}
+    location = categories.get("location", "") or ""
+    commitment = categories.get("commitment", "") or ""
+    team = categories.get("team", "") or ""
+    department = categories.get("department", "") or ""
+
+    tags = [t.lower() for t in [commitment, team, department] if t]
+
+    description_plain = item.get("descriptionPlain", "")
+    if not description_plain:
+        description_plain = clean_html(item.get("description", "") or "")
+
+    lists_section = ""
+    for lst in item.get("lists", []):
+        header = lst.get("text", "")
+        content = lst.get("content", "")
+        if content:
+            lists_section += f"\n{header}\n{clean_html(content)}"
+
+    full_description = description_plain
+    if lists_section:
+        full_description += lists_section
+
+    apply_url = item.get("hostedUrl", "") or item.get("applyUrl", "")
+
+    return Job(
+        id=f"lever-{slug}-{item.get('id', '')}",
+        title=item.get("text", ""),
+        company=slug.replace("-", " ").title(),
+        description=full_description.strip(),
+        url=apply_url,
+        source=f"lever:{slug}",
+        location=location,
+        tags=tags,
+        published_at=published,
+    )
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
 from src.models.job import Job
 from src.sources.base import BaseConnector
 from src.sources.remotive import RemotiveConnector
@@ -9,6 +14,20 @@ from src.sources.lever import LeverConnector
 from src.sources.reed import ReedConnector
 from src.sources.adzuna import AdzunaConnector
 
+DEFAULT_MAX_WORKERS = 6
+_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class FetchResult:
+    jobs: list[Job] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def timed_out(self) -> list[str]:
+        return [name for name, err in self.errors.items() if err.startswith("timed out")]
+
 
 def get_all_connectors() -> list[BaseConnector]:
     connectors: list[BaseConnector] = [
@@ -41,6 +60,118 @@ def fetch_all_jobs(connectors: list[BaseConnector] | None = None) -> list[Job]:
     return all_jobs
 
 
+def fetch_all_jobs_concurrent(
+    connectors: list[BaseConnector] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    connector_timeout: float | None = 30.0,
+    total_timeout: float | None = 60.0,
+) -> FetchResult:
+    """Run connectors in a bounded thread pool.
+
+    ``connector_timeout`` is counted from the moment a connector starts running,
+    ``total_timeout`` from the call itself. Connectors still running when either
+    budget runs out are abandoned (their worker thread finishes in the background)
+    and reported in ``FetchResult.errors``; everything that completed is returned.
+    """
+    if connectors is None:
+        connectors = get_all_connectors()
+
+    result = FetchResult()
+    if not connectors:
+        return result
+
+    labels = _unique_labels(connectors)
+    started: dict[str, float] = {}
+
+    def run(label: str, connector: BaseConnector) -> list[Job]:
+        started[label] = time.monotonic()
+        return connector.fetch_jobs()
+
+    t0 = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(connectors))))
+    pending: dict[Future, str] = {
+        executor.submit(run, label, connector): label
+        for label, connector in zip(labels, connectors)
+    }
+
+    try:
+        while pending:
+            now = time.monotonic()
+            if total_timeout is not None and now - t0 >= total_timeout:
+                for label in pending.values():
+                    result.errors[label] = f"timed out (global budget {total_timeout:.0f}s exhausted)"
+                break
+
+            for fut, label in list(pending.items()):
+                start = started.get(label)
+                if connector_timeout is not None and start is not None and now - start >= connector_timeout:
+                    del pending[fut]
+                    result.errors[label] = f"timed out after {connector_timeout:.0f}s"
+
+            if not pending:
+                break
+
+            wait_for = _POLL_INTERVAL
+            if total_timeout is not None:
+                wait_for = min(wait_for, max(total_timeout - (now - t0), 0.0))
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for fut in done:
+                label = pending.pop(fut)
+                start = started.get(label, t0)
+                result.timings[label] = time.monotonic() - start
+                try:
+                    result.jobs.extend(fut.result())
+                except Exception as e:
+                    result.errors[label] = str(e) or e.__class__.__name__
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return result
+
+
+async def afetch_all_jobs(
+    connectors: list[BaseConnector] | None = None,
+    connector_timeout: float | None = 30.0,
+) -> FetchResult:
+    """Run every connector's afetch_jobs on the current event loop."""
+    if connectors is None:
+        connectors = get_all_connectors()
+
+    result = FetchResult()
+    labels = _unique_labels(connectors)
+
+    async def run(label: str, connector: BaseConnector) -> list[Job]:
+        start = time.monotonic()
+        try:
+            return await asyncio.wait_for(connector.afetch_jobs(), connector_timeout)
+        finally:
+            result.timings[label] = time.monotonic() - start
+
+    outcomes = await asyncio.gather(
+        *(run(label, connector) for label, connector in zip(labels, connectors)),
+        return_exceptions=True,
+    )
+    for label, outcome in zip(labels, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            result.errors[label] = f"timed out after {connector_timeout:.0f}s"
+        elif isinstance(outcome, BaseException):
+            result.errors[label] = str(outcome) or outcome.__class__.__name__
+        else:
+            result.jobs.extend(outcome)
+    return result
+
+
+def _unique_labels(connectors: list[BaseConnector]) -> list[str]:
+    counts: dict[str, int] = {}
+    labels = []
+    for connector in connectors:
+        n = counts.get(connector.name, 0)
+        counts[connector.name] = n + 1
+        labels.append(connector.name if n == 0 else f"{connector.name}#{n + 1}")
+    return labels
+
+
 def deduplicate_jobs(jobs: list[Job]) -> list[Job]:
     seen: dict[str, Job] = {}
     for job in jobs:
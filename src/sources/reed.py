@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import dataclasses
 import os
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timezone
 
 from src.models.job import Job
-from src.sources.base import BaseConnector
-from src.utils.http_client import SafeHttpClient
+from src.sources.base import BaseConnector, aiter_concurrently, iter_concurrently
+from src.utils.http_client import AsyncSafeHttpClient, SafeHttpClient
+from src.utils.http_retry import RateLimit
 from src.utils.text import clean_html
 
 API_URL = "https://www.reed.co.uk/api/1.0/search"
 DETAIL_URL = "https://www.reed.co.uk/api/1.0/jobs"
+PAGE_SIZE = 100
+DEFAULT_MAX_PAGES = 2
+DETAIL_WORKERS = 4
+DETAIL_CACHE_SIZE = 512
+
+# Full descriptions from the detail endpoint, by job id. Search results only
+# carry a truncated description.
+_DETAILS: OrderedDict[str, str] = OrderedDict()
+_DETAILS_LOCK = threading.Lock()
 
 
 def _get_api_key() -> str | None:
@@ -20,84 +34,169 @@ class ReedConnector(BaseConnector):
     """Reed.co.uk -- UK's largest job board.  Free API (register at reed.co.uk/developers)."""
 
     name = "reed"
+    # No incremental refresh: search results come in relevance order, so neither
+    # posting dates nor ids tell which results a previous fetch already covered.
+    rate_limit = RateLimit(rate=2, burst=4)
 
-    def __init__(self, keywords: str = "", location: str = ""):
+    def __init__(self, keywords: str = "", location: str = "", max_pages: int = DEFAULT_MAX_PAGES):
         self.keywords = keywords
         self.location = location
+        self.max_pages = max_pages
 
     @staticmethod
     def is_available() -> bool:
         return _get_api_key() is not None
 
-    def fetch_jobs(self) -> list[Job]:
+    def iter_jobs(self) -> Iterator[list[Job]]:
         api_key = _get_api_key()
         if not api_key:
-            return []
-
-        jobs: list[Job] = []
-        results_to_skip = 0
-        max_results = 200
-
-        with SafeHttpClient() as client:
-            while results_to_skip < max_results:
-                params: dict = {
-                    "resultsToTake": 100,
-                    "resultsToSkip": results_to_skip,
-                }
-                if self.keywords:
-                    params["keywords"] = self.keywords
-                if self.location:
-                    params["locationName"] = self.location
-
-                resp = client.get(
-                    API_URL,
-                    params=params,
-                    auth=(api_key, ""),
-                )
+            return
+
+        with SafeHttpClient(shared=True, **self.http_options()) as client:
+            def fetch_page(page: int) -> dict:
+                resp = client.get(API_URL, params=self._params(page), auth=(api_key, ""))
                 resp.raise_for_status()
-                data = resp.json()
-
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                for item in results:
-                    published = None
-                    if item.get("date"):
-                        try:
-                            published = datetime.fromisoformat(
-                                str(item["date"]).replace("Z", "+00:00")
-                            )
-                        except (ValueError, TypeError):
-                            pass
-
-                    salary_min = item.get("minimumSalary")
-                    salary_max = item.get("maximumSalary")
-                    currency = item.get("currency", "GBP") or "GBP"
-
-                    job_url = item.get("jobUrl", "")
-                    if not job_url and item.get("jobId"):
-                        job_url = f"https://www.reed.co.uk/jobs/{item['jobId']}"
-
-                    jobs.append(
-                        Job(
-                            id=f"reed-{item.get('jobId', '')}",
-                            title=item.get("jobTitle", ""),
-                            company=item.get("employerName", ""),
-                            description=clean_html(item.get("jobDescription", "")),
-                            url=job_url,
-                            source="reed",
-                            location=item.get("locationName", ""),
-                            remote_type="",
-                            salary_min=float(salary_min) if salary_min else None,
-                            salary_max=float(salary_max) if salary_max else None,
-                            salary_currency=currency,
-                            published_at=published,
-                        )
-                    )
-
-                if len(results) < 100:
-                    break
-                results_to_skip += 100
-
-        return jobs
+                return resp.json()
+
+            first = fetch_page(1)
+            results = first.get("results", [])
+            if not results:
+                return
+
+            yield [_parse_item(item) for item in results]
+
+            yield from iter_concurrently(
+                lambda page: _parse_page(fetch_page(page)),
+                self._remaining_pages(first),
+                max_workers=self.max_pages,
+            )
+
+    async def aiter_jobs(self) -> AsyncIterator[list[Job]]:
+        api_key = _get_api_key()
+        if not api_key:
+            return
+
+        async with AsyncSafeHttpClient(shared=True, **self.http_options()) as client:
+            async def fetch_page(page: int) -> dict:
+                resp = await client.get(API_URL, params=self._params(page), auth=(api_key, ""))
+                resp.raise_for_status()
+                return resp.json()
+
+            async def fetch_parsed(page: int) -> list[Job]:
+                return _parse_page(await fetch_page(page))
+
+            first = await fetch_page(1)
+            results = first.get("results", [])
+            if not results:
+                return
+
+            yield [_parse_item(item) for item in results]
+
+            async for page in aiter_concurrently(fetch_parsed, self._remaining_pages(first)):
+                yield page
+
+    def fetch_details(self, jobs: list[Job]) -> dict[str, Job]:
+        """Copies of ``jobs`` with their full descriptions, keyed by job id.
+
+        Jobs whose details cannot be fetched are left out.
+        """
+        api_key = _get_api_key()
+        if not api_key or not jobs:
+            return {}
+
+        with SafeHttpClient(shared=True, **self.http_options()) as client:
+            def fetch_detail(job: Job) -> list[Job]:
+                description = _cached_detail(job.id)
+                if description is None:
+                    try:
+                        resp = client.get(f"{DETAIL_URL}/{job.id.removeprefix('reed-')}", auth=(api_key, ""))
+                        resp.raise_for_status()
+                        description = clean_html(resp.json().get("jobDescription", ""))
+                    except Exception:
+                        return []
+                    if not description:
+                        return []
+                    _store_detail(job.id, description)
+                return [dataclasses.replace(job, description=description)]
+
+            pages = iter_concurrently(fetch_detail, jobs, max_workers=DETAIL_WORKERS)
+            return {job.id: job for page in pages for job in page}
+
+    def _remaining_pages(self, data: dict, current: int = 1) -> range:
+        """Pages after ``current``, sized from the total count the response reports."""
+        total = data.get("totalResults")
+        if isinstance(total, int):
+            last = min(self.max_pages, -(-total // PAGE_SIZE))
+        elif len(data.get("results", [])) >= PAGE_SIZE:
+            last = self.max_pages
+        else:
+            last = 1
+        return range(current + 1, last + 1)
+
+    def _params(self, page: int) -> dict:
+        params: dict = {
+            "resultsToTake": PAGE_SIZE,
+            "resultsToSkip": (page - 1) * PAGE_SIZE,
+        }
+        if self.keywords:
+            params["keywords"] = self.keywords
+        if self.location:
+            params["locationName"] = self.location
+        return params
+
+
+def _cached_detail(job_id: str) -> str | None:
+    with _DETAILS_LOCK:
+        description = _DETAILS.get(job_id)
+        if description is not None:
+            _DETAILS.move_to_end(job_id)
+        return description
+
+
+def _store_detail(job_id: str, description: str) -> None:
+    with _DETAILS_LOCK:
+        _DETAILS[job_id] = description
+        _DETAILS.move_to_end(job_id)
+        while len(_DETAILS) > DETAIL_CACHE_SIZE:
+            _DETAILS.popitem(last=False)
+
+
+def _parse_page(data: dict) -> list[Job]:
+    return [_parse_item(item) for item in data.get("results", [])]
+
+
+def _parse_item(item: dict) -> Job:
+    published = None
+    if item.get("date"):
+        date = str(item["date"])
+        try:
+            # The search API reports dd/mm/yyyy; ISO is accepted too.
+            if "/" in date:
+                published = datetime.strptime(date, "%d/%m/%Y").replace(tzinfo=timezone.utc)
+            else:
+                published = datetime.fromisoformat(date.replace("Z", "+00:00"))
+        except (ValueError, TypeError):
+            pass
+
+    salary_min = item.get("minimumSalary")
+    salary_max = item.get("maximumSalary")
+    currency = item.get("currency", "GBP") or "GBP"
+
+    job_url = item.get("jobUrl", "")
+    if not job_url and item.get("jobId"):
+        job_url = f"https://www.reed.co.uk/jobs/{item['jobId']}"
+
+    return Job(
+        id=f"reed-{item.get('jobId', '')}",
+        title=item.get("jobTitle", ""),
+        company=item.get("employerName", ""),
+        description=clean_html(item.get("jobDescription", "")),
+        url=job_url,
+        source="reed",
+        location=item.get("locationName", ""),
+        remote_type="",
+        salary_min=float(salary_min) if salary_min else None,
+        salary_max=float(salary_max) if salary_max else None,
+        salary_currency=currency,
+        published_at=published,
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.models.job import Job
@@ -16,49 +17,48 @@ class RemotiveConnector(BaseConnector):
     def __init__(self, search: str = ""):
         self.search = search
 
-    def fetch_jobs(self) -> list[Job]:
+    def iter_jobs(self) -> Iterator[list[Job]]:
         params = {}
         if self.search:
             params["search"] = self.search
 
-        with SafeHttpClient() as client:
+        with SafeHttpClient(shared=True, **self.http_options()) as client:
             resp = client.get(API_URL, params=params)
             resp.raise_for_status()
             data = resp.json()
 
-        jobs: list[Job] = []
-        for item in data.get("jobs", []):
-            published = None
-            if item.get("publication_date"):
-                try:
-                    published = datetime.fromisoformat(
-                        item["publication_date"].replace("Z", "+00:00")
-                    )
-                except (ValueError, TypeError):
-                    pass
-
-            tags = [t.strip().lower() for t in item.get("tags", []) if t]
-
-            salary_text = item.get("salary", "")
-            salary_min, salary_max = _parse_salary(salary_text)
-
-            jobs.append(
-                Job(
-                    id=f"remotive-{item['id']}",
-                    title=item.get("title", ""),
-                    company=item.get("company_name", ""),
-                    description=clean_html(item.get("description", "")),
-                    url=item.get("url", ""),
-                    source="remotive",
-                    location=item.get("candidate_required_location", "Worldwide"),
-                    remote_type="remote",
-                    salary_min=salary_min,
-                    salary_max=salary_max,
-                    tags=tags,
-                    published_at=published,
-                )
+        yield [_parse_item(item) for item in data.get("jobs", [])]
+
+
+def _parse_item(item: dict) -> Job:
+    published = None
+    if item.get("publication_date"):
+        try:
+            published = datetime.fromisoformat(
+                item["publication_date"].replace("Z", "+00:00")
             )
-        return jobs
+        except (ValueError, TypeError):
+            pass
+
+    tags = [t.strip().lower() for t in item.get("tags", []) if t]
+
+    salary_text = item.get("salary", "")
+    salary_min, salary_max = _parse_salary(salary_text)
+
+    return Job(
+        id=f"remotive-{item['id']}",
+        title=item.get("title", ""),
+        company=item.get("company_name", ""),
+        description=clean_html(item.get("description", "")),
+        url=item.get("url", ""),
+        source="remotive",
+        location=item.get("candidate_required_location", "Worldwide"),
+        remote_type="remote",
+        salary_min=salary_min,
+        salary_max=salary_max,
+        tags=tags,
+        published_at=published,
+    )
 
 
 def _parse_salary(text: str) -> tuple[float | None, float | None]:
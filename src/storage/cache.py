@@ -1,37 +1,90 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
 from src.models.job import Job
+from src.models.watermark import Watermark
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "job_cache.db"
 DEFAULT_TTL_SECONDS = 3600
+# SQLite's default limit on bound parameters per statement.
+_MAX_SQL_PARAMS = 999
+
+# (normalized text, model version, column indices, values) of a job's TF-IDF row.
+StoredVector = tuple[str, str, bytes, bytes]
 
 
 class JobCache:
-    """SQLite cache for job listings only. Never stores personal data."""
+    """SQLite cache for job listings only. Never stores personal data.
+
+    Besides individual jobs it records which jobs each connector query returned.
+    Query entries younger than ``ttl`` are fresh; entries up to ``ttl + stale_ttl``
+    old may still be served while a refresh runs. Query keys are stored hashed so
+    search terms never reach the disk. Each job's normalized text and TF-IDF row
+    can be stored too, valid while its content hash matches.
+    """
 
-    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH, ttl: int = DEFAULT_TTL_SECONDS):
+    def __init__(
+        self,
+        db_path: Path | str = DEFAULT_DB_PATH,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        stale_ttl: int = 0,
+    ):
         self.db_path = Path(db_path)
         self.ttl = ttl
+        self.stale_ttl = stale_ttl
         self._ensure_table()
 
     def _conn(self) -> sqlite3.Connection:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        return sqlite3.connect(str(self.db_path))
+        fresh = not self.db_path.exists()
+        conn = sqlite3.connect(str(self.db_path))
+        if fresh:
+            # The file can be deleted underneath us (e.g. "Delete all local data").
+            self._create_tables(conn)
+        return conn
 
     def _ensure_table(self) -> None:
         with self._conn() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id TEXT PRIMARY KEY,
-                    data TEXT NOT NULL,
-                    cached_at REAL NOT NULL
-                )
-            """)
+            self._create_tables(conn)
+
+    def _create_tables(self, conn: sqlite3.Connection) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                cached_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS queries (
+                key TEXT PRIMARY KEY,
+                job_ids TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS watermarks (
+                key TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_vectors (
+                job_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                text TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                indices BLOB NOT NULL,
+                data BLOB NOT NULL
+            )
+        """)
 
     def get_jobs(self, source: str) -> list[Job] | None:
         cutoff = time.time() - self.ttl
@@ -44,6 +97,12 @@ class JobCache:
             return None
         return [_dict_to_job(json.loads(row[0])) for row in rows]
 
+    def iter_jobs(self) -> Iterator[Job]:
+        """Every cached job, expired or not."""
+        with self._conn() as conn:
+            for (data,) in conn.execute("SELECT data FROM jobs"):
+                yield _dict_to_job(json.loads(data))
+
     def store_jobs(self, jobs: list[Job]) -> None:
         with self._conn() as conn:
             now = time.time()
@@ -53,17 +112,113 @@ class JobCache:
                     (job.id, json.dumps(_job_to_dict(job)), now),
                 )
 
+    def get_query(self, key: str) -> tuple[list[Job], float] | None:
+        """Return the jobs stored for a query and their age in seconds.
+
+        Entries older than ``ttl + stale_ttl`` are treated as missing.
+        """
+        cutoff = time.time() - self.ttl - self.stale_ttl
+        hashed = _hash_key(key)
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT fetched_at FROM queries WHERE key = ? AND fetched_at > ?",
+                (hashed, cutoff),
+            ).fetchone()
+            if row is None:
+                return None
+            rows = conn.execute(
+                "SELECT j.data FROM queries q, json_each(q.job_ids) e "
+                "JOIN jobs j ON j.id = e.value WHERE q.key = ?",
+                (hashed,),
+            ).fetchall()
+        jobs = [_dict_to_job(json.loads(r[0])) for r in rows]
+        return jobs, time.time() - row[0]
+
+    def store_query(
+        self, key: str, jobs: list[Job], changed: list[Job] | None = None, max_age: float | None = None
+    ) -> None:
+        """Record ``jobs`` as the result of a query.
+
+        When ``changed`` is given only those rows are rewritten; the rest of
+        ``jobs`` is assumed to be stored already and just has its timestamp bumped.
+        With ``max_age`` the entry is fresh for only that many seconds.
+        """
+        self.store_jobs(jobs if changed is None else changed)
+        job_ids = json.dumps([j.id for j in jobs])
+        with self._conn() as conn:
+            now = time.time()
+            fetched_at = now if max_age is None else now - max(self.ttl - max_age, 0)
+            if changed is not None:
+                conn.execute(
+                    "UPDATE jobs SET cached_at = ? WHERE id IN (SELECT value FROM json_each(?))",
+                    (now, job_ids),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO queries (key, job_ids, fetched_at) VALUES (?, ?, ?)",
+                (_hash_key(key), job_ids, fetched_at),
+            )
+
+    def get_watermark(self, key: str) -> Watermark | None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT data FROM watermarks WHERE key = ?", (_hash_key(key),)
+            ).fetchone()
+        return Watermark.from_dict(json.loads(row[0])) if row else None
+
+    def store_watermark(self, key: str, watermark: Watermark) -> None:
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (key, data, updated_at) VALUES (?, ?, ?)",
+                (_hash_key(key), json.dumps(watermark.to_dict()), time.time()),
+            )
+
+    def get_vectors(self, content_hashes: dict[str, str]) -> dict[str, StoredVector]:
+        """Stored vectors for the job ids in ``content_hashes`` whose content still matches."""
+        ids = list(content_hashes)
+        found: dict[str, StoredVector] = {}
+        with self._conn() as conn:
+            for start in range(0, len(ids), _MAX_SQL_PARAMS):
+                chunk = ids[start:start + _MAX_SQL_PARAMS]
+                rows = conn.execute(
+                    "SELECT job_id, content_hash, text, model_version, indices, data FROM job_vectors "
+                    f"WHERE job_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+                for job_id, content_hash, *vector in rows:
+                    if content_hashes[job_id] == content_hash:
+                        found[job_id] = tuple(vector)
+        return found
+
+    def store_vectors(self, vectors: dict[str, tuple[str, StoredVector]]) -> None:
+        """Store ``job id -> (content hash, vector)`` entries."""
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO job_vectors "
+                "(job_id, content_hash, text, model_version, indices, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [(job_id, content_hash, *vector) for job_id, (content_hash, vector) in vectors.items()],
+            )
+
     def clear(self) -> None:
         with self._conn() as conn:
             conn.execute("DELETE FROM jobs")
+            conn.execute("DELETE FROM queries")
+            conn.execute("DELETE FROM watermarks")
+            conn.execute("DELETE FROM job_vectors")
 
     def clear_expired(self) -> int:
-        cutoff = time.time() - self.ttl
+        cutoff = time.time() - self.ttl - self.stale_ttl
         with self._conn() as conn:
             cursor = conn.execute("DELETE FROM jobs WHERE cached_at < ?", (cutoff,))
+            conn.execute("DELETE FROM job_vectors WHERE job_id NOT IN (SELECT id FROM jobs)")
+            conn.execute("DELETE FROM queries WHERE fetched_at < ?", (cutoff,))
+            conn.execute("DELETE FROM watermarks WHERE updated_at < ?", (cutoff,))
             return cursor.rowcount
 
 
+def _hash_key(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
 def _job_to_dict(job: Job) -> dict:
     return {
         "id": job.id,
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.models.job import Job
+from src.storage.cache import _MAX_SQL_PARAMS, DEFAULT_DB_PATH
+
+NEW = "new"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class MergeResult:
+    """How each job of a fetch compares with earlier runs, by job id."""
+
+    status: dict[str, str] = field(default_factory=dict)
+
+    def ids(self, status: str) -> set[str]:
+        return {job_id for job_id, s in self.status.items() if s == status}
+
+    @property
+    def new(self) -> set[str]:
+        return self.ids(NEW)
+
+    @property
+    def changed(self) -> set[str]:
+        return self.ids(CHANGED)
+
+    @property
+    def unchanged(self) -> set[str]:
+        return self.ids(UNCHANGED)
+
+
+class DedupIndex:
+    """Postings seen across runs: canonical key -> best job id and content hash.
+
+    Lives in the job cache database, so it is wiped with it. Keys are stored as
+    16-byte digests of ``Job.dedup_key``, which keeps rows small and avoids
+    writing a readable list of the postings the user has looked at.
+    """
+
+    def __init__(self, db_path: Path | str = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        with self._conn() as conn:
+            self._create_table(conn)
+
+    def _conn(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not self.db_path.exists()
+        conn = sqlite3.connect(str(self.db_path))
+        if fresh:
+            self._create_table(conn)
+        return conn
+
+    @staticmethod
+    def _create_table(conn: sqlite3.Connection) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dedup_index (
+                key BLOB PRIMARY KEY,
+                job_id TEXT NOT NULL,
+                content_hash BLOB NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+    def merge(self, jobs: list[Job]) -> MergeResult:
+        """Record ``jobs`` (already deduplicated) and classify them against earlier runs.
+
+        A job is new if no earlier run saw its canonical key, changed if the key
+        was seen with different content, and unchanged otherwise.
+        """
+        result = MergeResult()
+        if not jobs:
+            return result
+        rows = {_digest(job.dedup_key): job for job in jobs}
+        now = time.time()
+        by_key: dict[bytes, str] = {}
+        with self._conn() as conn:
+            known = self._known(conn, list(rows))
+            upserts = []
+            for key, job in rows.items():
+                content = bytes.fromhex(job.content_hash)
+                previous = known.get(key)
+                if previous is None:
+                    by_key[key] = NEW
+                else:
+                    by_key[key] = UNCHANGED if previous == content else CHANGED
+                upserts.append((key, job.id, content, now, now))
+            conn.executemany(
+                "INSERT INTO dedup_index (key, job_id, content_hash, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "job_id = excluded.job_id, content_hash = excluded.content_hash, last_seen = excluded.last_seen",
+                upserts,
+            )
+        for job in jobs:
+            result.status[job.id] = by_key[_digest(job.dedup_key)]
+        return result
+
+    @staticmethod
+    def _known(conn: sqlite3.Connection, keys: list[bytes]) -> dict[bytes, bytes]:
+        known: dict[bytes, bytes] = {}
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            chunk = keys[start:start + _MAX_SQL_PARAMS]
+            known.update(conn.execute(
+                f"SELECT key, content_hash FROM dedup_index WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall())
+        return known
+
+    def __len__(self) -> int:
+        with self._conn() as conn:
+            return conn.execute("SELECT COUNT(*) FROM dedup_index").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._conn() as conn:
+            conn.execute("DELETE FROM dedup_index")
+
+    def prune(self, max_age: float) -> int:
+        """Forget postings not seen for ``max_age`` seconds."""
+        with self._conn() as conn:
+            cursor = conn.execute("DELETE FROM dedup_index WHERE last_seen < ?", (time.time() - max_age,))
+            return cursor.rowcount
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
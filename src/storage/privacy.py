@@ -48,10 +48,11 @@ class PrivacyManager:
             self.storage_path.unlink()
             deleted = True
 
-        cache_db = self.storage_path.parent / "job_cache.db"
-        if cache_db.exists():
-            cache_db.unlink()
-            deleted = True
+        for name in ("job_cache.db", "text_model.npz"):
+            path = self.storage_path.parent / name
+            if path.exists():
+                path.unlink()
+                deleted = True
 
         return deleted
 
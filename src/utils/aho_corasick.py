@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import deque
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (Aho-Corasick automaton).
+
+    Built once from the patterns; ``find`` then scans a text in a single pass
+    regardless of how many patterns there are.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = list(dict.fromkeys(p for p in patterns if p))
+        # State 0 is the root. _goto[s] maps a character to the next state.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[str | None] = [None]
+        for pattern in self.patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+            state = nxt
+        if self._out[state] is None:
+            self._out[state] = pattern
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[nxt] is None:
+                    # A pattern ending at the fallback state also ends here.
+                    self._out[nxt] = self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> str | None:
+        """The first pattern (by end position) occurring in ``text``, if any."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state] is not None:
+                return out[state]
+        return None
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
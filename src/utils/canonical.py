@@ -0,0 +1,79 @@
+"""Canonical forms of company names and job titles, used as dedup keys.
+
+The same employer shows up as "Stripe", "Stripe, Inc." and "Stripe" (from the
+Greenhouse slug ``stripe``); the same role as "Sr. Backend Engineer (m/w/d)"
+and "Senior Backend Engineer". Both are reduced to a form that compares equal.
+Word order is kept and the work mode is part of the key, so postings that
+differ in either are not merged.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+CACHE_SIZE = 1 << 14
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+# Gender markers common on German boards: (m/w/d), (f/m/x), (all genders) ...
+_GENDER_MARKER = re.compile(r"\(\s*(?:all genders|[mwfdx](?:\s*/\s*[mwfdx])+|gn)\s*\*?\)")
+
+_LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "ltd", "limited", "llc", "llp", "plc", "corp", "corporation",
+    "co", "company", "gmbh", "ag", "se", "sa", "sas", "sarl", "srl", "spa", "bv", "nv",
+    "oy", "ab", "as", "aps", "pty", "pte", "kg", "ug", "holdings", "group",
+})
+_TITLE_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "jnr": "junior",
+    "eng": "engineer", "engr": "engineer", "mgr": "manager", "dev": "developer",
+    "swe": "software engineer", "sde": "software engineer", "vp": "vice president",
+    "assoc": "associate", "mid": "intermediate", "midlevel": "intermediate",
+}
+_TITLE_STOPWORDS = frozenset({"a", "an", "the", "of", "and", "remote", "hybrid"})
+
+
+def _fold(text: str) -> str:
+    """Lowercase ASCII form: accents stripped, compatibility forms unified."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold().replace("&", " and ")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_company(name: str) -> str:
+    """``"Stripe, Inc."``, ``"stripe"`` and ``"STRIPE Ltd"`` all become ``"stripe"``.
+
+    Tokens are joined without spaces, so slug forms (``open-ai``) match the
+    display name (``OpenAI``).
+    """
+    tokens = [t for t in _TOKEN.findall(_fold(name)) if t != "and"]
+    while len(tokens) > 1 and tokens[-1] in _LEGAL_SUFFIXES:
+        tokens.pop()
+    return "".join(tokens)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_title(title: str) -> str:
+    """Title words in order, with abbreviations expanded and noise dropped.
+
+    ``"Sr. Backend Engineer (m/w/d)"`` and ``"Senior Backend Engineer"`` both
+    become ``"senior backend engineer"``.
+    """
+    text = _GENDER_MARKER.sub(" ", _fold(title))
+    words = [
+        word
+        for token in _TOKEN.findall(text)
+        for word in _TITLE_ABBREVIATIONS.get(token, token).split()
+        if word not in _TITLE_STOPWORDS
+    ]
+    return " ".join(words)
+
+
+def canonical_key(company: str, title: str, remote_type: str = "") -> str:
+    """Interned ``company::title::remote_type`` key; equal keys are the same string object.
+
+    Work-mode words are dropped from the title, so the posting's remote type
+    keeps remote and on-site openings for the same role apart.
+    """
+    return sys.intern(f"{canonical_company(company)}::{canonical_title(title)}::{remote_type}")
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import httpx
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Only these headers are replayed; the stored body is already decoded, so
+# content-encoding / content-length from the original response would be wrong.
+_REPLAY_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+
+@dataclass
+class _Entry:
+    etag: str
+    last_modified: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+
+
+class ValidatorCache:
+    """Bounded in-memory store of ETag / Last-Modified validators with their bodies.
+
+    Used by SafeHttpClient to turn repeat GETs into conditional requests and to
+    serve 304 Not Modified answers from the stored body.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.revalidated = 0
+        self.stored = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params=None) -> str:
+        return str(httpx.URL(url, params=params)) if params else str(httpx.URL(url))
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, key: str, response: httpx.Response) -> httpx.Response:
+        """Store a fresh 200 or rebuild the stored response for a 304."""
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.revalidated += 1
+            if entry is None:
+                return response
+            return httpx.Response(
+                entry.status_code,
+                headers=entry.headers,
+                content=entry.content,
+                request=response.request,
+                extensions={"not_modified": True},
+            )
+
+        if response.status_code == 200:
+            etag = response.headers.get("etag", "")
+            last_modified = response.headers.get("last-modified", "")
+            if etag or last_modified:
+                self._store(key, _Entry(
+                    etag=etag,
+                    last_modified=last_modified,
+                    status_code=response.status_code,
+                    headers={h: response.headers[h] for h in _REPLAY_HEADERS if h in response.headers},
+                    content=response.content,
+                ))
+        return response
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        size = len(entry.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old.content)
+            self._entries[key] = entry
+            self._bytes += size
+            self.stored += 1
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ParsedResponseMemo:
+    """Parsed results keyed by URL + validator, so a revalidated body is not parsed again."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(response: httpx.Response) -> tuple[str, str] | None:
+        validator = response.headers.get("etag") or response.headers.get("last-modified")
+        if not isinstance(validator, str) or not validator:
+            return None
+        return str(response.request.url), validator
+
+    def get(self, response: httpx.Response):
+        key = self._key(response)
+        if key is None:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, response: httpx.Response, value) -> None:
+        key = self._key(response)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: ValidatorCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_validator_cache() -> ValidatorCache:
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ValidatorCache()
+        return _default_cache
@@ -1,58 +1,286 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
 import httpx
 
+from src.utils.aho_corasick import AhoCorasick
+from src.utils.http_cache import ValidatorCache, get_validator_cache
+from src.utils.http_pool import DEFAULT_HEADERS, ClientRegistry, get_client_registry
+from src.utils.http_retry import (
+    NO_RETRY,
+    RateLimit,
+    RetryPolicy,
+    get_host_bucket,
+    parse_retry_after,
+    record_retry,
+)
+
 
 class PrivacyViolationError(Exception):
     pass
 
 
-_BLOCKED_PATTERNS: list[str] = []
+VERDICT_CACHE_SIZE = 4096
+
+_matcher = AhoCorasick([])
+_matcher_lock = threading.Lock()
+# Canonical requests already checked against the current fragments.
+_CLEARED: OrderedDict[tuple[str, str], None] = OrderedDict()
 
 
 def register_personal_fragments(fragments: list[str]) -> None:
     """Register CV text fragments that must never appear in outbound requests."""
-    _BLOCKED_PATTERNS.clear()
-    for frag in fragments:
-        cleaned = frag.strip()
-        if len(cleaned) >= 12:
-            _BLOCKED_PATTERNS.append(cleaned.lower())
+    global _matcher
+    patterns = [frag.strip().lower() for frag in fragments if len(frag.strip()) >= 12]
+    matcher = AhoCorasick(patterns)
+    with _matcher_lock:
+        _matcher = matcher
+        _CLEARED.clear()
 
 
 def _check_payload(text: str, context: str) -> None:
-    if not _BLOCKED_PATTERNS:
+    if _matcher and _matcher.find(text.lower()) is not None:
+        raise PrivacyViolationError(
+            f"Personal data detected in {context}. "
+            f"Outbound requests must not contain CV content."
+        )
+
+
+def _canonical_params(params) -> str:
+    """Query params as one line per ``key=value`` pair, in a stable order."""
+    if isinstance(params, (str, bytes)):
+        return params.decode() if isinstance(params, bytes) else params
+    if hasattr(params, "multi_items"):
+        items = params.multi_items()
+    else:
+        items = params.items() if hasattr(params, "items") else params
+    pairs = []
+    for key, value in items:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend(f"{key}={v}" for v in values)
+    return "\n".join(sorted(pairs))
+
+
+def _check_request(url: str, params) -> None:
+    matcher = _matcher
+    if not matcher:
         return
-    text_lower = text.lower()
-    for pattern in _BLOCKED_PATTERNS:
-        if pattern in text_lower:
-            raise PrivacyViolationError(
-                f"Personal data detected in {context}. "
-                f"Outbound requests must not contain CV content."
-            )
+    key = (url, _canonical_params(params) if params else "")
+    with _matcher_lock:
+        if key in _CLEARED and matcher is _matcher:
+            _CLEARED.move_to_end(key)
+            return
+    _check_payload(url, "URL")
+    if key[1]:
+        _check_payload(key[1], "query params")
+    with _matcher_lock:
+        if matcher is _matcher:
+            _CLEARED[key] = None
+            while len(_CLEARED) > VERDICT_CACHE_SIZE:
+                _CLEARED.popitem(last=False)
+
+
+def _with_validators(cache: ValidatorCache, url: str, kwargs: dict) -> str:
+    key = cache.key(url, kwargs.get("params"))
+    conditional = cache.conditional_headers(key)
+    if conditional:
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional}
+    return key
+
+
+class _RetryState:
+    """Per-client pacing and retry bookkeeping shared by the sync and async clients."""
+
+    def __init__(self, retry: RetryPolicy | None, rate_limit: RateLimit | None):
+        self.policy = retry or NO_RETRY
+        self.rate_limit = rate_limit
+        self.retries = 0
+
+    def pace(self, url: str) -> float:
+        if self.rate_limit is None:
+            return 0.0
+        return get_host_bucket(httpx.URL(url).host, self.rate_limit).reserve()
+
+    def backoff(self, url: str, attempt: int, response: httpx.Response | None) -> float | None:
+        """Return the delay before the next attempt, or None to give up."""
+        if attempt >= self.policy.max_retries:
+            return None
+        if response is not None and not self.policy.should_retry(response):
+            return None
+        self.retries += 1
+        record_retry(httpx.URL(url).host)
+        return self.policy.delay(attempt, parse_retry_after(response) if response is not None else None)
 
 
 class SafeHttpClient:
-    """HTTP client wrapper that blocks requests containing personal data."""
+    """HTTP client wrapper that blocks requests containing personal data.
+
+    With ``shared=True`` (or an explicit ``registry``) requests go through the
+    pooled client of a ClientRegistry, which stays open after ``close()``.
+    With ``revalidate=True`` (or an explicit ``validator_cache``) repeat GETs are
+    sent as conditional requests and 304 answers are served from the stored body.
+    ``rate_limit`` paces requests through a process-wide token bucket per host and
+    ``retry`` retries 429/5xx answers and transport errors with backoff.
+    """
 
-    def __init__(self, timeout: float = 30.0):
-        self._client = httpx.Client(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={"User-Agent": "JobSeekerCheater/1.0 (local tool)"},
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        shared: bool = False,
+        registry: ClientRegistry | None = None,
+        revalidate: bool = False,
+        validator_cache: ValidatorCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+    ):
+        self._timeout = timeout
+        self._retry = _RetryState(retry, rate_limit)
+        self._validators = validator_cache if validator_cache is not None else (
+            get_validator_cache() if revalidate else None
         )
+        self._registry = registry or (get_client_registry() if shared else None)
+        if self._registry is not None and not self._registry.paced:
+            self._retry.rate_limit = None
+        if self._registry is not None:
+            self._client = self._registry.client()
+        else:
+            self._client = httpx.Client(
+                timeout=timeout,
+                follow_redirects=True,
+                headers=DEFAULT_HEADERS,
+            )
 
     def get(self, url: str, **kwargs) -> httpx.Response:
-        _check_payload(url, "URL")
-        params = kwargs.get("params")
-        if params:
-            _check_payload(str(params), "query params")
-        return self._client.get(url, **kwargs)
+        _check_request(url, kwargs.get("params"))
+        if self._validators is None:
+            return self._send(url, kwargs)
+        key = _with_validators(self._validators, url, kwargs)
+        return self._validators.resolve(key, self._send(url, kwargs))
+
+    @property
+    def retries(self) -> int:
+        return self._retry.retries
+
+    def _send(self, url: str, kwargs: dict) -> httpx.Response:
+        attempt = 0
+        while True:
+            wait = self._retry.pace(url)
+            if wait:
+                time.sleep(wait)
+            try:
+                resp = self._send_once(url, kwargs)
+            except httpx.TransportError:
+                delay = self._retry.backoff(url, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry.backoff(url, attempt, resp)
+                if delay is None:
+                    return resp
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_once(self, url: str, kwargs: dict) -> httpx.Response:
+        if self._registry is None:
+            return self._client.get(url, **kwargs)
+        kwargs.setdefault("timeout", self._timeout)
+        with self._registry.host_slot(httpx.URL(url).host):
+            return self._client.get(url, **kwargs)
 
     def close(self) -> None:
-        self._client.close()
+        if self._registry is None:
+            self._client.close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
         self.close()
+
+
+class AsyncSafeHttpClient:
+    """Async counterpart of SafeHttpClient; runs the same outbound checks before every request."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        transport: httpx.AsyncBaseTransport | None = None,
+        shared: bool = False,
+        registry: ClientRegistry | None = None,
+        revalidate: bool = False,
+        validator_cache: ValidatorCache | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+    ):
+        self._timeout = timeout
+        self._retry = _RetryState(retry, rate_limit)
+        self._validators = validator_cache if validator_cache is not None else (
+            get_validator_cache() if revalidate else None
+        )
+        self._registry = registry or (get_client_registry() if shared else None)
+        if self._registry is not None and not self._registry.paced:
+            self._retry.rate_limit = None
+        if self._registry is not None:
+            self._client = self._registry.async_client()
+        else:
+            self._client = httpx.AsyncClient(
+                timeout=timeout,
+                follow_redirects=True,
+                headers=DEFAULT_HEADERS,
+                limits=httpx.Limits(max_connections=max_connections),
+                transport=transport,
+            )
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        _check_request(url, kwargs.get("params"))
+        if self._validators is None:
+            return await self._send(url, kwargs)
+        key = _with_validators(self._validators, url, kwargs)
+        return self._validators.resolve(key, await self._send(url, kwargs))
+
+    @property
+    def retries(self) -> int:
+        return self._retry.retries
+
+    async def _send(self, url: str, kwargs: dict) -> httpx.Response:
+        attempt = 0
+        while True:
+            wait = self._retry.pace(url)
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                resp = await self._send_once(url, kwargs)
+            except httpx.TransportError:
+                delay = self._retry.backoff(url, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry.backoff(url, attempt, resp)
+                if delay is None:
+                    return resp
+                await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(self, url: str, kwargs: dict) -> httpx.Response:
+        if self._registry is None:
+            return await self._client.get(url, **kwargs)
+        kwargs.setdefault("timeout", self._timeout)
+        async with self._registry.async_host_slot(httpx.URL(url).host):
+            return await self._client.get(url, **kwargs)
+
+    async def aclose(self) -> None:
+        if self._registry is None:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -0,0 +1,149 @@
+"""Record and replay HTTP traffic so connectors can run without network access.
+
+Both transports plug into ``ClientRegistry(transport=...)``. Request headers
+and credential query params are never written to an archive.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+from pathlib import Path
+
+import httpx
+
+from src.utils.http_pool import ClientRegistry
+
+# Recorded bodies are stored decoded, so transfer headers no longer apply.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"})
+# Left out of archive keys so a replay matches whatever credentials it runs with.
+_CREDENTIAL_PARAMS = frozenset({"app_id", "app_key", "api_key"})
+
+
+class HttpArchive:
+    """Responses keyed by method, URL and (sorted) query params."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else None
+        self.entries: dict[str, dict] = {}
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        url = request.url
+        query = sorted((k, v) for k, v in url.params.multi_items() if k not in _CREDENTIAL_PARAMS)
+        return f"{request.method} {url.copy_with(query=None)}?{httpx.QueryParams(query)}"
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        if response.status_code == 304:
+            return  # keep the full response recorded earlier
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        entry = {
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            "body": body,
+            "encoding": encoding,
+        }
+        with self._lock:
+            self.entries[self.key(request)] = entry
+
+    def response(self, request: httpx.Request) -> httpx.Response | None:
+        with self._lock:
+            entry = self.entries.get(self.key(request))
+            if entry is None:
+                self.misses += 1
+                return None
+        headers = entry["headers"]
+        etag = headers.get("etag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=headers)
+        body = entry["body"]
+        content = base64.b64decode(body) if entry["encoding"] == "base64" else body.encode("utf-8")
+        return httpx.Response(entry["status"], headers=headers, content=content)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self, path: str | Path | None = None) -> Path:
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No archive path given")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = json.dumps({"entries": self.entries}, sort_keys=True)
+        target.write_text(data, encoding="utf-8")
+        return target
+
+    @classmethod
+    def load(cls, path: str | Path) -> HttpArchive:
+        archive = cls(path)
+        archive.entries = json.loads(Path(path).read_text(encoding="utf-8")).get("entries", {})
+        return archive
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests to the network and records every response into ``archive``."""
+
+    def __init__(
+        self,
+        archive: HttpArchive,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.archive = archive
+        self._transport = transport or httpx.HTTPTransport()
+        self._async_transport = async_transport or httpx.AsyncHTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self.archive.record(request, response)
+        return _detached(response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        self.archive.record(request, response)
+        return _detached(response)
+
+    def close(self) -> None:
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        await self._async_transport.aclose()
+
+
+def _detached(response: httpx.Response) -> httpx.Response:
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+    return httpx.Response(response.status_code, headers=headers, content=response.content)
+
+
+def replay_transport(archive: HttpArchive, strict: bool = False) -> httpx.MockTransport:
+    """Serve recorded responses; unknown requests get a 404 (or raise when ``strict``)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = archive.response(request)
+        if response is not None:
+            return response
+        if strict:
+            raise httpx.ConnectError(f"No recorded response for {archive.key(request)}", request=request)
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+def replay_registry(archive: HttpArchive, strict: bool = False) -> ClientRegistry:
+    """A client registry that answers from ``archive`` without rate-limit pauses."""
+    return ClientRegistry(transport=replay_transport(archive, strict=strict), paced=False)
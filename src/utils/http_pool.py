@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import threading
+import weakref
+
+import httpx
+
+DEFAULT_HEADERS = {"User-Agent": "JobSeekerCheater/1.0 (local tool)"}
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 40
+DEFAULT_KEEPALIVE_EXPIRY = 120.0
+DEFAULT_MAX_PER_HOST = 8
+
+# Board APIs serve one company per request, so fan-out concentrates on a single host.
+DEFAULT_HOST_LIMITS = {
+    "boards-api.greenhouse.io": 32,
+    "api.lever.co": 32,
+}
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class ClientRegistry:
+    """Pooled httpx clients shared by every connector in the process.
+
+    Keeps TLS sessions and keep-alive connections warm between searches. The sync
+    client is shared by all threads; async clients are created per event loop
+    because httpx connections cannot move between loops. ``max_per_host`` (or an
+    entry in ``host_limits``) caps concurrent requests to one host. With
+    ``paced=False`` clients skip their rate limits, e.g. when ``transport``
+    replays recorded responses.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        host_limits: dict[str, int] | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        paced: bool = True,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_per_host = max_per_host
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self.http2 = http2 and http2_available()
+        self.transport = transport
+        self.paced = paced
+
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._async_host_slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    headers=DEFAULT_HEADERS,
+                    limits=self.limits,
+                    http2=self.http2,
+                    transport=self.transport if isinstance(self.transport, httpx.BaseTransport) else None,
+                )
+            return self._client
+
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    headers=DEFAULT_HEADERS,
+                    limits=self.limits,
+                    http2=self.http2,
+                    transport=self.transport if isinstance(self.transport, httpx.AsyncBaseTransport) else None,
+                )
+                self._async_clients[loop] = client
+            return client
+
+    def host_limit(self, host: str) -> int:
+        return self.host_limits.get(host, self.max_per_host)
+
+    def host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.host_limit(host))
+            return slot
+
+    def async_host_slot(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_host_slots.setdefault(loop, {})
+            slot = slots.get(host)
+            if slot is None:
+                slot = slots[host] = asyncio.Semaphore(self.host_limit(host))
+            return slot
+
+    def close(self) -> None:
+        """Close the sync client. Async clients are dropped with their event loop."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._async_host_slots = weakref.WeakKeyDictionary()
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_registry: ClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def set_client_registry(registry: ClientRegistry | None) -> ClientRegistry | None:
+    """Install ``registry`` as the process-wide default and return the previous one.
+
+    The caller owns the previous registry and is responsible for closing it.
+    """
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+        return previous
+
+
+def close_client_registry() -> None:
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
+
+
+atexit.register(close_client_registry)
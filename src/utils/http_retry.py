@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry with full-jitter exponential backoff; ``Retry-After`` wins when the server sends it."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+
+    def should_retry(self, response: httpx.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained requests per second and the burst allowed on top of it."""
+
+    rate: float
+    burst: int = 1
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+_buckets: dict[str, TokenBucket] = {}
+_retry_counts: Counter[str] = Counter()
+_lock = threading.Lock()
+
+
+def get_host_bucket(host: str, limit: RateLimit) -> TokenBucket:
+    """Process-wide bucket for ``host``; the first limit configured for a host wins."""
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(limit.rate, limit.burst)
+        return bucket
+
+
+def record_retry(host: str) -> None:
+    with _lock:
+        _retry_counts[host] += 1
+
+
+def get_retry_counts() -> dict[str, int]:
+    with _lock:
+        return dict(_retry_counts)
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
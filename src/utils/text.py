@@ -1,24 +1,92 @@
 from __future__ import annotations
 
-import re
+import hashlib
 import html
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+# One scan for both <br> and other tags. A tag may swallow <br> tags before its
+# closing '>' (as if <br> had been replaced first); the possessive repeat keeps
+# an unclosed tag from ending at a <br>'s '>'.
+_TAG = re.compile(r"<(?:(br\s*/?>)|(?:<br\s*/?>|[^>])++>)", re.IGNORECASE)
+# Runs of spaces/tabs that are not already a single space.
+_SPACES = re.compile(r"\t[ \t]*| [ \t]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_NON_MATCHING_CHARS = re.compile(r"[^a-z0-9\s\-\+\#\.]+")
+
+MEMO_SIZE = 4096
+# Shorter inputs are cheaper to clean than to hash.
+MEMO_MIN_LENGTH = 128
+
+
+class _ContentMemo:
+    """Bounded LRU of results keyed by a hash of the input text."""
+
+    def __init__(self, max_entries: int = MEMO_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, fn: Callable[[str], str], text: str) -> str:
+        if len(text) < MEMO_MIN_LENGTH:
+            return fn(text)
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+        result = fn(text)
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_CLEANED = _ContentMemo()
+_NORMALIZED = _ContentMemo()
+
+
+def clear_memos() -> None:
+    _CLEANED.clear()
+    _NORMALIZED.clear()
+
+
+def _replace_tag(match: re.Match) -> str:
+    return "\n" if match.group(1) else " "
+
+
+def _clean_html(raw: str) -> str:
+    text = _TAG.sub(_replace_tag, raw) if "<" in raw else raw
+    return collapse_whitespace(html.unescape(text))
 
 
 def clean_html(raw: str) -> str:
-    text = re.sub(r"<br\s*/?>", "\n", raw, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = html.unescape(text)
-    return collapse_whitespace(text)
+    return _CLEANED(_clean_html, raw)
 
 
 def collapse_whitespace(text: str) -> str:
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\t" in text or "  " in text:
+        text = _SPACES.sub(" ", text)
+    if "\n\n\n" in text:
+        text = _BLANK_LINES.sub("\n\n", text)
     return text.strip()
 
 
-def normalize_for_matching(text: str) -> str:
-    text = clean_html(text)
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s\-\+\#\.]", " ", text)
+def _normalize_for_matching(text: str) -> str:
+    text = _NON_MATCHING_CHARS.sub(" ", clean_html(text).lower())
     return collapse_whitespace(text)
+
+
+def normalize_for_matching(text: str) -> str:
+    return _NORMALIZED(_normalize_for_matching, text)
@@ -0,0 +1,54 @@
+import pytest
+
+from src.matching.batch import score_batch
+from src.matching.filters import apply_hard_filters
+from src.matching.scorer import score_jobs
+from src.matching.text_model import TextModel, job_text
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+
+
+def _jobs() -> list[Job]:
+    specs = [
+        ("Python Engineer", "Python, SQL and Node.js services", "remote", ["python"]),
+        ("Data Scientist", "Machine learning with Python and SQL", "hybrid", []),
+        ("Frontend Developer", "React, TypeScript and Node.js", "onsite", ["react"]),
+        ("Go Engineer", "Go microservices on Kubernetes", "remote", []),
+        ("Sales Manager", "Enterprise sales in fintech", "onsite", []),
+    ]
+    return [
+        Job(id=f"t-{i}", title=title, company="Acme", description=desc, url="", source="test",
+            remote_type=remote, tags=tags)
+        for i, (title, desc, remote, tags) in enumerate(specs)
+    ]
+
+
+def test_batch_matches_score_jobs_per_profile():
+    jobs = _jobs()
+    model = TextModel.fit([job_text(j) for j in jobs])
+    seekers = [
+        (Profile(raw_text="Python and SQL engineer", skills=["python", "sql"]), Preferences()),
+        (Profile(raw_text="Frontend React developer", skills=["react", "node.js"]),
+         Preferences(remote_types=["onsite"])),
+        (Profile(raw_text="Go and Kubernetes", skills=["go", "kubernetes", "rust"]),
+         Preferences(target_titles=["Engineer"])),
+        (Profile(), Preferences()),
+    ]
+
+    batch = score_batch(seekers, jobs, top_k=3, text_model=model)
+    assert len(batch) == len(seekers)
+    for (profile, prefs), rows in zip(seekers, batch):
+        expected = score_jobs(apply_hard_filters(jobs, prefs), profile, prefs, text_model=model)[:3]
+        assert [r[0].id for r in rows] == [r[0].id for r in expected]
+        for a, b in zip(rows, expected):
+            assert a[1] == pytest.approx(b[1], abs=1e-6)
+            assert a[2] == pytest.approx(b[2], abs=1e-6)
+
+
+def test_batch_fits_model_when_none_given():
+    jobs = _jobs()
+    seekers = [(Profile(raw_text="Go on Kubernetes", skills=["go"]), Preferences())]
+    rows = score_batch(seekers, jobs, top_k=1)[0]
+    assert rows[0][0].id == "t-3"
+    assert score_batch([], jobs) == []
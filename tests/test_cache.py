@@ -0,0 +1,269 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.job import Job
+from src.models.watermark import Watermark
+from src.sources.base import BaseConnector
+from src.sources.cached import ReadThroughCache
+from src.storage.cache import JobCache
+
+
+def _make_job(job_id: str, title: str = "Engineer") -> Job:
+    return Job(
+        id=job_id,
+        title=title,
+        company="TestCo",
+        description="Build things",
+        url="https://example.com",
+        source="test",
+    )
+
+
+class _CountingConnector(BaseConnector):
+    name = "test"
+
+    def __init__(self, keywords: str = ""):
+        self.keywords = keywords
+        self.calls = 0
+
+    def iter_jobs(self):
+        self.calls += 1
+        yield [_make_job(f"test-{self.keywords}-{self.calls}")]
+
+    def cache_params(self) -> dict:
+        return {"keywords": self.keywords}
+
+
+class _BoardsConnector(BaseConnector):
+    """Yields one page per board; boards listed in ``down`` fail and are skipped."""
+
+    name = "boards"
+
+    def __init__(self, boards: list[str]):
+        self.boards = boards
+        self.down: set[str] = set()
+        self.calls = 0
+
+    def iter_jobs(self):
+        self.calls += 1
+        self.failed_pages = 0
+        for board in self.boards:
+            if board in self.down:
+                self.failed_pages += 1
+                continue
+            yield [_make_job(f"boards-{board}")]
+
+    def cache_params(self) -> dict:
+        return {"boards": self.boards}
+
+
+class _FeedConnector(BaseConnector):
+    """Newest-first feed; each call publishes one more posting."""
+
+    name = "feed"
+    supports_watermark = True
+    newest_first = True
+
+    def __init__(self):
+        self.feed = [_make_job("feed-1")]
+        self.fetched: list[list[str]] = []
+        self.partial = False
+
+    def iter_jobs(self):
+        self.failed_pages = int(self.partial)
+        jobs, _ = self._unseen(list(reversed(self.feed)))
+        self.fetched.append([j.id for j in jobs])
+        yield jobs
+
+    def cache_params(self) -> dict:
+        return {}
+
+
+@pytest.fixture
+def job_cache(tmp_path):
+    return JobCache(db_path=tmp_path / "cache.db", ttl=60, stale_ttl=600)
+
+
+def test_query_roundtrip_hashes_key(job_cache):
+    job_cache.store_query("test:{\"keywords\": \"data scientist\"}", [_make_job("a"), _make_job("b")])
+    jobs, age = job_cache.get_query("test:{\"keywords\": \"data scientist\"}")
+    assert sorted(j.id for j in jobs) == ["a", "b"]
+    assert age < 5
+    assert b"data scientist" not in job_cache.db_path.read_bytes()
+
+
+def test_read_through_miss_then_hit(job_cache):
+    cache = ReadThroughCache(job_cache)
+    connector = _CountingConnector("python")
+
+    first = cache.wrap(connector).fetch_jobs()
+    second = cache.wrap(connector).fetch_jobs()
+
+    assert connector.calls == 1
+    assert [j.id for j in first] == [j.id for j in second]
+    assert cache.stats.misses == 1 and cache.stats.hits == 1
+
+
+def test_read_through_keys_on_query_params(job_cache):
+    cache = ReadThroughCache(job_cache)
+    cache.wrap(_CountingConnector("python")).fetch_jobs()
+    cache.wrap(_CountingConnector("golang")).fetch_jobs()
+    assert cache.stats.misses == 2
+
+
+def test_read_through_serves_stale_and_revalidates(job_cache):
+    cache = ReadThroughCache(job_cache)
+    connector = _CountingConnector("python")
+    cache.wrap(connector).fetch_jobs()
+    job_cache.ttl = 0
+    time.sleep(0.01)
+
+    stale = cache.wrap(connector).fetch_jobs()
+    cache.shutdown(wait=True)
+
+    assert [j.id for j in stale] == ["test-python-1"]
+    assert cache.stats.stale_hits == 1
+    assert cache.stats.refreshes == 1
+    assert [j.id for j in job_cache.get_query(connector.cache_key())[0]] == ["test-python-2"]
+
+
+def test_read_through_does_not_store_empty_results(job_cache):
+    cache = ReadThroughCache(job_cache)
+    connector = _BoardsConnector(["a", "b"])
+    connector.down = {"a", "b"}
+    assert cache.wrap(connector).fetch_jobs() == []
+
+    connector.down = set()
+    assert len(cache.wrap(connector).fetch_jobs()) == 2
+    assert connector.calls == 2 and cache.stats.misses == 2
+
+
+def test_read_through_stores_partial_results_briefly(job_cache, monkeypatch):
+    monkeypatch.setattr("src.sources.cached.PARTIAL_TTL_SECONDS", 0)
+    cache = ReadThroughCache(job_cache)
+    connector = _BoardsConnector(["a", "b"])
+    connector.down = {"b"}
+    assert [j.id for j in cache.wrap(connector).fetch_jobs()] == ["boards-a"]
+    assert cache.stats.partial_fetches == 1
+
+    connector.down = set()
+    stale = cache.wrap(connector).fetch_jobs()
+    cache.shutdown(wait=True)
+
+    assert [j.id for j in stale] == ["boards-a"]
+    assert cache.stats.stale_hits == 1 and cache.stats.refreshes == 1
+    assert sorted(j.id for j in job_cache.get_query(connector.cache_key())[0]) == ["boards-a", "boards-b"]
+
+
+def test_clear_expired_drops_old_jobs_and_their_vectors(job_cache):
+    job_cache.store_query("k", [_make_job("a")])
+    job_cache.store_vectors({"a": ("h", ("text", "v1", b"", b""))})
+    assert job_cache.clear_expired() == 0
+    job_cache.ttl = job_cache.stale_ttl = 0
+    time.sleep(0.01)
+
+    assert job_cache.clear_expired() == 1
+    assert list(job_cache.iter_jobs()) == [] and job_cache.get_vectors({"a": "h"}) == {}
+    assert job_cache.get_query("k") is None
+
+
+def test_cache_recovers_after_file_deleted(job_cache):
+    job_cache.store_query("k", [_make_job("a")])
+    job_cache.db_path.unlink()
+    assert job_cache.get_query("k") is None
+    job_cache.store_query("k", [_make_job("b")])
+    assert [j.id for j in job_cache.get_query("k")[0]] == ["b"]
+
+
+def test_watermark_known_and_advance():
+    now = datetime.now(timezone.utc)
+    old = Job(id="reed-10", title="", company="", description="", url="", source="reed", published_at=now - timedelta(days=1))
+    new = Job(id="reed-11", title="", company="", description="", url="", source="reed", published_at=now)
+    wm = Watermark().advance([old])
+    assert wm.is_known(old) and not wm.is_known(new)
+    assert Watermark.from_dict(wm.advance([new]).to_dict()).max_id == 11
+
+
+def test_watermark_keeps_ids_seen_at_its_timestamp():
+    day = datetime(2026, 2, 3, tzinfo=timezone.utc)
+    seen = Job(id="arbeitnow-a", title="", company="", description="", url="", source="arbeitnow", published_at=day)
+    same_day = Job(id="arbeitnow-b", title="", company="", description="", url="", source="arbeitnow", published_at=day)
+    wm = Watermark.from_dict(Watermark().advance([seen]).to_dict())
+    assert wm.is_known(seen) and not wm.is_known(same_day)
+    assert wm.advance([same_day]).boundary_ids == {"arbeitnow-a", "arbeitnow-b"}
+
+
+def test_incremental_refresh_merges_new_postings(job_cache):
+    cache = ReadThroughCache(job_cache)
+    connector = _FeedConnector()
+    cache.wrap(connector).fetch_jobs()
+    assert job_cache.get_watermark(connector.cache_key()).max_id == 1
+
+    connector.feed.append(_make_job("feed-2"))
+    job_cache.ttl = 0
+    time.sleep(0.01)
+    cache.wrap(connector).fetch_jobs()
+    cache.shutdown(wait=True)
+
+    assert connector.fetched == [["feed-1"], ["feed-2"]]
+    assert cache.stats.incremental_refreshes == 1
+    assert sorted(j.id for j in job_cache.get_query(connector.cache_key())[0]) == ["feed-1", "feed-2"]
+    assert job_cache.get_watermark(connector.cache_key()).max_id == 2
+
+
+def test_partial_incremental_refresh_keeps_old_watermark(job_cache):
+    cache = ReadThroughCache(job_cache)
+    connector = _FeedConnector()
+    cache.wrap(connector).fetch_jobs()
+
+    connector.feed.append(_make_job("feed-2"))
+    connector.partial = True
+    job_cache.ttl = 0
+    time.sleep(0.01)
+    cache.wrap(connector).fetch_jobs()
+    cache.shutdown(wait=True)
+
+    assert cache.stats.partial_fetches == 1
+    assert sorted(j.id for j in job_cache.get_query(connector.cache_key())[0]) == ["feed-1", "feed-2"]
+    assert job_cache.get_watermark(connector.cache_key()).max_id == 1
+
+
+def test_dedup_index_marks_new_changed_unchanged(tmp_path):
+    from dataclasses import replace
+
+    from src.storage.dedup_index import CHANGED, NEW, UNCHANGED, DedupIndex
+
+    index = DedupIndex(tmp_path / "cache.db")
+    first = [_make_job("a", "Engineer"), _make_job("b", "Designer")]
+    assert index.merge(first).status == {"a": NEW, "b": NEW}
+
+    edited = replace(first[1], description="Design things")
+    second = index.merge([first[0], edited, _make_job("c", "Analyst")])
+    assert second.status == {"a": UNCHANGED, "b": CHANGED, "c": NEW}
+    assert second.new == {"c"}
+    assert len(index) == 3
+
+    # A repost under a new id is the same posting.
+    assert index.merge([_make_job("a2", "Engineer")]).status == {"a2": UNCHANGED}
+
+
+def test_dedup_index_recovers_after_file_deleted(tmp_path):
+    from src.storage.dedup_index import NEW, DedupIndex
+
+    index = DedupIndex(tmp_path / "cache.db")
+    index.merge([_make_job("a")])
+    (tmp_path / "cache.db").unlink()
+    assert index.merge([_make_job("a")]).status == {"a": NEW}
+
+
+def test_dedup_index_prune_forgets_unseen_postings(tmp_path):
+    from src.storage.dedup_index import NEW, DedupIndex
+
+    index = DedupIndex(tmp_path / "cache.db")
+    index.merge([_make_job("a", "Engineer")])
+    assert index.prune(max_age=60) == 0
+    time.sleep(0.01)
+    assert index.prune(max_age=0) == 1
+    assert len(index) == 0 and index.merge([_make_job("a", "Engineer")]).status == {"a": NEW}
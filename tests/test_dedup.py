@@ -45,3 +45,75 @@ def test_dedup_case_insensitive():
 
 def test_dedup_empty():
     assert deduplicate([]) == []
+
+
+_STRIPE_DESC = (
+    "Stripe is looking for a backend engineer to build payment infrastructure used by millions "
+    "of businesses. You will design APIs, own services end to end and work with product teams. "
+    "We care about reliability, so you will write well tested code, review designs with peers, "
+    "take part in an on call rotation and help us scale systems that move money around the world "
+    "for startups and large enterprises alike. Experience with Ruby, Java or Go is a plus."
+)
+
+
+def test_near_duplicates_across_sources():
+    jobs = [
+        _make_job("Backend Engineer", "Stripe", "adzuna", _STRIPE_DESC[:400] + "..."),
+        _make_job("Backend Engineer - Payments", "Stripe, Inc.", "greenhouse", _STRIPE_DESC + " Apply today."),
+        _make_job("Frontend Engineer", "Stripe", "reed", "Build dashboards in React for our merchants."),
+    ]
+    assert len(deduplicate(jobs)) == 3
+
+    result = deduplicate(jobs, near_duplicate_threshold=0.8)
+    assert sorted(j.source for j in result) == ["adzuna", "reed"]
+
+
+def test_near_duplicate_guard_keeps_different_titles():
+    jobs = [
+        _make_job("Senior Data Scientist", "Acme", "reed", _STRIPE_DESC),
+        _make_job("Junior Data Scientist", "Acme", "adzuna", _STRIPE_DESC),
+    ]
+    assert len(deduplicate(jobs, near_duplicate_threshold=0.8)) == 2
+
+
+def test_streaming_near_duplicates_prefer_richer_job():
+    from src.matching.dedup import StreamingDeduplicator
+
+    dedup = StreamingDeduplicator(near_duplicate_threshold=0.8)
+    first = _make_job("Backend Engineer", "Stripe", "adzuna", _STRIPE_DESC)
+    richer = _make_job("Backend Engineer", "Stripe Inc", "greenhouse", _STRIPE_DESC)
+    richer.salary_min = 90000
+
+    assert dedup.add([first]) == [first]
+    assert dedup.add([richer]) == [richer]
+    assert dedup.jobs() == [richer]
+    assert dedup.group_key(richer) == dedup.group_key(first)
+
+
+def test_canonical_key_matches_across_sources():
+    from src.utils.canonical import canonical_company, canonical_title
+
+    assert canonical_company("Stripe, Inc.") == canonical_company("stripe") == canonical_company("STRIPE Ltd")
+    assert canonical_company("Open-AI") == canonical_company("OpenAI")
+    assert canonical_company("Procter & Gamble") == canonical_company("Procter and Gamble Co.")
+    assert canonical_company("Société Générale") == canonical_company("Societe Generale SA")
+    assert canonical_title("Sr. Backend Engineer (m/w/d)") == canonical_title("Senior Backend Engineer")
+    assert canonical_title("Senior Data Scientist") != canonical_title("Junior Data Scientist")
+    assert canonical_title("Engineer, Senior Backend") != canonical_title("Backend Senior Engineer")
+
+
+def test_canonical_key_keeps_work_modes_apart():
+    from src.utils.canonical import canonical_key
+
+    assert canonical_key("Acme", "Backend Engineer (Remote)", "remote") == canonical_key("Acme", "Backend Engineer", "remote")
+    assert canonical_key("Acme", "Backend Engineer", "remote") != canonical_key("Acme", "Backend Engineer", "onsite")
+
+
+def test_dedup_uses_canonical_key():
+    jobs = [
+        _make_job("Sr. Software Engineer", "Hashicorp", "greenhouse:hashicorp"),
+        _make_job("Senior Software Engineer", "HashiCorp, Inc.", "adzuna"),
+    ]
+    result = deduplicate(jobs)
+    assert len(result) == 1
+    assert result[0].dedup_key is jobs[1].dedup_key
@@ -54,3 +54,233 @@ def test_cleanup():
     register_personal_fragments(["a very long fragment that should be tracked carefully"])
     register_personal_fragments([])  # Clear
     _check_payload("a very long fragment that should be tracked carefully", "test")
+
+
+def test_async_client_blocks_cv_fragment_in_params():
+    import asyncio
+
+    import httpx
+
+    from src.utils.http_client import AsyncSafeHttpClient
+
+    register_personal_fragments([
+        "Experienced Python developer specializing in machine learning",
+    ])
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+    async def run():
+        async with AsyncSafeHttpClient(transport=transport) as client:
+            await client.get(
+                "https://api.example.com",
+                params={"q": "experienced python developer specializing in machine learning"},
+            )
+
+    with pytest.raises(PrivacyViolationError):
+        asyncio.run(run())
+    register_personal_fragments([])
+
+
+def test_registry_clients_are_reused_across_connectors():
+    import httpx
+
+    from src.utils.http_pool import ClientRegistry
+
+    hosts = []
+    transport = httpx.MockTransport(lambda request: hosts.append(request.url.host) or httpx.Response(200))
+    registry = ClientRegistry(transport=transport)
+
+    with SafeHttpClient(registry=registry) as first:
+        first.get("https://remotive.com/api/remote-jobs")
+    with SafeHttpClient(registry=registry) as second:
+        second.get("https://www.arbeitnow.com/api/job-board-api")
+
+    assert first._client is second._client
+    assert not registry.client().is_closed
+    assert hosts == ["remotive.com", "www.arbeitnow.com"]
+
+    registry.close()
+    assert first._client.is_closed
+
+
+def test_registry_host_limits():
+    from src.utils.http_pool import ClientRegistry
+
+    registry = ClientRegistry(max_per_host=2, host_limits={"api.lever.co": 5})
+    assert registry.host_limit("api.lever.co") == 5
+    assert registry.host_limit("remotive.com") == 2
+    assert registry.host_slot("remotive.com") is registry.host_slot("remotive.com")
+
+
+def test_registry_async_client_per_event_loop():
+    import asyncio
+
+    from src.utils.http_pool import ClientRegistry
+
+    registry = ClientRegistry()
+
+    async def grab():
+        client = registry.async_client()
+        assert registry.async_client() is client
+        await registry.aclose()
+        return client
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    assert first.is_closed
+
+
+def test_conditional_get_serves_304_from_store():
+    import httpx
+
+    from src.utils.http_cache import ValidatorCache
+    from src.utils.http_pool import ClientRegistry
+
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"jobs": [{"id": 1}]}, headers={"ETag": '"v1"'})
+
+    cache = ValidatorCache()
+    registry = ClientRegistry(transport=httpx.MockTransport(handler))
+    with SafeHttpClient(registry=registry, validator_cache=cache) as client:
+        first = client.get("https://boards-api.greenhouse.io/v1/boards/acme/jobs", params={"content": "true"})
+        second = client.get("https://boards-api.greenhouse.io/v1/boards/acme/jobs", params={"content": "true"})
+
+    assert seen_headers == [None, '"v1"']
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert second.extensions.get("not_modified") is True
+    assert cache.revalidated == 1
+
+
+def test_validator_cache_evicts_by_size():
+    import httpx
+
+    from src.utils.http_cache import ValidatorCache
+
+    cache = ValidatorCache(max_entries=10, max_bytes=10)
+    request = httpx.Request("GET", "https://example.com")
+    for i in range(3):
+        cache.resolve(f"k{i}", httpx.Response(200, content=b"abcdef", headers={"ETag": "x"}, request=request))
+    assert len(cache) == 1
+    assert cache.conditional_headers("k2") == {"If-None-Match": "x"}
+    assert cache.conditional_headers("k0") == {}
+
+
+def _retry_client(handler, **kwargs):
+    import httpx
+
+    from src.utils.http_pool import ClientRegistry
+
+    return SafeHttpClient(registry=ClientRegistry(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+def test_retries_429_honouring_retry_after():
+    import httpx
+
+    from src.utils.http_retry import RetryPolicy
+
+    statuses = iter([429, 503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, headers={"Retry-After": "0"} if status == 429 else {})
+
+    client = _retry_client(handler, retry=RetryPolicy(max_retries=3, backoff_base=0.0))
+    assert client.get("https://www.reed.co.uk/api/1.0/search").status_code == 200
+    assert client.retries == 2
+
+
+def test_retry_gives_up_after_max_retries():
+    import httpx
+
+    from src.utils.http_retry import RetryPolicy, get_retry_counts
+
+    before = get_retry_counts().get("api.adzuna.com", 0)
+    client = _retry_client(lambda request: httpx.Response(503), retry=RetryPolicy(max_retries=2, backoff_base=0.0))
+    assert client.get("https://api.adzuna.com/v1/api/jobs/gb/search/1").status_code == 503
+    assert get_retry_counts()["api.adzuna.com"] - before == 2
+
+
+def test_retries_transport_errors_but_not_404():
+    import httpx
+
+    from src.utils.http_retry import RetryPolicy
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            raise httpx.ConnectError("reset", request=request)
+        return httpx.Response(404)
+
+    client = _retry_client(handler, retry=RetryPolicy(max_retries=3, backoff_base=0.0))
+    assert client.get("https://api.lever.co/v0/postings/acme").status_code == 404
+    assert len(calls) == 2
+
+
+def test_token_bucket_paces_after_burst():
+    from src.utils.http_retry import TokenBucket
+
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+
+def test_record_then_replay_without_network(tmp_path):
+    import httpx
+
+    from src.utils.http_fixtures import HttpArchive, RecordingTransport, replay_registry
+    from src.utils.http_pool import ClientRegistry
+
+    def network(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"jobs": [{"id": 1}]}, headers={"etag": '"v1"'})
+
+    archive = HttpArchive(tmp_path / "http.json")
+    recorder = RecordingTransport(archive, transport=httpx.MockTransport(network))
+    with SafeHttpClient(registry=ClientRegistry(transport=recorder)) as client:
+        client.get("https://api.adzuna.com/v1/search", params={"what": "data", "app_key": "secret"})
+    path = archive.save()
+    assert b"secret" not in path.read_bytes()
+
+    replayed = HttpArchive.load(path)
+    with SafeHttpClient(registry=replay_registry(replayed)) as client:
+        resp = client.get("https://api.adzuna.com/v1/search", params={"app_key": "other", "what": "data"})
+        missing = client.get("https://api.adzuna.com/v1/other")
+        not_modified = client.get("https://api.adzuna.com/v1/search?what=data", headers={"if-none-match": '"v1"'})
+
+    assert resp.json() == {"jobs": [{"id": 1}]}
+    assert missing.status_code == 404 and replayed.misses == 1
+    assert not_modified.status_code == 304
+
+
+def test_aho_corasick_finds_any_pattern():
+    from src.utils.aho_corasick import AhoCorasick
+
+    matcher = AhoCorasick(["he", "she", "hers", "his"])
+    assert matcher.find("ushers") == "she"
+    assert matcher.find("ahishe") == "his"
+    assert matcher.find("xyz") is None
+    assert not AhoCorasick([])
+
+
+def test_request_verdicts_cached_until_fragments_change():
+    from src.utils import http_client
+
+    register_personal_fragments(["machine learning pipelines at scale"])
+    http_client._check_request("https://example.com/jobs", {"b": "2", "a": "1"})
+    http_client._check_request("https://example.com/jobs", [("a", "1"), ("b", "2")])
+    assert len(http_client._CLEARED) == 1
+
+    with pytest.raises(PrivacyViolationError):
+        http_client._check_request("https://example.com/jobs", {"q": "Machine Learning Pipelines at Scale"})
+
+    register_personal_fragments(["example.com/jobs and more"])
+    assert len(http_client._CLEARED) == 0
+    register_personal_fragments([])
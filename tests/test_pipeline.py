@@ -0,0 +1,105 @@
+import time
+
+from src.matching.pipeline import MatchPipeline, run_pipeline
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+from src.sources.base import BaseConnector
+
+
+def _make_job(job_id: str, title: str, company: str = "TestCo", desc: str = "", **kwargs) -> Job:
+    return Job(
+        id=job_id,
+        title=title,
+        company=company,
+        description=desc,
+        url="https://example.com",
+        source="test",
+        **kwargs,
+    )
+
+
+class _PagedConnector(BaseConnector):
+    def __init__(self, name: str, pages: list[list[Job]], delay: float = 0.0, error: str = ""):
+        self.name = name
+        self.pages = pages
+        self.delay = delay
+        self.error = error
+
+    def iter_jobs(self):
+        for page in self.pages:
+            time.sleep(self.delay)
+            yield page
+        if self.error:
+            raise RuntimeError(self.error)
+
+
+PROFILE = Profile(raw_text="Python developer building data pipelines", skills=["python"])
+
+
+def test_pipeline_push_dedups_across_batches():
+    pipeline = MatchPipeline(PROFILE, Preferences())
+    pipeline.push([_make_job("a-1", "Python Developer")])
+    replaced = pipeline.push([_make_job("b-1", "Python Developer", desc="Python data pipelines")])
+
+    assert [row[0].id for row in replaced] == ["b-1"]
+    assert [row[0].id for row in pipeline.results()] == ["b-1"]
+    assert pipeline.fetched == 2
+
+
+def test_pipeline_applies_hard_filters():
+    pipeline = MatchPipeline(PROFILE, Preferences(remote_types=["remote"]))
+    pipeline.push([
+        _make_job("1", "Python Developer", remote_type="remote"),
+        _make_job("2", "Python Engineer", remote_type="onsite"),
+    ])
+    assert [row[0].id for row in pipeline.results()] == ["1"]
+    assert len(pipeline.jobs()) == 2
+
+
+def test_pipeline_without_scoring_only_dedups_and_counts(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("score_jobs called")
+
+    monkeypatch.setattr("src.matching.pipeline.score_jobs", fail)
+    pipeline = MatchPipeline(PROFILE, Preferences(remote_types=["remote"]), score=False)
+    scored = pipeline.push([
+        _make_job("1", "Python Developer", remote_type="remote"),
+        _make_job("2", "Python Engineer", remote_type="onsite"),
+        _make_job("3", "Python Developer", remote_type="remote"),
+    ])
+
+    assert scored == []
+    assert pipeline.matched == 1 and len(pipeline.jobs()) == 2 and pipeline.fetched == 3
+
+
+def test_run_pipeline_streams_fast_source_first():
+    fast = _PagedConnector("fast", [[_make_job("f-1", "Python Developer")]])
+    slow = _PagedConnector(
+        "slow",
+        [[_make_job("s-1", "Data Engineer")], [_make_job("s-2", "Backend Engineer")]],
+        delay=0.2,
+        error="page 3 failed",
+    )
+    pipeline = MatchPipeline(PROFILE, Preferences())
+
+    updates = list(run_pipeline(pipeline, [slow, fast]))
+    page_sources = [u.source for u in updates if u.jobs]
+
+    assert page_sources[0] == "fast"
+    assert [u.error for u in updates if u.error] == ["page 3 failed"]
+    assert len(pipeline.finalize()) == 3
+
+
+def test_run_pipeline_abandons_connector_past_its_timeout():
+    slow = _PagedConnector("slow", [[_make_job("s-1", "Data Engineer")]], delay=1.0)
+    fast = _PagedConnector("fast", [[_make_job("f-1", "Python Developer")]])
+    pipeline = MatchPipeline(PROFILE, Preferences())
+
+    started = time.monotonic()
+    updates = list(run_pipeline(pipeline, [slow, fast], max_workers=1, connector_timeout=0.2))
+
+    assert time.monotonic() - started < 0.9
+    assert [(u.source, u.error) for u in updates if u.error] == [("slow", "timed out after 0s")]
+    assert [u.source for u in updates if u.jobs] == ["fast"]
+    assert sum(u.done for u in updates) == 2
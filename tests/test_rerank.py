@@ -0,0 +1,87 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.matching.filters import apply_hard_filters
+from src.matching.rerank import ScoreMatrix
+from src.matching.scorer import score_jobs
+from src.matching.text_model import TextModel, job_text
+from src.models.job import Job
+from src.models.preferences import Preferences
+from src.models.profile import Profile
+
+NOW = datetime.now(timezone.utc)
+
+
+def _jobs() -> list[Job]:
+    specs = [
+        ("Python Engineer", "Python and SQL for a fintech platform", "remote", "London", 1),
+        ("Data Scientist", "Machine learning with Python", "hybrid", "Berlin", 5),
+        ("Frontend Developer", "React and TypeScript", "onsite", "London", 20),
+        ("Go Engineer", "Go microservices and Kubernetes", "remote", "", 2),
+        ("Sales Manager", "Enterprise sales in fintech", "onsite", "Paris", 40),
+    ]
+    return [
+        Job(id=f"t-{i}", title=title, company="Acme", description=desc, url="", source="test",
+            remote_type=remote, location=location, tags=[], published_at=NOW - timedelta(days=age))
+        for i, (title, desc, remote, location, age) in enumerate(specs)
+    ]
+
+
+PROFILE = Profile(raw_text="Python engineer with SQL and machine learning", skills=["python", "sql", "go"])
+
+
+def test_matches_score_jobs_and_recomputes_only_stale_columns():
+    jobs = _jobs()
+    model = TextModel.fit([job_text(j) for j in jobs])
+    prefs = Preferences(remote_types=["remote", "hybrid"], target_titles=["Engineer"])
+
+    matrix = ScoreMatrix(jobs, text_model=model)
+    assert matrix.update(PROFILE, prefs) == {"filters", "text_similarity", "skill_overlap", "preference_fit", "recency"}
+    expected = score_jobs(apply_hard_filters(jobs, prefs), PROFILE, prefs, text_model=model)
+    ranked = matrix.ranked()
+    assert [row[0].id for row in ranked] == [row[0].id for row in expected]
+    for a, b in zip(ranked, expected):
+        assert a[1] == pytest.approx(b[1])
+        assert a[2] == pytest.approx(b[2])
+
+    assert matrix.update(PROFILE, prefs) == set()
+    assert matrix.update(PROFILE, Preferences(remote_types=["remote", "hybrid"], industries=["fintech"])) == {
+        "preference_fit"
+    }
+    assert matrix.update(PROFILE, Preferences(industries=["fintech"])) == {"filters", "preference_fit"}
+    assert len(matrix.ranked()) == len(jobs)
+    other = Profile(raw_text=PROFILE.raw_text, skills=["react"])
+    assert matrix.update(other, Preferences(industries=["fintech"])) == {"skill_overlap"}
+
+
+def test_weights_and_replace():
+    jobs = _jobs()
+    matrix = ScoreMatrix(jobs)
+    matrix.update(PROFILE, Preferences())
+    recency_only = {"text_similarity": 0.0, "skill_overlap": 0.0, "preference_fit": 0.0, "recency": 1.0}
+    assert matrix.ranked(recency_only, top_k=1)[0][0].id == "t-0"
+
+    full = replace(jobs[2], description="React, TypeScript, Python, SQL and Go")
+    matrix.replace({full.id: full})
+    row = next(r for r in matrix.ranked() if r[0].id == full.id)
+    assert row[0] is full
+    assert row[2]["skill_overlap"] == 1.0
+
+
+def test_seed_reuses_pipeline_rows_and_scores_the_rest_on_demand():
+    jobs = _jobs()
+    model = TextModel.fit([job_text(j) for j in jobs])
+    prefs = Preferences(remote_types=["remote"])
+    reference = ScoreMatrix(jobs, text_model=model)
+    reference.update(PROFILE, Preferences())
+
+    matrix = ScoreMatrix(jobs, text_model=model)
+    matrix.seed(score_jobs(apply_hard_filters(jobs, prefs), PROFILE, prefs, text_model=model), PROFILE, prefs)
+    assert matrix.update(PROFILE, prefs) == set()
+    assert [row[0].id for row in matrix.ranked()] == ["t-0", "t-3"]
+
+    assert matrix.update(PROFILE, Preferences()) == {"filters", "preference_fit"}
+    for a, b in zip(matrix.ranked(), reference.ranked()):
+        assert a[0].id == b[0].id and a[1] == pytest.approx(b[1])
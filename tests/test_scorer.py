@@ -1,6 +1,9 @@
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
-from src.matching.scorer import score_jobs
+import pytest
+
+from src.matching.scorer import rescore_jobs, score_jobs
 from src.models.job import Job
 from src.models.profile import Profile
 from src.models.preferences import Preferences
@@ -64,3 +67,135 @@ def test_score_jobs_recency_bonus():
     results = score_jobs([old, recent], profile, prefs)
     # Recent job should score higher (same content, different recency)
     assert results[0][0].title == "Python Dev A"
+
+
+def test_rescore_jobs_updates_only_replaced_rows():
+    profile = Profile(
+        raw_text="Python developer building machine learning pipelines with pandas and spark.",
+        skills=["python", "spark"],
+    )
+    prefs = Preferences()
+    truncated = _make_job("Engineer", "Join our team...")
+    other = _make_job("Analyst", "Python reporting with pandas")
+    scored = score_jobs([truncated, other], profile, prefs)
+    assert scored[0][0] is other
+
+    full = replace(truncated, description="Python machine learning pipelines with spark and pandas")
+    rescored = rescore_jobs(scored, {truncated.id: full}, profile, prefs)
+
+    assert rescored[0][0] is full
+    assert rescored[0][2]["skill_overlap"] == 1.0
+    assert [r for r in rescored if r[0] is other] == [r for r in scored if r[0] is other]
+
+
+def _corpus() -> list[Job]:
+    return [
+        _make_job("Data Scientist", "Python, machine learning and statistics for our data team"),
+        _make_job("Backend Engineer", "Python services, PostgreSQL and Kubernetes"),
+        _make_job("Frontend Engineer", "React and TypeScript user interfaces"),
+        _make_job("Marketing Manager", "SEO, content strategy and campaigns"),
+        _make_job("Sales Lead", "Grow enterprise accounts and pipeline"),
+    ]
+
+
+def test_text_model_scores_independently_of_batch(tmp_path):
+    from src.matching.text_model import TextModel, job_text
+
+    model = TextModel.fit([job_text(j) for j in _corpus()])
+    model.save(tmp_path / "model.npz")
+    loaded = TextModel.load(tmp_path / "model.npz")
+    assert loaded.version == model.version
+
+    profile = Profile(raw_text="Python machine learning engineer", skills=["python"])
+    prefs = Preferences()
+    target = _corpus()[0]
+    alone = score_jobs([target], profile, prefs, text_model=loaded)[0][2]["text_similarity"]
+    batch = score_jobs(_corpus(), profile, prefs, text_model=loaded)
+    in_batch = next(row for row in batch if row[0].id == target.id)[2]["text_similarity"]
+    assert alone > 0
+    assert alone == in_batch
+
+
+def test_load_text_model_fits_from_cache_and_reuses(tmp_path):
+    from src.matching.text_model import load_text_model
+    from src.storage.cache import JobCache
+
+    cache = JobCache(db_path=tmp_path / "cache.db")
+    path = tmp_path / "model.npz"
+    assert load_text_model(cache, path, min_docs=3) is None
+
+    cache.store_jobs(_corpus())
+    model = load_text_model(cache, path, min_docs=3)
+    assert model is not None and model.n_docs == 5
+    assert load_text_model(cache, path, min_docs=3) is model
+    refitted = load_text_model(cache, path, max_age=0, min_docs=3)
+    assert refitted is not model and refitted.version == model.version
+
+
+def test_job_vectors_reused_from_cache(tmp_path, monkeypatch):
+    from src.matching import text_model as tm
+    from src.storage.cache import JobCache
+
+    cache = JobCache(db_path=tmp_path / "cache.db")
+    model = tm.TextModel.fit([tm.job_text(j) for j in _corpus()])
+    jobs = _corpus()
+    cold = model.job_similarities("python machine learning", jobs, cache)
+
+    def no_normalize(job):
+        raise AssertionError("stored text should be reused")
+
+    monkeypatch.setattr(tm, "job_text", no_normalize)
+    assert model.job_similarities("python machine learning", jobs, cache) == cold
+
+    # Edited content is re-vectorized rather than served stale.
+    monkeypatch.undo()
+    edited = replace(jobs[1], description="Sales and marketing")
+    stored = cache.get_vectors({edited.id: edited.content_hash})
+    assert stored == {}
+
+
+def test_columnar_scores_match_per_job_scores():
+    import random
+
+    rng = random.Random(3)
+    now = datetime.now(timezone.utc)
+    words = ["python", "go", "fintech", "engineer", "data", "c++", "node.js", "sales", "london"]
+    jobs = [
+        _make_job(
+            f"{' '.join(rng.choices(words, k=2))} {i}",
+            " ".join(rng.choices(words, k=20)),
+            rng.choices(words, k=2),
+            location=rng.choice(["London", "Berlin", "", "Worldwide"]),
+            remote_type=rng.choice(["remote", "hybrid", "onsite", ""]),
+            published_at=rng.choice([None, now - timedelta(days=rng.random() * 40)]),
+        )
+        for i in range(300)
+    ]
+    profile = Profile(raw_text="Python engineer, fintech data", skills=["python", "go", "c++", "node.js"])
+    prefs = Preferences(target_titles=["Engineer"], remote_types=["hybrid"], locations=["london"],
+                        industries=["fintech"])
+
+    scalar = score_jobs(jobs, profile, prefs, columnar=False)
+    columnar = score_jobs(jobs, profile, prefs, columnar=True)
+    assert [row[0].id for row in columnar] == [row[0].id for row in scalar]
+    for a, b in zip(scalar, columnar):
+        assert b[1] == pytest.approx(a[1])
+        assert b[2] == pytest.approx(a[2])
+
+
+def test_top_k_matches_full_ranking():
+    import numpy as np
+
+    from src.matching.columnar import top_indices
+
+    values = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5, 0.3])
+    full = np.argsort(-values, kind="stable")
+    for k in range(len(values) + 2):
+        assert top_indices(values, k).tolist() == full[:k].tolist()
+
+    profile = Profile(raw_text="Python developer", skills=["python", "sql"])
+    jobs = [_make_job(f"Job {i}", "python" if i % 3 else "sql and python", []) for i in range(30)]
+    for columnar in (False, True):
+        full = score_jobs(jobs, profile, Preferences(), columnar=columnar)
+        top = score_jobs(jobs, profile, Preferences(), columnar=columnar, top_k=5)
+        assert [row[0].id for row in top] == [row[0].id for row in full[:5]]
@@ -0,0 +1,22 @@
+from src.matching.skills import SkillMatcher, skill_matcher
+from src.models.job import Job
+
+
+def test_matches_whole_tokens_only():
+    matcher = SkillMatcher(["go", "r", "c", "c++", "c#", "node.js", "ci/cd", "machine learning", ".net"])
+    text = "Good Rust and C++ skills; Node.js, CI/CD pipelines, machine\nlearning on ASP.NET. C# a plus."
+    assert matcher.find(text) == {"c++", "c#", "node.js", "ci/cd", "machine learning", ".net"}
+    assert matcher.find("We use Go and R daily") == {"go", "r"}
+    assert matcher.find("node js, ci cd, machine. learning") == frozenset()
+    assert matcher.find("node. js, ci / cd") == frozenset()
+    assert matcher.find("Our team. Net revenue grew") == frozenset()
+    assert matcher.find("machine \t learning") == {"machine learning"}
+
+
+def test_job_hits_include_tags_and_are_shared():
+    job = Job(id="x-1", title="Go Developer", company="Acme", description="Kubernetes and Postgres",
+              url="", source="x", tags=["Docker"])
+    matcher = skill_matcher(frozenset({"go", "docker", "kubernetes", "python"}))
+    assert matcher.job_hits(job) == {"go", "docker", "kubernetes"}
+    assert skill_matcher(frozenset({"python", "kubernetes", "docker", "go"})) is matcher
+    assert matcher.job_hits(job) is matcher.job_hits(job)
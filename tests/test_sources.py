@@ -1,11 +1,10 @@
 from unittest.mock import patch, MagicMock
-import json
 
 from src.sources.remotive import RemotiveConnector
 from src.sources.arbeitnow import ArbeitnowConnector
 from src.sources.greenhouse import GreenhouseConnector
-from src.sources.normalizer import deduplicate_jobs
 from src.models.job import Job
+from src.utils.http_pool import ClientRegistry
 
 
 MOCK_REMOTIVE_RESPONSE = {
@@ -115,3 +114,316 @@ def test_greenhouse_fetch(mock_client_cls):
     assert jobs[0].title == "Data Scientist"
     assert jobs[0].location == "London"
     assert "greenhouse" in jobs[0].source
+
+
+class _StubConnector:
+    def __init__(self, name: str, jobs: list[Job] | None = None, delay: float = 0.0, error: str = ""):
+        self.name = name
+        self._jobs = jobs or []
+        self._delay = delay
+        self._error = error
+
+    def fetch_jobs(self) -> list[Job]:
+        import time
+        time.sleep(self._delay)
+        if self._error:
+            raise RuntimeError(self._error)
+        return self._jobs
+
+
+def _stub_job(job_id: str) -> Job:
+    return Job(id=job_id, title="Engineer", company="TestCo", description="", url="", source="stub")
+
+
+def test_fetch_concurrent_collects_jobs_and_errors():
+    from src.sources.normalizer import fetch_all_jobs_concurrent
+
+    result = fetch_all_jobs_concurrent([
+        _StubConnector("a", [_stub_job("a-1")]),
+        _StubConnector("b", error="boom"),
+        _StubConnector("a", [_stub_job("a-2")]),
+    ])
+
+    assert sorted(j.id for j in result.jobs) == ["a-1", "a-2"]
+    assert result.errors == {"b": "boom"}
+
+
+def test_fetch_concurrent_returns_partial_results_on_timeout():
+    from src.sources.normalizer import fetch_all_jobs_concurrent
+
+    result = fetch_all_jobs_concurrent(
+        [_StubConnector("fast", [_stub_job("fast-1")]), _StubConnector("slow", [_stub_job("slow-1")], delay=2.0)],
+        connector_timeout=0.3,
+        total_timeout=5.0,
+    )
+
+    assert [j.id for j in result.jobs] == ["fast-1"]
+    assert result.timed_out == ["slow"]
+
+
+def test_greenhouse_afetch_multiplexes_boards():
+    import asyncio
+
+    import httpx
+
+    from src.utils.http_client import AsyncSafeHttpClient
+
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if "missing" in request.url.path:
+            return httpx.Response(404)
+        if "broken" in request.url.path:
+            return httpx.Response(400)
+        return httpx.Response(200, json=MOCK_GREENHOUSE_RESPONSE)
+
+    def client_factory(**kwargs):
+        return AsyncSafeHttpClient(transport=httpx.MockTransport(handler))
+
+    connector = GreenhouseConnector(slugs=["testco", "missing", "otherco", "broken"])
+    key = connector.cache_key()
+    with patch("src.sources.greenhouse.AsyncSafeHttpClient", side_effect=client_factory):
+        jobs = asyncio.run(connector.afetch_jobs())
+
+    assert len(requested) == 4
+    assert sorted(j.source for j in jobs) == ["greenhouse:otherco", "greenhouse:testco"]
+    # A missing board is not a failure; an erroring one is, and it stays out of the cache key.
+    assert connector.failed_pages == 1 and connector.cache_key() == key
+
+
+def _greenhouse_two_phase_handler(requested: list[str]):
+    import httpx
+
+    # Shaped like the real list endpoint: location.name only, no offices/departments.
+    listing = {
+        "jobs": [
+            {"id": 1, "title": "Data Scientist", "location": {"name": "London, UK"}},
+            {"id": 2, "title": "Data Scientist", "location": {"name": "New York, US"}},
+            {"id": 3, "title": "Data Engineer", "location": {"name": "London, UK"}},
+        ]
+    }
+    # The detail endpoint adds content and offices; job 3's offices rule it out.
+    offices = {1: "London, UK", 2: "New York, US", 3: "New York, US"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.path.endswith("/jobs"):
+            return httpx.Response(200, json=listing)
+        job_id = int(request.url.path.rsplit("/", 1)[-1])
+        item = dict(
+            listing["jobs"][job_id - 1],
+            content="&lt;p&gt;ML role&lt;/p&gt;",
+            offices=[{"name": offices[job_id]}],
+        )
+        return httpx.Response(200, json=item)
+
+    return handler
+
+
+def test_greenhouse_two_phase_fetches_details_for_survivors_only():
+    import asyncio
+
+    import httpx
+
+    from src.models.preferences import Preferences
+    from src.utils.http_client import AsyncSafeHttpClient, SafeHttpClient
+
+    prefs = Preferences(locations=["London"], country="UK")
+    connector = GreenhouseConnector(slugs=["testco"], prefs=prefs)
+
+    requested: list[str] = []
+    handler = _greenhouse_two_phase_handler(requested)
+    with patch(
+        "src.sources.greenhouse.SafeHttpClient",
+        side_effect=lambda **kw: SafeHttpClient(registry=ClientRegistry(transport=httpx.MockTransport(handler))),
+    ):
+        jobs = connector.fetch_jobs()
+
+    assert requested[0] == "https://boards-api.greenhouse.io/v1/boards/testco/jobs"
+    assert sorted(requested[1:]) == [
+        "https://boards-api.greenhouse.io/v1/boards/testco/jobs/1",
+        "https://boards-api.greenhouse.io/v1/boards/testco/jobs/3",
+    ]
+    assert [j.id for j in jobs] == ["greenhouse-testco-1"]
+    assert jobs[0].description == "ML role"
+
+    requested.clear()
+    with patch(
+        "src.sources.greenhouse.AsyncSafeHttpClient",
+        side_effect=lambda **kw: AsyncSafeHttpClient(transport=httpx.MockTransport(handler)),
+    ):
+        jobs = asyncio.run(connector.afetch_jobs())
+    assert len(requested) == 3
+    assert [j.id for j in jobs] == ["greenhouse-testco-1"] and jobs[0].description == "ML role"
+
+
+def test_greenhouse_detail_budget_is_shared_across_boards(monkeypatch):
+    import httpx
+
+    from src.models.preferences import Preferences
+    from src.utils.http_client import SafeHttpClient
+
+    monkeypatch.setattr("src.sources.greenhouse.MAX_DETAIL_FETCHES", 2)
+    connector = GreenhouseConnector(slugs=["one", "two"], prefs=Preferences(locations=["London"], country="UK"))
+    requested: list[str] = []
+    handler = _greenhouse_two_phase_handler(requested)
+    with patch(
+        "src.sources.greenhouse.SafeHttpClient",
+        side_effect=lambda **kw: SafeHttpClient(registry=ClientRegistry(transport=httpx.MockTransport(handler))),
+    ):
+        jobs = connector.fetch_jobs()
+
+    # Board "one" uses the whole budget; board "two" falls back to a content=true board fetch.
+    assert sum("/jobs/" in url for url in requested) == 2
+    assert sum("content=true" in url for url in requested) == 1
+    assert "greenhouse-one-1" in {j.id for j in jobs}
+
+
+def test_abandoned_greenhouse_fetch_still_fills_the_cache(tmp_path):
+    import time
+
+    import httpx
+
+    from src.matching.pipeline import stream_pages
+    from src.sources.cached import ReadThroughCache
+    from src.storage.cache import JobCache
+    from src.utils.http_client import SafeHttpClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.2)
+        return httpx.Response(200, json=MOCK_GREENHOUSE_RESPONSE)
+
+    job_cache = JobCache(db_path=tmp_path / "cache.db")
+    connector = ReadThroughCache(job_cache).wrap(GreenhouseConnector(slugs=["a", "b", "c"]))
+    with patch(
+        "src.sources.greenhouse.SafeHttpClient",
+        side_effect=lambda **kw: SafeHttpClient(registry=ClientRegistry(transport=httpx.MockTransport(handler))),
+    ):
+        updates = list(stream_pages([connector], connector_timeout=0.3))
+        assert [u.error for u in updates if u.error] == ["timed out after 0s"]
+        deadline = time.monotonic() + 5
+        while job_cache.get_query(connector.cache_key()) is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    jobs, _ = job_cache.get_query(connector.cache_key())
+    assert sorted(j.source for j in jobs) == ["greenhouse:a", "greenhouse:b", "greenhouse:c"]
+
+
+def test_greenhouse_cache_key_tracks_hard_filters_only():
+    from src.models.preferences import Preferences
+
+    plain = GreenhouseConnector(slugs=["testco"])
+    assert GreenhouseConnector(slugs=["testco"], prefs=Preferences(target_titles=["x"])).cache_key() == plain.cache_key()
+    assert GreenhouseConnector(slugs=["testco"], prefs=Preferences(country="UK")).cache_key() != plain.cache_key()
+
+
+def test_afetch_all_jobs_falls_back_to_threads():
+    import asyncio
+
+    from src.sources.base import BaseConnector
+    from src.sources.normalizer import afetch_all_jobs
+
+    class SyncOnly(BaseConnector):
+        name = "sync-only"
+
+        def iter_jobs(self):
+            yield [_stub_job("sync-1")]
+            yield [_stub_job("sync-2")]
+
+    result = asyncio.run(afetch_all_jobs([SyncOnly()]))
+    assert [j.id for j in result.jobs] == ["sync-1", "sync-2"]
+    assert result.errors == {}
+
+
+def _adzuna_page(start: int, count: int, size: int = 50) -> dict:
+    return {
+        "count": count,
+        "results": [{"id": start + i, "title": "Engineer", "company": {"display_name": "TestCo"}} for i in range(size)],
+    }
+
+
+@patch("src.sources.adzuna.SafeHttpClient")
+def test_adzuna_fetches_remaining_pages_from_count(mock_client_cls, monkeypatch):
+    from src.sources.adzuna import AdzunaConnector
+
+    monkeypatch.setenv("ADZUNA_APP_ID", "id")
+    monkeypatch.setenv("ADZUNA_APP_KEY", "key")
+    urls = []
+
+    def get(url, params=None, **kwargs):
+        urls.append(url)
+        page = int(url.rsplit("/", 1)[1])
+        return _mock_response(_adzuna_page(page * 100, count=120, size=50 if page < 3 else 20))
+
+    mock_client = MagicMock()
+    mock_client.__enter__ = MagicMock(return_value=mock_client)
+    mock_client.__exit__ = MagicMock(return_value=False)
+    mock_client.get.side_effect = get
+    mock_client_cls.return_value = mock_client
+
+    jobs = AdzunaConnector(keywords="python", max_pages=5).fetch_jobs()
+
+    assert len(jobs) == 120
+    assert sorted(u.rsplit("/", 1)[1] for u in urls) == ["1", "2", "3"]
+
+
+@patch("src.sources.reed.SafeHttpClient")
+def test_reed_respects_page_cap(mock_client_cls, monkeypatch):
+    from src.sources.reed import ReedConnector
+
+    monkeypatch.setenv("REED_API_KEY", "key")
+    skips = []
+
+    def get(url, params=None, **kwargs):
+        skips.append(params["resultsToSkip"])
+        results = [{"jobId": params["resultsToSkip"] + i, "jobTitle": "Engineer"} for i in range(100)]
+        return _mock_response({"totalResults": 1000, "results": results})
+
+    mock_client = MagicMock()
+    mock_client.__enter__ = MagicMock(return_value=mock_client)
+    mock_client.__exit__ = MagicMock(return_value=False)
+    mock_client.get.side_effect = get
+    mock_client_cls.return_value = mock_client
+
+    jobs = ReedConnector(max_pages=3).fetch_jobs()
+
+    assert len(jobs) == 300
+    assert sorted(skips) == [0, 100, 200]
+
+
+def test_reed_parses_day_first_dates_and_skips_watermarks():
+    from datetime import datetime, timezone
+
+    from src.sources.reed import ReedConnector, _parse_item
+
+    job = _parse_item({"jobId": 7, "jobTitle": "Engineer", "date": "03/02/2026"})
+    assert job.published_at == datetime(2026, 2, 3, tzinfo=timezone.utc)
+    assert not ReedConnector.supports_watermark
+
+
+def test_reed_fetch_details_caches_by_job_id(monkeypatch):
+    import httpx
+
+    from src.sources import reed
+    from src.utils.http_client import SafeHttpClient
+
+    monkeypatch.setenv("REED_API_KEY", "test-key")
+    monkeypatch.setattr(reed, "_DETAILS", reed.OrderedDict())
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, json={"jobDescription": "<p>Full description</p>"})
+
+    transport = httpx.MockTransport(handler)
+    job = _stub_job("reed-42")
+    with patch(
+        "src.sources.reed.SafeHttpClient",
+        side_effect=lambda **kw: SafeHttpClient(registry=ClientRegistry(transport=transport)),
+    ):
+        first = reed.ReedConnector().fetch_details([job])
+        second = reed.ReedConnector().fetch_details([job])
+
+    assert requested == ["/api/1.0/jobs/42"]
+    assert first["reed-42"].description == second["reed-42"].description == "Full description"
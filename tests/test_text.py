@@ -0,0 +1,47 @@
+import html
+import random
+import re
+
+from src.utils import text
+from src.utils.text import clean_html, collapse_whitespace, normalize_for_matching
+
+
+def _reference_clean_html(raw: str) -> str:
+    t = re.sub(r"<br\s*/?>", "\n", raw, flags=re.IGNORECASE)
+    t = re.sub(r"<[^>]+>", " ", t)
+    return _reference_collapse(html.unescape(t))
+
+
+def _reference_collapse(t: str) -> str:
+    t = re.sub(r"[ \t]+", " ", t)
+    t = re.sub(r"\n{3,}", "\n\n", t)
+    return t.strip()
+
+
+def _reference_normalize(t: str) -> str:
+    t = _reference_clean_html(t).lower()
+    return _reference_collapse(re.sub(r"[^a-z0-9\s\-\+\#\.]", " ", t))
+
+
+def test_clean_html_basic():
+    assert clean_html("<p>Hello<br/>world &amp; <b>you</b></p>") == "Hello\nworld & you"
+    assert collapse_whitespace("a \t b\n\n\n\nc  ") == "a b\n\nc"
+
+
+def test_matches_reference_on_tag_soup():
+    rng = random.Random(0)
+    alphabet = ["<", ">", "br", "BR", "/", " ", "\t", "\n", "a", "&amp;", "&", "&nbsp;", "&#9;",
+                "!", "é", "<br>", "<br />", "<p>", "&lt;br&gt;", "C#", "c++"]
+    for _ in range(5000):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+        assert text._clean_html(s) == _reference_clean_html(s), s
+        assert text._normalize_for_matching(s) == _reference_normalize(s), s
+
+
+def test_memoizes_long_inputs_by_content():
+    text.clear_memos()
+    doc = "<div>" + "Python and SQL. " * 20 + "</div>"
+    first = normalize_for_matching(doc)
+    assert len(text._CLEANED) == len(text._NORMALIZED) == 1
+    assert normalize_for_matching("".join(list(doc))) is first
+    assert len(text._NORMALIZED) == 1